@@ -128,8 +128,7 @@ def main(cpacs: CPACS) -> None:
     # ag = geometry.geometry_eval(cpacs_path, name)
     # TODO: get CPACS object
     ag = geometry.AircraftGeometry()
-    ag.fuse_geom_eval(cpacs)
-    ag.wing_geom_eval(cpacs)
+    ag.geom_eval(cpacs)
     ag.produce_output_txt()
 
     log.info("------- Center of Gravity coordinates -------")
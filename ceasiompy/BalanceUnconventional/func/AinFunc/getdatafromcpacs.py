@@ -139,6 +139,7 @@ def get_data(ui, bi, mw, ed, cpacs_in):
 
     BC_PATH = TSPEC_PATH + "/balance/userBalance"
     create_branch(tixi, BC_PATH, False)
+    INERTIA_PATH = TSPEC_PATH + "/balance/inertia"
     # Compulsory path checks =================================================
 
     if not tixi.checkElement(TSPEC_PATH):
@@ -228,6 +229,14 @@ def get_data(ui, bi, mw, ed, cpacs_in):
         else:
             bi.USER_CASE = True
 
+    #  Lumped masses inertia discretisation, a smaller spacing gives more nodes
+    if tixi.checkElement(INERTIA_PATH + "/spacingFuselage"):
+        bi.SPACING_FUSE = tixi.getDoubleElement(INERTIA_PATH + "/spacingFuselage")
+    if tixi.checkElement(INERTIA_PATH + "/spacingWing"):
+        bi.SPACING_WING = tixi.getDoubleElement(INERTIA_PATH + "/spacingWing")
+    if tixi.checkElement(INERTIA_PATH + "/wingProfilePoints"):
+        bi.WPP = tixi.getDoubleElement(INERTIA_PATH + "/wingProfilePoints")
+
     if bi.USER_CASE:
         if tixi.checkElement(BC_PATH + "/fuelPercentage"):
             bi.F_PERC = tixi.getDoubleElement(BC_PATH + "/fuelPercentage")
@@ -24,6 +24,14 @@ from cpacspy.cpacsfunctions import open_tigl, open_tixi
 
 
 from ceasiompy import log
+from ceasiompy.utils.WB.geometrycache import get_geometry_hash
+from ceasiompy.utils.WB.lumpednodes import (
+    SYMMETRY_FACTORS,
+    get_cached_nodes,
+    get_lumped_inertia,
+    get_wing_segment_nodes,
+    get_fuselage_segment_nodes,
+)
 
 
 # =============================================================================
@@ -54,78 +62,47 @@ def fuselage_inertia(SPACING, center_of_gravity, mass_seg_i, afg, cpacs_in):
     """
 
     tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
+    seg_list = [
+        (f, int(i)) for f in range(1, afg.fus_nb + 1) for i in afg.f_seg_sec[:, f - 1, 2]
+    ]
 
-    sfx = []
-    sfy = []
-    sfz = []
-    Ixx = 0
-    Iyy = 0
-    Izz = 0
-    Ixy = 0
-    Iyz = 0
-    Ixz = 0
     log.info("-------------------------------------------------------------")
     log.info("---- Evaluating fuselage nodes for lumped masses inertia ----")
     log.info("-------------------------------------------------------------")
-    for f in range(1, afg.fus_nb + 1):
-        for i in afg.f_seg_sec[:, f - 1, 2]:
-            fx = []
-            fy = []
-            fz = []
+
+    def eval_nodes():
+        tigl = open_tigl(tixi)
+        nodes_list = []
+        for f, i in seg_list:
             # Number of subdivisions along the longitudinal axis
-            subd_l = math.ceil(
-                (afg.fuse_seg_length[int(i) - 1][f - 1] / SPACING))
+            subd_l = math.ceil((afg.fuse_seg_length[i - 1][f - 1] / SPACING))
             # Number of subdivisions along the perimeter
-            SUBD_C0 = math.ceil(
-                (afg.fuse_sec_per[int(i) - 1][f - 1] / SPACING))
+            SUBD_C0 = math.ceil((afg.fuse_sec_per[i - 1][f - 1] / SPACING))
             # Number of subdivisions along the radial axis
-            subd_r = math.ceil(
-                ((afg.fuse_sec_width[int(i) - 1][f - 1] / 2) / SPACING))
-            if subd_l == 0:
-                subd_l = 1.0
-            if SUBD_C0 == 0:
-                SUBD_C0 = 1.0
-            if subd_r == 0:
-                subd_r = 1.0
-            eta = 1.0 / (subd_l)
-            zeta = 1.0 / (SUBD_C0)
-            D0 = np.sqrt(np.arange(subd_r * SUBD_C0) / float(subd_r * SUBD_C0))
-            D = np.array([t for t in (D0 - (D0[-1] - 0.98)) if not t < 0])
-            (xc, yc, zc) = afg.fuse_center_section_point[int(i) - 1][f - 1][:]
-            for j in range(int(subd_l) + 1):
-                et = j * eta
-                for k in range(int(SUBD_C0) + 1):
-                    ze = k * zeta
-                    (x0, y0, z0) = tigl.fuselageGetPoint(f, int(i), et, ze)
-                    fx.append(x0)
-                    fy.append(y0)
-                    fz.append(z0)
-                    sfx.append(x0)
-                    sfy.append(y0)
-                    sfz.append(z0)
-                if subd_r > 0.0:
-                    deltar = np.sqrt((y0 - yc) ** 2 + (z0 - zc) ** 2) * D
-                    theta = np.pi * (3 - np.sqrt(5)) * np.arange(len(D))
-                    x = np.zeros(np.shape(deltar)) + x0
-                    y = yc + deltar * np.cos(theta)
-                    z = zc + deltar * np.sin(theta)
-                    fx.extend(x)
-                    fy.extend(y)
-                    fz.extend(z)
-                    sfx.extend(x)
-                    sfy.extend(y)
-                    sfz.extend(z)
-            M = mass_seg_i[int(i) - 1, f - 1] / np.max(np.shape(fx))
-            fcx = fx - (np.zeros((np.shape(fx))) + center_of_gravity[0])
-            fcy = fy - (np.zeros((np.shape(fx))) + center_of_gravity[1])
-            fcz = fz - (np.zeros((np.shape(fx))) + center_of_gravity[2])
-            Ixx += np.sum(M * np.add(fcy**2, fcz**2))
-            Iyy += np.sum(M * np.add(fcx**2, fcz**2))
-            Izz += np.sum(M * np.add(fcx**2, fcy**2))
-            Ixy += np.sum(M * fcx * fcy)
-            Iyz += np.sum(M * fcy * fcz)
-            Ixz += np.sum(M * fcx * fcz)
+            subd_r = math.ceil(((afg.fuse_sec_width[i - 1][f - 1] / 2) / SPACING))
+            nodes_list.append(
+                get_fuselage_segment_nodes(
+                    tigl,
+                    f,
+                    i,
+                    max(subd_l, 1),
+                    max(SUBD_C0, 1),
+                    max(subd_r, 1),
+                    afg.fuse_center_section_point[i - 1][f - 1][:],
+                )
+            )
+        return nodes_list
+
+    nodes_list = get_cached_nodes(
+        (get_geometry_hash(tixi), __name__, "fuselage", SPACING), eval_nodes
+    )
+
+    inertia = np.zeros(6)
+    for (f, i), nodes in zip(seg_list, nodes_list):
+        inertia += get_lumped_inertia(nodes, mass_seg_i[i - 1, f - 1], center_of_gravity)
+
+    (sfx, sfy, sfz) = np.concatenate(nodes_list).T
+    (Ixx, Iyy, Izz, Ixy, Iyz, Ixz) = inertia
 
     return (sfx, sfy, sfz, Ixx, Iyy, Izz, Ixy, Iyz, Ixz)
 
@@ -161,113 +138,53 @@ def wing_inertia(subd_c, SPACING, fuse, center_of_gravity, mass_seg_i, awg, cpac
 
     """
     tixi = open_tixi(cpacs_in)
-    tigl = open_tigl(tixi)
 
     log.info("-------------------------------------------------------------")
     log.info("------ Evaluating wing nodes for lumped masses inertia ------")
     log.info("-------------------------------------------------------------")
 
-    Ixx = 0
-    Iyy = 0
-    Izz = 0
-    Ixy = 0
-    Iyz = 0
-    Ixz = 0
-    swx = []
-    swy = []
-    swz = []
+    # Chordwise step, the k-th node is at k * (k + 1) / 2 steps from the leading edge
+    zeta = 1.0 / sum(range(int(subd_c + 2)))
+    k_list = list(range(int(subd_c) + 1))
+
+    # (wing, column of the segments in the geometry arrays, segment) of each wing segment
+    seg_list = []
     a = 0
     for w in range(1, awg.w_nb + 1):
-        DEN = 0.0
-        for d in range(int(subd_c + 2)):
-            DEN = DEN + d
-        zeta = 1.0 / DEN
         for i in awg.w_seg_sec[:, w - 1, 2]:
             if i == 0.0:
                 break
-            wx = []
-            wy = []
-            wz = []
-            # Number of subdivisions along the longitudinal axis
-            subd_l = math.ceil(
-                (awg.wing_seg_length[int(i) - 1][w + a - 1] / SPACING))
-            if subd_l == 0:
-                subd_l = 1
-            eta = 1.0 / subd_l
-            et = 0.0
-            (xc, yc, zc) = awg.wing_center_seg_point[int(i) - 1][w + a - 1][:]
-            for j in range(int(subd_l) + 1):
-                et = j * eta
-                (xle, yle, zle) = tigl.wingGetLowerPoint(w, int(i), et, 0.0)
-                (xle2, yle2, zle2) = tigl.wingGetLowerPoint(w, int(i), et, 1.0)
-                if xle < xle2:
-                    ZLE = 0.0
-                    ze = 0.0
-                else:
-                    ZLE = 1.0
-                    ze = 1.0
-                wx.extend((xle, xle2))
-                wy.extend((yle, yle2))
-                wz.extend((zle, zle2))
-                swx.extend((xle, xle2))
-                swy.extend((yle, yle2))
-                swz.extend((zle, zle2))
-                for k in range(int(subd_c) + 1):
-                    if ZLE == 0.0:
-                        ze += float(k) * zeta
-                    elif ZLE == 1.0:
-                        ze -= float(k) * zeta
-                    (xl, yl, zl) = tigl.wingGetLowerPoint(w, int(i), et, ze)
-                    (xu, yu, zu) = tigl.wingGetUpperPoint(w, int(i), et, ze)
-                    wx.extend((xl, xu))
-                    wy.extend((yl, yu))
-                    wz.extend((zl, zu))
-                    swx.extend((xl, xu))
-                    swy.extend((yl, yu))
-                    swz.extend((zl, zu))
-            M = mass_seg_i[int(i) - 1, fuse + w + a - 1] / np.max(np.shape(wx))
-            wcx = wx - (np.zeros((np.shape(wx))) + center_of_gravity[0])
-            wcy = wy - (np.zeros((np.shape(wy))) + center_of_gravity[1])
-            wcz = wz - (np.zeros((np.shape(wz))) + center_of_gravity[2])
-            Ixx += np.sum(M * np.add(wcy**2, wcz**2))
-            Iyy += np.sum(M * np.add(wcx**2, wcz**2))
-            Izz += np.sum(M * np.add(wcx**2, wcy**2))
-            Ixy += np.sum(M * wcx * wcy)
-            Iyz += np.sum(M * wcy * wcz)
-            Ixz += np.sum(M * wcx * wcz)
-            if awg.wing_sym[int(w) - 1] != 0:
-                if awg.wing_sym[int(w) - 1] == 1:  # x-y plane
-                    symy = 1 + np.zeros(np.shape(wy))
-                    symx = 1 + np.zeros(np.shape(wx))
-                    symz = -1 + np.zeros(np.shape(wz))
-                elif awg.wing_sym[int(w) - 1] == 2:  # x-z plane
-                    symy = -1 + np.zeros(np.shape(wy))
-                    symx = 1 + np.zeros(np.shape(wx))
-                    symz = 1 + np.zeros(np.shape(wz))
-                elif awg.wing_sym[int(w) - 1] == 3:  # y-z plane
-                    symy = 1 + np.zeros(np.shape(wy))
-                    symx = -1 + np.zeros(np.shape(wx))
-                    symz = 1 + np.zeros(np.shape(wz))
-                wx_t = wx * symx
-                wy_t = wy * symy
-                wz_t = wz * symz
-                [swx.append(x) for x in wx_t]
-                [swy.append(y) for y in wy_t]
-                [swz.append(z) for z in wz_t]
-                M = mass_seg_i[int(i) - 1, fuse + w + a - 1] / \
-                    np.max(np.shape(wx_t))
-                wcx_t = wx_t - (np.zeros((np.shape(wx_t))) + center_of_gravity[0])
-                wcy_t = wy_t - (np.zeros((np.shape(wy_t))) + center_of_gravity[1])
-                wcz_t = wz_t - (np.zeros((np.shape(wz_t))) + center_of_gravity[2])
-                Ixx += np.sum(M * np.add(wcy_t**2, wcz_t**2))
-                Iyy += np.sum(M * np.add(wcx_t**2, wcz_t**2))
-                Izz += np.sum(M * np.add(wcx_t**2, wcy_t**2))
-                Ixy += np.sum(M * wcx_t * wcy_t)
-                Iyz += np.sum(M * wcy_t * wcz_t)
-                Ixz += np.sum(M * wcx_t * wcz_t)
+            seg_list.append((w, w + a - 1, int(i)))
         if awg.wing_sym[int(w) - 1] != 0:
             a += 1
 
+    def eval_nodes():
+        tigl = open_tigl(tixi)
+        nodes_list = []
+        for w, col, i in seg_list:
+            # Number of subdivisions along the longitudinal axis
+            subd_l = max(math.ceil((awg.wing_seg_length[i - 1][col] / SPACING)), 1)
+            etas = np.arange(int(subd_l) + 1) * (1.0 / subd_l)
+            nodes_list.append(get_wing_segment_nodes(tigl, w, i, etas, k_list, zeta))
+        return nodes_list
+
+    key = (get_geometry_hash(tixi), __name__, "wing", SPACING, subd_c)
+    nodes_list = get_cached_nodes(key, eval_nodes)
+
+    inertia = np.zeros(6)
+    all_nodes = []
+    for (w, col, i), nodes in zip(seg_list, nodes_list):
+        mass = mass_seg_i[i - 1, fuse + col]
+        inertia += get_lumped_inertia(nodes, mass, center_of_gravity)
+        all_nodes.append(nodes)
+        if awg.wing_sym[int(w) - 1] != 0:
+            sym_nodes = nodes * SYMMETRY_FACTORS[awg.wing_sym[int(w) - 1]]
+            inertia += get_lumped_inertia(sym_nodes, mass, center_of_gravity)
+            all_nodes.append(sym_nodes)
+
+    (swx, swy, swz) = np.concatenate(all_nodes).T if all_nodes else ([], [], [])
+    (Ixx, Iyy, Izz, Ixy, Iyz, Ixz) = inertia
+
     return (swx, swy, swz, Ixx, Iyy, Izz, Ixy, Iyz, Ixz)
 
 
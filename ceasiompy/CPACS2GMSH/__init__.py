@@ -39,6 +39,14 @@ MODULE_NAME = MODULE_DIR.name
 # Specific to CPACS2Gmsh module
 CONTROL_SURFACES_LIST = ["aileron", "rudder", "flap"]
 
+# Gmsh meshing algorithms of each performance profile
+GMSH_PERFORMANCE_PROFILES = {
+    # Frontal-Delaunay 2D, Delaunay 3D (sequential volume meshing)
+    "Default": {"Mesh.Algorithm": 6, "Mesh.Algorithm3D": 1},
+    # Frontal-Delaunay 2D, HXT 3D (multithreaded volume meshing)
+    "Multithreaded": {"Mesh.Algorithm": 6, "Mesh.Algorithm3D": 10},
+}
+
 
 # =================================================================================================
 #    MAIN
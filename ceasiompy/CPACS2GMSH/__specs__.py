@@ -18,12 +18,18 @@ GUI Interface of CPACS2GMSH.
 from ceasiompy.utils.moduleinterfaces import CPACSInOut
 
 from ceasiompy import log
-from ceasiompy.CPACS2GMSH import include_gui
+from ceasiompy.CPACS2GMSH import (
+    include_gui,
+    GMSH_PERFORMANCE_PROFILES,
+)
 
 from ceasiompy.utils.commonxpath import (
     GMSH_OPEN_GUI_XPATH,
     GMSH_MESH_TYPE_XPATH,
     GMSH_CTRLSURF_ANGLE_XPATH,
+    GMSH_NB_WORKERS_XPATH,
+    GMSH_NB_THREADS_XPATH,
+    GMSH_PERFORMANCE_PROFILE_XPATH,
     GMSH_SYMMETRY_XPATH,
     GMSH_FARFIELD_FACTOR_XPATH,
     GMSH_MESH_SIZE_FARFIELD_XPATH,
@@ -36,6 +42,7 @@ from ceasiompy.utils.commonxpath import (
     GMSH_REFINE_FACTOR_XPATH,
     GMSH_REFINE_TRUNCATED_XPATH,
     GMSH_AUTO_REFINE_XPATH,
+    GMSH_INCREMENTAL_REFINE_XPATH,
     GMSH_NUMBER_LAYER_XPATH,
     GMSH_H_FIRST_LAYER_XPATH,
     GMSH_MAX_THICKNESS_LAYER_XPATH,
@@ -94,6 +101,44 @@ cpacs_inout.add_input(
     gui_group="Control surface settings",
 )
 
+cpacs_inout.add_input(
+    var_name="nb_workers",
+    var_type=int,
+    default_value=1,
+    unit=None,
+    descr="Number of control surface meshes generated at the same time, "
+    "each in its own process with its own gmsh instance",
+    xpath=GMSH_NB_WORKERS_XPATH,
+    gui=include_gui,
+    gui_name="Number of parallel meshes",
+    gui_group="Performance",
+)
+
+cpacs_inout.add_input(
+    var_name="nb_threads",
+    var_type=int,
+    default_value=1,
+    unit=None,
+    descr="Number of threads used by gmsh for each mesh (General.NumThreads)",
+    xpath=GMSH_NB_THREADS_XPATH,
+    gui=include_gui,
+    gui_name="Number of threads per mesh",
+    gui_group="Performance",
+)
+
+cpacs_inout.add_input(
+    var_name="performance_profile",
+    var_type=list,
+    default_value=list(GMSH_PERFORMANCE_PROFILES),
+    unit=None,
+    descr="Meshing algorithms, 'Multithreaded' uses the HXT algorithm which meshes the "
+    "volume on all the threads of the mesh",
+    xpath=GMSH_PERFORMANCE_PROFILE_XPATH,
+    gui=include_gui,
+    gui_name="Performance profile",
+    gui_group="Performance",
+)
+
 cpacs_inout.add_input(
     var_name="symmetry",
     var_type=bool,
@@ -240,6 +285,19 @@ cpacs_inout.add_input(
     gui_group="Advanced Euler mesh parameters",
 )
 
+cpacs_inout.add_input(
+    var_name="incremental_refine",
+    var_type=bool,
+    default_value=False,
+    unit=None,
+    descr="With auto refine, only remesh the refined surfaces and their neighbours, "
+    "until they have enough triangles, instead of the whole aircraft",
+    xpath=GMSH_INCREMENTAL_REFINE_XPATH,
+    gui=include_gui,
+    gui_name="Incremental auto refine",
+    gui_group="Advanced Euler mesh parameters",
+)
+
 cpacs_inout.add_input(
     var_name="n_layer",
     var_type=int,
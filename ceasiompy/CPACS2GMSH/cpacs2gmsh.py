@@ -28,6 +28,7 @@ from ceasiompy.CPACSUpdater.func.controlsurfaces import deflection_angle
 from cpacspy.cpacsfunctions import (
     get_value,
     create_branch,
+    get_value_or_default,
 )
 from ceasiompy.CPACS2GMSH.func.utils import (
     retrieve_gui_values,
@@ -38,14 +39,25 @@ from ceasiompy.CPACS2GMSH.func.rans_mesh_generator import (
     generate_2d_mesh_for_pentagrow,
 )
 
-from typing import List
 from pathlib import Path
 from cpacspy.cpacspy import CPACS
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import (
+    List,
+    Tuple,
+    Optional,
+)
 
 from ceasiompy import log
 
 from ceasiompy.utils.commonxpath import (
     SU2MESH_XPATH,
+    GMSH_MESH_TYPE_XPATH,
+    GMSH_NB_THREADS_XPATH,
+    GMSH_NB_WORKERS_XPATH,
+    GMSH_INCREMENTAL_REFINE_XPATH,
+    GMSH_PERFORMANCE_PROFILE_XPATH,
     GMSH_CTRLSURF_ANGLE_XPATH,
 )
 
@@ -59,7 +71,36 @@ from ceasiompy.CPACS2GMSH import (
 # =================================================================================================
 
 
-def run_cpacs2gmsh(cpacs: CPACS, wkdir: Path, surf: str = None, angle: str = None) -> None:
+def add_su2_mesh_path(tixi, su2mesh_path: Path) -> None:
+    """
+    Add the path of a generated SU2 mesh to the SU2 mesh xPath.
+
+    Args:
+        tixi (Tixi3): Tixi handle of the CPACS file.
+        su2mesh_path (Path): Path of the SU2 mesh.
+
+    """
+
+    if su2mesh_path.exists():
+        mesh_path = str(su2mesh_path)
+        if tixi.checkElement(SU2MESH_XPATH):
+            meshes = tixi.getTextElement(SU2MESH_XPATH)
+            if meshes != "":
+                mesh_path = meshes + ";" + mesh_path
+        else:
+            # Create the branch if it does not exist.
+            create_branch(tixi, SU2MESH_XPATH)
+
+        tixi.updateTextElement(SU2MESH_XPATH, mesh_path)
+        log.info(f"SU2 Mesh at {mesh_path} has been correctly generated. \n")
+
+    else:
+        log.warning(f"Mesh path {su2mesh_path} does not exist. \n")
+
+
+def run_cpacs2gmsh(
+    cpacs: CPACS, wkdir: Path, surf: str = None, angle: str = None, nb_threads: int = 1
+) -> Path:
     """
     Starts meshing with gmsh.
 
@@ -67,6 +108,10 @@ def run_cpacs2gmsh(cpacs: CPACS, wkdir: Path, surf: str = None, angle: str = Non
         cpacs (CPACS): CPACS file.
         surf (str = None): Deflected control surface.
         angle (str = None): Angle of deflection.
+        nb_threads (int = 1): Number of threads used by gmsh.
+
+    Returns:
+        (Path): Path of the SU2 mesh.
 
     """
     tixi = cpacs.tixi
@@ -91,6 +136,8 @@ def run_cpacs2gmsh(cpacs: CPACS, wkdir: Path, surf: str = None, angle: str = Non
         min_max_mesh_factor, feature_angle,
 
     ) = retrieve_gui_values(tixi)
+    performance_profile = get_value_or_default(tixi, GMSH_PERFORMANCE_PROFILE_XPATH, "Default")
+    incremental_refine = get_value_or_default(tixi, GMSH_INCREMENTAL_REFINE_XPATH, False)
 
     # Export airplane's part in .brep format
     export_brep(cpacs, brep_dir, (intake_percent, exhaust_percent))
@@ -113,9 +160,12 @@ def run_cpacs2gmsh(cpacs: CPACS, wkdir: Path, surf: str = None, angle: str = Non
             refine_factor=refine_factor,
             refine_truncated=refine_truncated,
             auto_refine=auto_refine,
+            incremental_refine=incremental_refine,
             testing_gmsh=False,
             surf=surf,
             angle=angle,
+            nb_threads=nb_threads,
+            performance_profile=performance_profile,
         )
     else:
         gmesh_path, fuselage_maxlen = generate_2d_mesh_for_pentagrow(
@@ -150,36 +200,29 @@ def run_cpacs2gmsh(cpacs: CPACS, wkdir: Path, surf: str = None, angle: str = Non
             log.error("Error in generating SU2 mesh.")
 
     # Update SU2 mesh xPath
-    if su2mesh_path.exists():
-        mesh_path = str(su2mesh_path)
-        if tixi.checkElement(SU2MESH_XPATH):
-            meshes = tixi.getTextElement(SU2MESH_XPATH)
-            if meshes != "":
-                mesh_path = meshes + ";" + mesh_path
-        else:
-            # Create the branch if it does not exist.
-            create_branch(tixi, SU2MESH_XPATH)
-
-        tixi.updateTextElement(SU2MESH_XPATH, mesh_path)
-        log.info(f"SU2 Mesh at {mesh_path} has been correctly generated. \n")
+    add_su2_mesh_path(tixi, su2mesh_path)
 
-    else:
-        log.warning(f"Mesh path {mesh_path} does not exist. \n")
+    return su2mesh_path
 
 
-def deform_surf(cpacs: CPACS, wkdir: Path, surf: str, angle: float, wing_names: List) -> None:
+def deform_surf(
+    cpacs_in: Path, wkdir: Path, surf: str, angle: float, wing_names: List, nb_threads: int = 1
+) -> Path:
     """
     Deform the surface surf by angle angle,
     and run run_cpacs2gmsh with this modified CPACS.
 
     Args:
-        cpacs (CPACS): CPACS file to modify.
+        cpacs_in (Path): Path of the CPACS file to modify.
         surf (str): Specific control surface.
         angle (float): Deflection angle.
         wing_names (List): Wings of aircraft.
+        nb_threads (int = 1): Number of threads used by gmsh.
+
+    Returns:
+        (Path): Path of the SU2 mesh.
 
     """
-    cpacs_in = Path(cpacs.cpacs_file)
     tmp_cpacs = CPACS(cpacs_in)
 
     tixi = tmp_cpacs.tixi
@@ -201,7 +244,75 @@ def deform_surf(cpacs: CPACS, wkdir: Path, surf: str, angle: float, wing_names:
     tmp_cpacs.save_cpacs(new_file_path, overwrite=False)
 
     # Upload saved temporary CPACS file
-    run_cpacs2gmsh(CPACS(new_file_path), wkdir, surf, str(angle))
+    return run_cpacs2gmsh(CPACS(new_file_path), wkdir, surf, str(angle), nb_threads)
+
+
+def get_mesh_jobs(tixi) -> List[Tuple[Optional[str], Optional[float]]]:
+    """
+    Returns the meshes to generate, the control surface and the deflection angle of each
+    mesh, (None, None) for the mesh without deflection.
+
+    Args:
+        tixi (Tixi3): Tixi handle of the CPACS file.
+
+    """
+
+    angles = get_value(tixi, GMSH_CTRLSURF_ANGLE_XPATH)
+
+    # Unique angles list
+    angles_list = list(set([float(x) for x in str(angles).split(';')]))
+
+    log.info(f"List of deflection angles {angles_list}.")
+
+    # No specified angles: run as usual
+    if not angles_list:
+        return [(None, None)]
+
+    jobs = []
+    wing_names = return_uidwings(tixi)
+
+    for angle in reversed(angles_list):
+        if angle != 0.0:
+            # Flap deformation has no utily in stability derivatives
+            for surf in CONTROL_SURFACES_LIST:
+                # Check if control surface exists through name of wings
+                if not any(surf in wing for wing in wing_names):
+                    log.warning(
+                        f"No control surface {surf}. "
+                        f"It can not be deflected by angle {angle}."
+                    )
+                else:
+                    # If control Surface exists, deform the correct wings
+                    jobs.append((surf, angle))
+        else:
+            # No deformation for angle 0
+            jobs.append((None, None))
+
+    return jobs
+
+
+def run_mesh_job(
+    cpacs_in: Path, wkdir: Path, surf: str, angle: float, wing_names: List, nb_threads: int
+) -> Path:
+    """
+    Generate one mesh in a worker process, gmsh is initialized in each process.
+
+    Args:
+        cpacs_in (Path): Path of the CPACS file.
+        surf (str): Control surface to deflect, None for the mesh without deflection.
+        angle (float): Deflection angle.
+        wing_names (List): Wings of aircraft.
+        nb_threads (int): Number of threads used by gmsh.
+
+    Returns:
+        (Path): Path of the SU2 mesh.
+
+    """
+
+    if surf is None:
+        return run_cpacs2gmsh(CPACS(cpacs_in), wkdir, nb_threads=nb_threads)
+
+    return deform_surf(cpacs_in, wkdir, surf, angle, wing_names, nb_threads)
 
 
 def main(cpacs: CPACS, wkdir: Path) -> None:
@@ -209,6 +320,10 @@ def main(cpacs: CPACS, wkdir: Path) -> None:
     Main function.
     Defines setup for gmsh.
 
+    The Euler meshes with deflected control surfaces are independent, they are generated
+    in 'nb_workers' processes when more than one worker is selected. The RANS meshes are
+    always generated one after the other, as they share files of the working directory.
+
     Args:
         cpacs_path (str): Input CPACS path.
         cpacs_out_path (str): Modified output CPACS path.
@@ -217,37 +332,43 @@ def main(cpacs: CPACS, wkdir: Path) -> None:
 
     tixi = cpacs.tixi
 
-    angles = get_value(tixi, GMSH_CTRLSURF_ANGLE_XPATH)
+    nb_workers = int(get_value_or_default(tixi, GMSH_NB_WORKERS_XPATH, 1))
+    nb_threads = int(get_value_or_default(tixi, GMSH_NB_THREADS_XPATH, 1))
 
-    # Unique angles list
-    angles_list = list(set([float(x) for x in str(angles).split(';')]))
+    if nb_workers > 1 and get_value(tixi, GMSH_MESH_TYPE_XPATH) != "Euler":
+        log.warning("RANS meshes can not be generated in parallel, nb_workers is set to 1.")
+        nb_workers = 1
 
-    log.info(f"List of deflection angles {angles_list}.")
+    jobs = get_mesh_jobs(tixi)
+    wing_names = return_uidwings(tixi)
+    cpacs_in = Path(cpacs.cpacs_file)
 
-    # Check if angles_list is empty
-    if angles_list:
-        for angle in reversed(angles_list):
-            if angle != 0.0:
-                wing_names = return_uidwings(tixi)
-
-                # Flap deformation has no utily in stability derivatives
-                for surf in CONTROL_SURFACES_LIST:
-                    # Check if control surface exists through name of wings
-                    if not any(surf in wing for wing in wing_names):
-                        log.warning(
-                            f"No control surface {surf}. "
-                            f"It can not be deflected by angle {angle}."
-                        )
-                    else:
-                        # If control Surface exists, deform the correct wings
-                        deform_surf(cpacs, wkdir, surf, angle, wing_names)
+    if nb_workers <= 1 or len(jobs) <= 1:
+        for surf, angle in jobs:
+            if surf is None:
+                run_cpacs2gmsh(cpacs, wkdir, nb_threads=nb_threads)
             else:
-                # No deformation for angle 0
-                run_cpacs2gmsh(cpacs, wkdir)
+                deform_surf(cpacs_in, wkdir, surf, angle, wing_names, nb_threads)
+        return
+
+    nb_workers = min(nb_workers, len(jobs))
+    log.info(f"{len(jobs)} meshes will be generated on {nb_workers} processes.")
+
+    with ProcessPoolExecutor(max_workers=nb_workers) as executor:
+        futures = [
+            executor.submit(
+                run_mesh_job, cpacs_in, wkdir, surf, angle, wing_names, nb_threads
+            )
+            for surf, angle in jobs
+        ]
+
+        for (surf, _), future in zip(jobs, futures):
+            su2mesh_path = future.result()
+
+            # The mesh without deflection is added to the CPACS of the workflow
+            if surf is None:
+                add_su2_mesh_path(tixi, su2mesh_path)
 
-    else:
-        # No specified angles: run as usual
-        run_cpacs2gmsh(cpacs, wkdir)
 
 # =================================================================================================
 #    MAIN
@@ -27,6 +27,13 @@ from ceasiompy.CPACS2GMSH.func.wingclassification import ModelPart
 from ceasiompy.CPACS2GMSH.func.utils import MESH_COLORS
 
 
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Maximum number of refine/remesh iterations of the incremental auto refine
+AUTO_REFINE_MAX_ITERATIONS = 3
+
 # =================================================================================================
 #   FUNCTIONS
 # =================================================================================================
@@ -422,6 +429,8 @@ def refine_small_surfaces(
     final_domain_volume_tag,
     n_power=1.5,
     nb_min_triangle=150,
+    check_mesh=False,
+    size_factor=1.0,
 ):
     """
     Function to refine the mesh
@@ -430,6 +439,8 @@ def refine_small_surfaces(
 
     - if the surface area is very small compare to the mesh size of the part mesh
     the surface is remeshed with a smaller mesh size
+    - if 'check_mesh' is True, the surfaces whose current mesh already has
+    'nb_min_triangle' triangles are not refined
 
 
     Args:
@@ -451,6 +462,10 @@ def refine_small_surfaces(
         power of the power law for the mesh extend function
     nb_min_triangle : int
         number of minimum triangle in a mesh surface to trigger the mesh refinement
+    check_mesh : bool
+        check the number of triangles of the current mesh of the surfaces
+    size_factor : float
+        factor applied to the mesh size of the refined surfaces
     ...
     Returns:
     ----------
@@ -471,10 +486,13 @@ def refine_small_surfaces(
         area = compute_area(surface_tag)
 
         if area < nb_min_triangle * mesh_triangle_surf:
+            if check_mesh and get_nb_triangles(surface_tag) >= nb_min_triangle:
+                continue
+
             refined_surfaces.append(surface_tag)
 
             # Refine the surface
-            new_mesh_size = ((area / (nb_min_triangle)) / 0.43301270) ** 0.5
+            new_mesh_size = size_factor * ((area / (nb_min_triangle)) / 0.43301270) ** 0.5
 
             # Set the color to indicate the bad surfaces
             gmsh.model.setColor([(2, surface_tag)], *MESH_COLORS["bad_surface"], recursive=False)
@@ -509,6 +527,132 @@ def refine_small_surfaces(
 
     return refined_surfaces, mesh_fields
 
+
+def get_nb_triangles(surface_tag):
+    """
+    Function to get the number of elements of the current mesh of a surface
+
+    Args:
+    ----------
+    surface_tag : int
+        tag of the surface
+    """
+
+    _, element_tags, _ = gmsh.model.mesh.getElements(2, surface_tag)
+
+    return sum(len(tags) for tags in element_tags)
+
+
+def remesh_surfaces(surfaces_tags):
+    """
+    Function to remesh only some surfaces of the model
+
+    The mesh of the surfaces, of their boundary curves and of the neighbouring surfaces
+    which share these curves is cleared, then only the entities without mesh are meshed
+    again, so that the mesh stays conform with the rest of the model.
+
+    Args:
+    ----------
+    surfaces_tags : list
+        tags of the surfaces to remesh
+    """
+
+    surfaces = [(2, tag) for tag in surfaces_tags]
+    curves = {
+        (1, abs(tag))
+        for _, tag in gmsh.model.getBoundary(surfaces, combined=False, oriented=False)
+    }
+
+    cleared_surfaces = set(surfaces)
+    for _, curve_tag in curves:
+        upward, _ = gmsh.model.getAdjacencies(1, curve_tag)
+        cleared_surfaces.update((2, tag) for tag in upward)
+
+    log.info(
+        f"Remeshing {len(cleared_surfaces)} surface(s) and {len(curves)} curve(s) "
+        f"around {len(surfaces_tags)} refined surface(s)."
+    )
+
+    gmsh.model.mesh.clear(sorted(cleared_surfaces) + sorted(curves))
+
+    gmsh.option.setNumber("Mesh.MeshOnlyEmpty", 1)
+    gmsh.model.mesh.generate(1)
+    gmsh.model.mesh.generate(2)
+    gmsh.option.setNumber("Mesh.MeshOnlyEmpty", 0)
+
+
+def refine_surfaces_incrementally(
+    mesh_fields,
+    aircraft_parts,
+    mesh_size_farfield,
+    aircraft_charact_length,
+    final_domain_volume_tag,
+    max_iterations=AUTO_REFINE_MAX_ITERATIONS,
+):
+    """
+    Function to refine the small surfaces of the aircraft and to remesh only them
+
+    At each iteration, the small surfaces whose mesh does not have enough triangles are
+    refined with a smaller mesh size and remeshed with 'remesh_surfaces'. The iterations
+    stop when all the surfaces have enough triangles.
+
+    Args:
+    ----------
+    mesh_fields : dict
+        mesh_fields["nbfields"] : number of existing mesh field in the model
+    aircraft_parts : list
+        parts of the aircraft (ModelPart)
+    mesh_size_farfield : float
+        mesh size of the farfield
+    aircraft_charact_length : float
+        characteristic length of the aircraft : max(x_length, y_length, z_length) of the aircraft
+    final_domain_volume_tag : int
+        tag of the final domain volume
+    max_iterations : int
+        maximum number of refine/remesh iterations
+    ...
+    Returns:
+    ----------
+    refined_surfaces : list
+        tags of the surfaces which were refined
+    mesh_fields : dict
+        mesh_fields["nbfields"] : number of existing mesh field in the model
+    """
+
+    refined_surfaces = set()
+
+    for iteration in range(max_iterations):
+        bad_surfaces = []
+
+        for part in aircraft_parts:
+            part_bad_surfaces, mesh_fields = refine_small_surfaces(
+                mesh_fields,
+                part,
+                mesh_size_farfield,
+                aircraft_charact_length,
+                final_domain_volume_tag,
+                check_mesh=True,
+                size_factor=0.5**iteration,
+            )
+            bad_surfaces.extend(part_bad_surfaces)
+
+        if not bad_surfaces:
+            log.info(f"All surfaces have enough triangles after {iteration} iteration(s).")
+            break
+
+        log.info(f"Iteration {iteration + 1}: {len(bad_surfaces)} surface(s) to refine.")
+
+        # Reset the background mesh
+        mesh_fields = min_fields(mesh_fields)
+
+        remesh_surfaces(bad_surfaces)
+        refined_surfaces.update(bad_surfaces)
+
+    else:
+        log.warning(f"Maximum number of auto refine iterations ({max_iterations}) reached.")
+
+    return sorted(refined_surfaces), mesh_fields
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
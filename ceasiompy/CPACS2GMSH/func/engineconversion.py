@@ -76,7 +76,7 @@ def engine_conversion(cpacs, engine_uids, brep_dir, engines_cfg_file, engine_sur
 
     # clean brep files from the nacelle that are no more used
     for file in brep_dir.iterdir():
-        part_uid = (str(file)).split(".")[0].split("/")[-1]
+        part_uid = file.name.split(".")[0]
 
         if part_uid in engine_uids[1:]:
             file.unlink()
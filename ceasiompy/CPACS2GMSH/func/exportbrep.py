@@ -3,7 +3,11 @@ CEASIOMpy: Conceptual Aircraft Design Software
 
 Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
 
-Small description of the script
+Export the aircraft parts from TiGL to BREP files.
+
+The exported files of each part are kept in a cache shared between the workflows, keyed on
+a hash of the CPACS subtree of the part and of the elements it references (parent, profiles,
+engine definition). Only the parts whose geometry changed are exported again.
 
 
 | Author: Tony Govoni
@@ -20,11 +24,23 @@ TODO:
 #   IMPORTS
 # =================================================================================================
 
+import os
+import shutil
+import hashlib
+import xml.etree.ElementTree as ET
+
 from pathlib import Path
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+)
 
 from ceasiompy.CPACS2GMSH.func.engineconversion import engine_conversion
 from ceasiompy import log
 from ceasiompy.utils.commonnames import GMSH_ENGINE_CONFIG_NAME
+from ceasiompy.utils.commonpaths import BREP_CACHE_PATH
 from ceasiompy.utils.commonxpath import GMSH_EXPORT_PROP_XPATH
 from ceasiompy.utils.configfiles import ConfigFile
 from cpacspy.cpacsfunctions import get_value_or_default
@@ -161,6 +177,147 @@ def rotor_config(rotorcraft_config, brep_dir):
     config_file.write_file(rotors_cfg_file_path, overwrite=True)
 
 
+def get_uid_elements(tixi) -> Dict[str, ET.Element]:
+    """
+    Returns the elements of the CPACS which have a uID, by uID.
+    """
+
+    root = ET.fromstring(tixi.exportDocumentAsString())
+
+    return {element.get("uID"): element for element in root.iter() if element.get("uID")}
+
+
+def get_component_hash(uid_elements: Dict[str, ET.Element], uid: str, params: Tuple = ()) -> str:
+    """
+    Returns a hash of the CPACS subtree of a component and of all the elements it references
+    through '...UID' elements (parent, profiles, engine definition, ...).
+
+    Args:
+        uid_elements (Dict[str, ET.Element]): Elements of the CPACS with a uID.
+        uid (str): uID of the component.
+        params (Tuple): Export parameters other than the CPACS geometry.
+
+    Returns:
+        (str): Hash of the component geometry.
+
+    """
+
+    sha = hashlib.sha256(repr((uid, params)).encode())
+
+    pending = [uid]
+    visited = set()
+
+    while pending:
+        current = pending.pop()
+        if current in visited or current not in uid_elements:
+            continue
+        visited.add(current)
+
+        element = uid_elements[current]
+        sha.update(ET.tostring(element))
+        pending += [
+            ref.text.strip() for ref in element.iter() if ref.tag.endswith("UID") and ref.text
+        ]
+
+    return sha.hexdigest()
+
+
+def copy_cached_files(cache_dir: Path, brep_dir: Path) -> None:
+    """
+    Copy the exported files of a component in the brep directory, the engine configuration
+    of the component is added to the engines configuration file of the brep directory.
+    """
+
+    brep_dir.mkdir(exist_ok=True)
+
+    for file in cache_dir.iterdir():
+        if file.name == GMSH_ENGINE_CONFIG_NAME:
+            engines_cfg_file = Path(brep_dir, GMSH_ENGINE_CONFIG_NAME)
+            config_file = ConfigFile(engines_cfg_file)
+            for key, value in ConfigFile(file).data.items():
+                config_file[key] = value
+            config_file.write_file(engines_cfg_file, overwrite=True)
+        else:
+            shutil.copyfile(file, Path(brep_dir, file.name))
+
+
+def export_component(
+    uid_elements: Dict[str, ET.Element],
+    uid: str,
+    brep_dir: Path,
+    export_func: Callable[[Path], None],
+    params: Tuple = (),
+) -> None:
+    """
+    Export a component with 'export_func', or copy its files from the BREP cache if its
+    geometry did not change.
+
+    Args:
+        uid_elements (Dict[str, ET.Element]): Elements of the CPACS with a uID.
+        uid (str): uID of the component.
+        brep_dir (Path): Path to the directory where the brep files are saved.
+        export_func (Callable[[Path], None]): Function exporting the component files in a
+            directory.
+        params (Tuple): Export parameters other than the CPACS geometry.
+
+    """
+
+    if uid not in uid_elements:
+        export_func(brep_dir)
+        return
+
+    component_hash = get_component_hash(uid_elements, uid, params)
+    cache_dir = Path(BREP_CACHE_PATH, f"{uid}_{component_hash[:16]}")
+
+    if cache_dir.is_dir():
+        log.info(f"{uid} has not changed, brep files are copied from {cache_dir}.")
+    else:
+        tmp_dir = Path(BREP_CACHE_PATH, f"{cache_dir.name}_tmp{os.getpid()}")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+        tmp_dir.mkdir(parents=True)
+
+        try:
+            export_func(tmp_dir)
+        except Exception:
+            shutil.rmtree(tmp_dir)
+            raise
+
+        try:
+            tmp_dir.rename(cache_dir)
+        except OSError:
+            # Exported at the same time by another process
+            shutil.rmtree(tmp_dir)
+
+    copy_cached_files(cache_dir, brep_dir)
+
+
+def export_loft(part, brep_dir: Path) -> None:
+    """
+    Export the loft of a fuselage, a wing or a pylon, and its mirrored loft if any.
+    """
+
+    part_uid = part.get_uid()
+    export(part.get_loft(), brep_dir, part_uid)
+
+    part_m_geom = part.get_mirrored_loft()
+    if part_m_geom is not None:
+        export(part_m_geom, brep_dir, part_uid + "_mirrored")
+
+
+def export_engine(cpacs, engine, engine_surface_percent: Tuple, brep_dir: Path) -> None:
+    """
+    Export an engine, its configuration is written in the engines configuration file of
+    'brep_dir'.
+    """
+
+    engines_cfg_file = Path(brep_dir, GMSH_ENGINE_CONFIG_NAME)
+    if not engines_cfg_file.exists():
+        ConfigFile().write_file(engines_cfg_file)
+
+    engine_export(cpacs, engine, brep_dir, engines_cfg_file, engine_surface_percent)
+
+
 def export_brep(cpacs, brep_dir, engine_surface_percent=(20, 20)):
     """Function to generate and export the geometries of a .xml file
 
@@ -200,42 +357,29 @@ def export_brep(cpacs, brep_dir, engine_surface_percent=(20, 20)):
     pylons_config = aircraft_config.get_engine_pylons()
     engines_config = aircraft_config.get_engines()
 
-    # Export into brep
+    # Export into brep, the parts which did not change are copied from the cache
+    uid_elements = get_uid_elements(tixi)
 
     # Fuselage
     for k in range(1, fuselage_cnt + 1):
         fuselage = aircraft_config.get_fuselage(k)
-        fuselage_uid = fuselage.get_uid()
-        fuselage_geom = fuselage.get_loft()
-        export(fuselage_geom, brep_dir, fuselage_uid)
-
-        fuse_m_geom = fuselage.get_mirrored_loft()
-        if fuse_m_geom is not None:
-            export(fuse_m_geom, brep_dir, fuselage_uid + "_mirrored")
+        export_component(
+            uid_elements, fuselage.get_uid(), brep_dir, partial(export_loft, fuselage)
+        )
 
     # Wing
     for k in range(1, wing_cnt + 1):
         wing = aircraft_config.get_wing(k)
-        wing_uid = wing.get_uid()
-        wing_geom = wing.get_loft()
-        export(wing_geom, brep_dir, wing_uid)
-
-        wing_m_geom = wing.get_mirrored_loft()
-        if wing_m_geom is not None:
-            export(wing_m_geom, brep_dir, wing_uid + "_mirrored")
+        export_component(uid_elements, wing.get_uid(), brep_dir, partial(export_loft, wing))
 
     # Pylon
     if pylons_config:
         pylon_cnt = pylons_config.get_pylon_count()
         for k in range(1, pylon_cnt + 1):
             pylon = pylons_config.get_engine_pylon(k)
-            pylon_uid = pylon.get_uid()
-            pylon_geom = pylon.get_loft()
-            export(pylon_geom, brep_dir, pylon_uid)
-
-            pylon_m_geom = pylon.get_mirrored_loft()
-            if pylon_m_geom is not None:
-                export(pylon_m_geom, brep_dir, pylon_uid + "_mirrored")
+            export_component(
+                uid_elements, pylon.get_uid(), brep_dir, partial(export_loft, pylon)
+            )
 
     # Engine
     if engines_config:
@@ -249,7 +393,13 @@ def export_brep(cpacs, brep_dir, engine_surface_percent=(20, 20)):
         # Export each engine
         for k in range(1, nb_engine + 1):
             engine = engines_config.get_engine(k)
-            engine_export(cpacs, engine, brep_dir, engines_cfg_file, engine_surface_percent)
+            export_component(
+                uid_elements,
+                engine.get_uid(),
+                brep_dir,
+                partial(export_engine, cpacs, engine, engine_surface_percent),
+                params=tuple(engine_surface_percent),
+            )
 
 # =================================================================================================
 #    MAIN
@@ -39,11 +39,17 @@ from ceasiompy.utils.ceasiompyutils import bool_, get_part_type
 from cpacspy.cpacsfunctions import create_branch
 
 from ceasiompy.CPACS2GMSH.func.mesh_sizing import fuselage_size, wings_size
-from ceasiompy.CPACS2GMSH.func.utils import initialize_gmsh, write_gmsh, cfg_rotors
+from ceasiompy.CPACS2GMSH.func.utils import (
+    cfg_rotors,
+    write_gmsh,
+    initialize_gmsh,
+    set_gmsh_performance,
+)
 from ceasiompy.CPACS2GMSH.func.advancemeshing import (
     refine_wing_section,
     set_domain_mesh,
     refine_small_surfaces,
+    refine_surfaces_incrementally,
     min_fields,
 )
 
@@ -69,6 +75,15 @@ from ceasiompy.utils.commonnames import (
     GMSH_ENGINE_CONFIG_NAME,
 )
 
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Gmsh log message at the end of a meshing stage
+GMSH_STAGE_TIME_PATTERN = re.compile(
+    r"Done (meshing \dD|optimizing mesh) \(Wall ([\d.eE+-]+)s, CPU ([\d.eE+-]+)s\)"
+)
+
 # =================================================================================================
 #   FUNCTIONS
 # =================================================================================================
@@ -187,7 +202,7 @@ def define_engine_bc(engine_part, brep_dir):
         )
 
 
-def process_gmsh_log(gmsh_log):
+def process_gmsh_log(gmsh_log) -> Dict[str, Tuple[float, float]]:
     """
     Function to process the gmsh log file.
     It is used to retrieve the mesh quality
@@ -198,6 +213,10 @@ def process_gmsh_log(gmsh_log):
     ----------
     gmsh_log : list(str)
         list of gmsh log events
+
+    Returns:
+        (Dict[str, Tuple[float, float]]): Wall and CPU time of each meshing stage
+            (e.g. 'meshing 3D'), summed over the stage repetitions.
     """
 
     # Find last logs about mesh quality
@@ -215,6 +234,40 @@ def process_gmsh_log(gmsh_log):
 
     log.info(f"Total meshing time : {round(total_time, 2)}s")
 
+    stage_times: Dict[str, Tuple[float, float]] = {}
+    for message in gmsh_log:
+        match = GMSH_STAGE_TIME_PATTERN.search(message)
+        if match:
+            stage = match.group(1)
+            wall_time, cpu_time = stage_times.get(stage, (0.0, 0.0))
+            stage_times[stage] = (
+                wall_time + float(match.group(2)),
+                cpu_time + float(match.group(3)),
+            )
+
+    for stage, (wall_time, cpu_time) in stage_times.items():
+        log.info(f"Time of {stage} : {wall_time:.2f}s (wall), {cpu_time:.2f}s (CPU)")
+
+    return stage_times
+
+
+def write_mesh_timing(stage_times: Dict[str, Tuple[float, float]], timing_path: Path) -> None:
+    """
+    Write the wall and CPU time of each meshing stage in a .csv file.
+
+    Args:
+        stage_times (Dict[str, Tuple[float, float]]): Times returned by 'process_gmsh_log'.
+        timing_path (Path): Path of the .csv file.
+
+    """
+
+    with open(timing_path, "w") as f:
+        f.write("stage,wall_time,cpu_time\n")
+        for stage, (wall_time, cpu_time) in stage_times.items():
+            f.write(f"{stage},{wall_time},{cpu_time}\n")
+
+    log.info(f"Meshing times written in {timing_path}.")
+
 
 def duplicate_disk_actuator_surfaces(part: ModelPart):
     """
@@ -304,9 +357,12 @@ def generate_gmsh(
     refine_factor: float = 2.0,
     refine_truncated: bool = False,
     auto_refine: bool = True,
+    incremental_refine: bool = False,
     testing_gmsh: bool = False,
     surf: str = None,
     angle: str = None,
+    nb_threads: int = 1,
+    performance_profile: str = "Default",
 ) -> Path:
     """
     Generates a mesh from brep files forming an airplane.
@@ -339,8 +395,13 @@ def generate_gmsh(
         refine_factor (float = 2.0): Refine factor for the mesh's LE and TE.
         refine_truncated (bool = False): Refinement can change to match the truncated te thickness.
         auto_refine (bool = False): Mesh will be checked for quality.
+        incremental_refine (bool = False): Only the refined surfaces and their neighbours are
+            remeshed, until they have enough triangles.
         testing_gmsh (bool = False): Gmsh sessions will not be clear and killed at the end of
             the function, this allow to test the gmsh feature after the call of generate_gmsh()
+        nb_threads (int = 1): Number of threads used by gmsh.
+        performance_profile (str = "Default"): Meshing algorithms, see
+            'GMSH_PERFORMANCE_PROFILES'.
 
     Returns:
         (Path, List[ModelPart]):
@@ -355,7 +416,7 @@ def generate_gmsh(
     brep_files = sorted(brep_dir.glob("*.brep"))
 
     # Initialize gmsh
-    initialize_gmsh()
+    initialize_gmsh(nb_threads)
     gmsh.logger.start()
     # gmsh.option.setNumber("Geometry.Tolerance", 1e-3)  # Adjust as needed
 
@@ -755,7 +816,7 @@ def generate_gmsh(
     # Mesh generation
     log.info("Start of gmsh 2D surface meshing process")
 
-    gmsh.option.setNumber("Mesh.Algorithm", 6)
+    set_gmsh_performance(performance_profile, nb_threads)
     gmsh.option.setNumber("Mesh.LcIntegrationPrecision", 1e-6)
     gmsh.model.occ.synchronize()
 
@@ -765,7 +826,24 @@ def generate_gmsh(
     gmsh.model.occ.synchronize()
 
     # Control of the mesh quality
-    if refine_factor != 1 and auto_refine:
+    if refine_factor != 1 and auto_refine and incremental_refine:
+        log.info("Start of gmsh 2D incremental remeshing process")
+
+        refined_surfaces, mesh_fields = refine_surfaces_incrementally(
+            mesh_fields,
+            aircraft_parts,
+            mesh_size_farfield,
+            max(model_dimensions),
+            final_domain.volume_tag,
+        )
+
+        for surface in refined_surfaces:
+            gmsh.model.setColor([(2, surface)], *MESH_COLORS["good_surface"], recursive=False)
+        gmsh.model.occ.synchronize()
+
+        log.info("Remeshing process finished")
+
+    elif refine_factor != 1 and auto_refine:
         bad_surfaces = []
 
         for part in aircraft_parts:
@@ -898,12 +976,13 @@ def generate_gmsh(
         control_disk_actuator_normal()
 
     if surf is None:
-        su2mesh_path = write_gmsh(results_dir, "mesh.su2")
+        mesh_name = "mesh"
     else:
         mesh_name = f"mesh_{surf}_{angle}"
-        su2mesh_path = write_gmsh(results_dir, f"{mesh_name}.su2")
+    su2mesh_path = write_gmsh(results_dir, f"{mesh_name}.su2")
 
-    process_gmsh_log(gmsh.logger.get())
+    stage_times = process_gmsh_log(gmsh.logger.get())
+    write_mesh_timing(stage_times, Path(results_dir, f"{mesh_name}_timing.csv"))
 
     gmsh.model.occ.synchronize()
 
@@ -28,6 +28,7 @@ from tixi3.tixi3wrapper import Tixi3
 from ceasiompy.utils.configfiles import ConfigFile
 
 from ceasiompy import log
+from ceasiompy.CPACS2GMSH import GMSH_PERFORMANCE_PROFILES
 
 from ceasiompy.utils.commonxpath import (
     GMSH_AUTO_REFINE_XPATH,
@@ -182,13 +183,40 @@ def write_gmsh(results_dir: str, file: str) -> Path:
     return Path(su2mesh_path)
 
 
-def initialize_gmsh():
+def set_gmsh_performance(profile: str = "Default", nb_threads: int = 1) -> None:
+    """
+    Set the meshing algorithms of a performance profile and the number of threads of
+    each meshing stage.
+
+    Args:
+        profile (str = "Default"): Name of the profile in 'GMSH_PERFORMANCE_PROFILES'.
+        nb_threads (int = 1): Number of threads used by gmsh.
+
+    """
+
+    if profile not in GMSH_PERFORMANCE_PROFILES:
+        log.warning(f"Unknown gmsh performance profile '{profile}', 'Default' is used.")
+        profile = "Default"
+
+    for option, value in GMSH_PERFORMANCE_PROFILES[profile].items():
+        gmsh.option.setNumber(option, value)
+
+    gmsh.option.setNumber("General.NumThreads", nb_threads)
+    for dim in ["1D", "2D", "3D"]:
+        gmsh.option.setNumber(f"Mesh.MaxNumThreads{dim}", nb_threads)
+
+    log.info(f"Gmsh performance profile '{profile}' on {nb_threads} thread(s).")
+
+
+def initialize_gmsh(nb_threads: int = 1):
     # Initialize gmsh
     gmsh.initialize()
     # Stop gmsh output log in the terminal
     gmsh.option.setNumber("General.Terminal", 0)
     # Log complexity
     gmsh.option.setNumber("General.Verbosity", 5)
+    # Number of threads used by gmsh
+    gmsh.option.setNumber("General.NumThreads", nb_threads)
 
 
 def check_path(file: str):
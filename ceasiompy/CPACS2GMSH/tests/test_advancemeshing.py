@@ -24,8 +24,11 @@ from ceasiompy.CPACS2GMSH.func.advancemeshing import (
     compute_area,
     distance_field,
     min_fields,
+    remesh_surfaces,
     restrict_fields,
+    get_nb_triangles,
 )
+from ceasiompy.CPACS2GMSH.func import exportbrep
 from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep
 from ceasiompy.CPACS2GMSH.func.generategmesh import generate_gmsh
 from ceasiompy.utils.ceasiompyutils import remove_file_type_in_dir
@@ -42,6 +45,13 @@ TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 # =================================================================================================
 
 
+@pytest.fixture(autouse=True)
+def brep_cache(tmp_path, monkeypatch):
+    """Use an empty BREP cache for each test"""
+
+    monkeypatch.setattr(exportbrep, "BREP_CACHE_PATH", Path(tmp_path, "brep_cache"))
+
+
 def test_distance_field():
     """
     Test if a simple distance field can be generate for a line and a surface
@@ -199,6 +209,39 @@ def test_compute_area():
     gmsh.finalize()
 
 
+def test_remesh_surfaces():
+    """
+    Test that only a surface and its neighbours are remeshed
+    """
+
+    gmsh.initialize()
+
+    # Two adjacent squares sharing a curve and a separate square
+    gmsh.model.occ.addRectangle(0, 0, 0, 1, 1)
+    gmsh.model.occ.addRectangle(1, 0, 0, 1, 1)
+    gmsh.model.occ.fragment([(2, 1)], [(2, 2)])
+    separate_square = gmsh.model.occ.addRectangle(5, 0, 0, 1, 1)
+    gmsh.model.occ.synchronize()
+
+    gmsh.option.setNumber("Mesh.MeshSizeMax", 0.2)
+    gmsh.model.mesh.generate(2)
+
+    _, separate_elements, _ = gmsh.model.mesh.getElements(2, separate_square)
+    nb_triangles = get_nb_triangles(1)
+
+    gmsh.option.setNumber("Mesh.MeshSizeMax", 0.1)
+    remesh_surfaces([1])
+
+    # Refined surface and its neighbour are remeshed, the separate square is not
+    assert get_nb_triangles(1) > nb_triangles
+    assert get_nb_triangles(2) > nb_triangles
+    _, elements, _ = gmsh.model.mesh.getElements(2, separate_square)
+    assert all((a == b).all() for a, b in zip(elements, separate_elements))
+
+    gmsh.clear()
+    gmsh.finalize()
+
+
 def test_refine_wing_section():
     """
     Test if the wing section is correctly refined by the advancemeshing algorithm
@@ -303,6 +346,51 @@ def test_auto_refine():
     remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
 
 
+def test_incremental_auto_refine():
+    """
+    Test that the mesh is generated with the incremental auto refine
+    """
+
+    if TEST_OUT_PATH.exists():
+        shutil.rmtree(TEST_OUT_PATH)
+    TEST_OUT_PATH.mkdir()
+
+    cpacs = CPACS(CPACS_IN_PATH)
+
+    export_brep(cpacs, TEST_OUT_PATH)
+
+    generate_gmsh(
+        tixi=cpacs.tixi,
+        brep_dir=TEST_OUT_PATH,
+        results_dir=TEST_OUT_PATH,
+        open_gmsh=False,
+        farfield_factor=5,
+        symmetry=False,
+        farfield_size_factor=17,
+        n_power_factor=2,
+        n_power_field=0.9,
+        fuselage_mesh_size_factor=0.1,
+        wing_mesh_size_factor=0.1,
+        mesh_size_engines=0.5,
+        mesh_size_propellers=0.5,
+        refine_factor=2.0,
+        refine_truncated=False,
+        auto_refine=True,
+        incremental_refine=True,
+        testing_gmsh=True,
+    )
+
+    # Check the mesh fields of the wing sections are kept (34 == without auto_refine)
+    gmsh_field_list = gmsh.model.mesh.field.list()
+    assert len(gmsh_field_list) >= 34
+    assert Path(TEST_OUT_PATH, "mesh.su2").exists()
+
+    gmsh.clear()
+    gmsh.finalize()
+
+    remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
+
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
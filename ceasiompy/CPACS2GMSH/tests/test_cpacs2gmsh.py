@@ -0,0 +1,119 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/CPACS2GMSH/cpacs2gmsh.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import pytest
+
+from pathlib import Path
+
+import ceasiompy.CPACS2GMSH.cpacs2gmsh as cpacs2gmsh
+
+from ceasiompy.CPACS2GMSH.cpacs2gmsh import get_mesh_jobs, main
+from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
+from ceasiompy.utils.commonxpath import (
+    GMSH_MESH_TYPE_XPATH,
+    GMSH_NB_WORKERS_XPATH,
+    GMSH_CTRLSURF_ANGLE_XPATH,
+)
+from cpacspy.cpacsfunctions import create_branch
+from cpacspy.cpacspy import CPACS
+
+CPACS_IN_PATH = Path(CPACS_FILES_PATH, "simpletest_cpacs.xml")
+
+WING_NAMES = ["Wing", "Wing_aileron_left", "Wing_aileron_right"]
+
+# =================================================================================================
+#   FIXTURES
+# =================================================================================================
+
+
+@pytest.fixture
+def cpacs(monkeypatch):
+    """CPACS with deflection angles and an aileron on its wings"""
+
+    cpacs = CPACS(CPACS_IN_PATH)
+
+    for xpath, value in [
+        (GMSH_CTRLSURF_ANGLE_XPATH, "0;5;5"),
+        (GMSH_NB_WORKERS_XPATH, "4"),
+        (GMSH_MESH_TYPE_XPATH, "Euler"),
+    ]:
+        create_branch(cpacs.tixi, xpath)
+        cpacs.tixi.updateTextElement(xpath, value)
+
+    monkeypatch.setattr(cpacs2gmsh, "return_uidwings", lambda tixi: WING_NAMES)
+
+    return cpacs
+
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def test_get_mesh_jobs(cpacs):
+
+    jobs = get_mesh_jobs(cpacs.tixi)
+
+    # Mesh without deflection and one mesh per existing control surface and angle
+    assert len(jobs) == 2
+    assert set(jobs) == {(None, None), ("aileron", 5.0)}
+
+    cpacs.tixi.updateTextElement(GMSH_CTRLSURF_ANGLE_XPATH, "0")
+    assert get_mesh_jobs(cpacs.tixi) == [(None, None)]
+
+
+def test_main_sequential(cpacs, tmp_path, monkeypatch):
+    """RANS meshes share files of the working directory, they are generated sequentially"""
+
+    calls = []
+
+    def run_cpacs2gmsh(cpacs, wkdir, surf=None, angle=None, nb_threads=1):
+        calls.append((surf, angle))
+        return Path(wkdir, "mesh.su2")
+
+    def deform_surf(cpacs_in, wkdir, surf, angle, wing_names, nb_threads=1):
+        calls.append((surf, angle))
+        return Path(wkdir, f"mesh_{surf}_{angle}.su2")
+
+    def process_pool(*args, **kwargs):
+        raise AssertionError("The meshes must be generated sequentially.")
+
+    monkeypatch.setattr(cpacs2gmsh, "run_cpacs2gmsh", run_cpacs2gmsh)
+    monkeypatch.setattr(cpacs2gmsh, "deform_surf", deform_surf)
+    monkeypatch.setattr(cpacs2gmsh, "ProcessPoolExecutor", process_pool)
+
+    cpacs.tixi.updateTextElement(GMSH_MESH_TYPE_XPATH, "RANS")
+    main(cpacs, tmp_path)
+    assert len(calls) == 2
+    assert set(calls) == {(None, None), ("aileron", 5.0)}
+
+    # One worker
+    calls.clear()
+    cpacs.tixi.updateTextElement(GMSH_MESH_TYPE_XPATH, "Euler")
+    cpacs.tixi.updateTextElement(GMSH_NB_WORKERS_XPATH, "1")
+    main(cpacs, tmp_path)
+    assert len(calls) == 2
+    assert set(calls) == {(None, None), ("aileron", 5.0)}
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test cpacs2gmsh.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -16,11 +16,17 @@ Test functions for 'ceasiompy/CPACS2GMSH/exportbrep.py'
 # =================================================================================================
 
 import shutil
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep
+from ceasiompy.CPACS2GMSH.func import exportbrep
+from ceasiompy.CPACS2GMSH.func.exportbrep import (
+    export_brep,
+    export_component,
+    get_component_hash,
+)
 from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
 from cpacspy.cpacspy import CPACS
 
@@ -40,7 +46,75 @@ TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 # =================================================================================================
 
 
-def test_export_brep():
+@pytest.fixture(autouse=True)
+def brep_cache(tmp_path, monkeypatch):
+    """Use an empty BREP cache for each test"""
+
+    monkeypatch.setattr(exportbrep, "BREP_CACHE_PATH", Path(tmp_path, "brep_cache"))
+
+
+def test_get_component_hash():
+    """Test that the hash changes with the component and the elements it references"""
+
+    root = ET.fromstring(
+        "<cpacs>"
+        "<fuselage uID='Fus'><length>10</length></fuselage>"
+        "<wing uID='Wing'><parentUID>Fus</parentUID><airfoilUID>NACA</airfoilUID></wing>"
+        "<wingAirfoil uID='NACA'><x>0.1</x></wingAirfoil>"
+        "<wingAirfoil uID='Other'><x>0.1</x></wingAirfoil>"
+        "</cpacs>"
+    )
+    uid_elements = {element.get("uID"): element for element in root.iter() if element.get("uID")}
+
+    wing_hash = get_component_hash(uid_elements, "Wing")
+    fuselage_hash = get_component_hash(uid_elements, "Fus")
+
+    # Elements which are not referenced do not change the hash
+    uid_elements["Other"].find("x").text = "0.2"
+    assert get_component_hash(uid_elements, "Wing") == wing_hash
+
+    uid_elements["NACA"].find("x").text = "0.2"
+    assert get_component_hash(uid_elements, "Wing") != wing_hash
+    assert get_component_hash(uid_elements, "Fus") == fuselage_hash
+
+    uid_elements["Fus"].find("length").text = "11"
+    assert get_component_hash(uid_elements, "Fus") != fuselage_hash
+    assert get_component_hash(uid_elements, "Wing", params=(20, 20)) != wing_hash
+
+
+def test_export_component(tmp_path):
+    """Test that a component is exported once and then copied from the cache"""
+
+    uid_elements = {"Wing": ET.fromstring("<wing uID='Wing'/>")}
+    nb_exports = []
+
+    def export_wing(brep_dir):
+        nb_exports.append(brep_dir)
+        Path(brep_dir, "Wing.brep").write_text("wing")
+        Path(brep_dir, "Wing_mirrored.brep").write_text("mirrored wing")
+
+    for brep_dir in [Path(tmp_path, "brep_1"), Path(tmp_path, "brep_2")]:
+        export_component(uid_elements, "Wing", brep_dir, export_wing)
+        assert sorted(file.name for file in brep_dir.iterdir()) == [
+            "Wing.brep",
+            "Wing_mirrored.brep",
+        ]
+
+    assert len(nb_exports) == 1
+
+    # A failed export is not kept in the cache
+    uid_elements["Wing"].set("symmetry", "x-z-plane")
+
+    def export_failed(brep_dir):
+        Path(brep_dir, "missing.brep").read_text()
+
+    with pytest.raises(FileNotFoundError):
+        export_component(uid_elements, "Wing", tmp_path, export_failed)
+
+    assert len(list(exportbrep.BREP_CACHE_PATH.iterdir())) == 1
+
+
+def test_export_brep(monkeypatch, tmp_path):
     """Test function for 'export_brep'"""
 
     if TEST_OUT_PATH.exists():
@@ -63,12 +137,16 @@ def test_export_brep():
     for brep_file in brep_files:
         brep_file.unlink()
 
+    # Export again, without the files of the cache
+    monkeypatch.setattr(exportbrep, "BREP_CACHE_PATH", Path(tmp_path, "empty_cache"))
+
     with pytest.raises(FileNotFoundError):
         with patch("ceasiompy.CPACS2GMSH.func.exportbrep.export_shapes", return_value=True):
             export_brep(cpacs, TEST_OUT_PATH)
 
 
-def test_export_brep_with_engine():
+def test_export_brep_with_engine(monkeypatch, tmp_path):
+    """Test function for 'export_brep' with engines"""
 
     if TEST_OUT_PATH.exists():
         shutil.rmtree(TEST_OUT_PATH)
@@ -94,6 +172,9 @@ def test_export_brep_with_engine():
     for brep_file in brep_files:
         brep_file.unlink()
 
+    # Export again, without the files of the cache
+    monkeypatch.setattr(exportbrep, "BREP_CACHE_PATH", Path(tmp_path, "empty_cache"))
+
     with pytest.raises(FileNotFoundError):
         with patch("ceasiompy.CPACS2GMSH.func.exportbrep.export_shapes", return_value=True):
             export_brep(cpacs, TEST_OUT_PATH)
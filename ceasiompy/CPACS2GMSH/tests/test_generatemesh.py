@@ -19,10 +19,14 @@ import shutil
 from pathlib import Path
 
 import gmsh
+import pytest
+from ceasiompy.CPACS2GMSH.func import exportbrep
 from ceasiompy.CPACS2GMSH.func.exportbrep import export_brep
 from ceasiompy.CPACS2GMSH.func.generategmesh import (
     ModelPart,
     generate_gmsh,
+    process_gmsh_log,
+    write_mesh_timing,
 )
 from ceasiompy.CPACS2GMSH.func.wingclassification import get_entities_from_volume
 from ceasiompy.SU2Run.func.utils import get_mesh_markers
@@ -47,6 +51,13 @@ TEST_OUT_PATH = Path(MODULE_DIR, "ToolOutput")
 # =================================================================================================
 
 
+@pytest.fixture(autouse=True)
+def brep_cache(tmp_path, monkeypatch):
+    """Use an empty BREP cache for each test"""
+
+    monkeypatch.setattr(exportbrep, "BREP_CACHE_PATH", Path(tmp_path, "brep_cache"))
+
+
 def test_generate_gmsh():
     """
     This test try to generate a simple mesh and test if the SU2 markers
@@ -131,6 +142,36 @@ def test_generate_gmsh_symm():
     remove_file_type_in_dir(TEST_OUT_PATH, [".brep", ".su2", ".cfg"])
 
 
+def test_process_gmsh_log(tmp_path):
+    """Test that the time of each meshing stage is read from the gmsh log"""
+
+    gmsh_log = [
+        "Info: Meshing 2D...",
+        "Info: Done meshing 2D (Wall 1.5s, CPU 1.25s)",
+        "Info: 0.90 < quality < 1.00 :       120 elements",
+        "Info: Done meshing 2D (Wall 0.5s, CPU 0.25s)",
+        "Info: Done meshing 3D (Wall 10s, CPU 38.4s)",
+        "Info: Done optimizing mesh (Wall 2.1s, CPU 2.3s)",
+    ]
+
+    stage_times = process_gmsh_log(gmsh_log)
+
+    assert stage_times == {
+        "meshing 2D": (2.0, 1.5),
+        "meshing 3D": (10.0, 38.4),
+        "optimizing mesh": (2.1, 2.3),
+    }
+
+    timing_path = Path(tmp_path, "mesh_timing.csv")
+    write_mesh_timing(stage_times, timing_path)
+    assert timing_path.read_text().splitlines() == [
+        "stage,wall_time,cpu_time",
+        "meshing 2D,2.0,1.5",
+        "meshing 3D,10.0,38.4",
+        "optimizing mesh,2.1,2.3",
+    ]
+
+
 def test_get_entities_from_volume():
     """
     Test on a simple cube if the lower dimensions entities are correctly found.
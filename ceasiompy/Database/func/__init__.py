@@ -61,6 +61,7 @@ TABLE_DICT = {
             deformation TEXT,
             angle REAL,
             su2_file_data BLOB,
+            su2_file_hash TEXT,
         """
     ],
     f"{DYNSTAB_NAME}": [
@@ -92,6 +93,26 @@ TABLE_DICT = {
 
 ALLOWED_TABLES = [value[0] for value in TABLE_DICT.values()]
 
+# Columns identifying a row of each table (unique index)
+TABLE_KEYS = {
+    "avl_data": [
+        "aircraft", "alt", "mach", "alpha", "beta",
+        "pb_2V", "qc_2V", "rb_2V",
+        "flap", "aileron", "elevator", "rudder",
+        "xref", "yref", "zref",
+    ],
+    "gmsh_data": ["aircraft", "deformation", "angle"],
+    "derivatives_data": [
+        "aircraft", "method", "chord", "span", "mach", "x_ref", "y_ref", "z_ref",
+    ],
+}
+
+# Keys which are NULL when not used (no control surface deflection). NULL values are all
+# distinct in a unique index, these keys are indexed as IFNULL(key, 0) instead.
+TABLE_NULLABLE_KEYS = {
+    "avl_data": ["flap", "aileron", "elevator", "rudder"],
+}
+
 TABLE_TO_MODULE = {item[0]: key for key, item in TABLE_DICT.items()}
 
 ALLOWED_COLUMNS = {
@@ -142,6 +163,11 @@ PYAVL_ST = {
 # pyavl.py
 PYAVL_CTRLSURF = ["flap", "aileron", "elevator", "rudder"]
 
+# Compressed files (meshes), stored once by hash and referenced by the other tables
+FILE_CHUNKS_TABLE = "file_chunks"
+FILE_CHUNK_SIZE = 4 * 1024**2  # [bytes]
+FILE_COMPRESSION_LEVEL = 6
+
 
 # ==============================================================================
 #    MAIN
@@ -15,20 +15,61 @@ Store data from workflow modules.
 #   IMPORTS
 # ==============================================================================
 
-from ceasiompy.Database.func.utils import data_to_db
 from ceasiompy.utils.ceasiompyutils import aircraft_name
-
+from ceasiompy.Database.func.utils import (
+    file_to_db,
+    stream_to_db,
+    data_list_to_db,
+    create_file_chunks_table,
+)
+
+from io import BytesIO
 from pathlib import Path
 from sqlite3 import Cursor
 from tixi3.tixi3wrapper import Tixi3
 
 from ceasiompy import log
+from ceasiompy.Database.func import FILE_CHUNKS_TABLE
 
 # ==============================================================================
 #   FUNCTIONS
 # ==============================================================================
 
 
+def compress_stored_su2_data(cursor: Cursor) -> None:
+    """
+    Move the uncompressed meshes stored by older versions to the file chunks table.
+    """
+
+    cursor.execute(
+        "SELECT id FROM gmsh_data WHERE su2_file_data IS NOT NULL AND su2_file_hash IS NULL"
+    )
+    row_ids = [row[0] for row in cursor.fetchall()]
+
+    if row_ids:
+        log.info(f"Compressing {len(row_ids)} mesh(es) stored in gmsh_data.")
+
+    # One mesh in memory at a time
+    for row_id in row_ids:
+        cursor.execute("SELECT su2_file_data FROM gmsh_data WHERE id = ?", (row_id,))
+        file_hash = stream_to_db(cursor, BytesIO(cursor.fetchone()[0]))
+        cursor.execute(
+            "UPDATE gmsh_data SET su2_file_hash = ?, su2_file_data = NULL WHERE id = ?",
+            (file_hash, row_id),
+        )
+
+
+def remove_unused_su2_data(cursor: Cursor) -> None:
+    """
+    Remove the meshes which are not referenced in gmsh_data anymore.
+    """
+
+    cursor.execute(
+        f"DELETE FROM {FILE_CHUNKS_TABLE} WHERE hash NOT IN "
+        "(SELECT su2_file_hash FROM gmsh_data WHERE su2_file_hash IS NOT NULL)"
+    )
+
+
 def store_cpacs2gmsh_data(
     cursor: Cursor,
     wkdir: Path,
@@ -48,6 +89,10 @@ def store_cpacs2gmsh_data(
     files_list = list(wkdir.glob("*.su2"))
 
     name = str(aircraft_name(tixi))
+    data_list = []
+
+    create_file_chunks_table(cursor)
+    compress_stored_su2_data(cursor)
 
     for file in sorted(files_list):
         file_name = str(file.name)
@@ -66,16 +111,17 @@ def store_cpacs2gmsh_data(
             f"angle={angle}."
         )
 
-        with open(file, 'rb') as file:
-            file_data = file.read()
-            data = {
-                "su2_file_data": file_data,
-                "aircraft": name,
-                "deformation": deformation,
-                "angle": angle,
-            }
-
-            data_to_db(cursor, data, table_name)
+        # Identical meshes are stored only once
+        data_list.append({
+            "su2_file_hash": file_to_db(cursor, file),
+            "aircraft": name,
+            "deformation": deformation,
+            "angle": angle,
+        })
+
+    # The last mesh of an aircraft, deformation and angle replaces the previous one
+    data_list_to_db(cursor, data_list, table_name)
+    remove_unused_su2_data(cursor)
 
 # ==============================================================================
 #    MAIN
@@ -18,7 +18,7 @@ Store data from workflow modules.
 import pandas as pd
 
 from cpacspy.cpacsfunctions import get_value
-from ceasiompy.Database.func.utils import data_to_db
+from ceasiompy.Database.func.utils import data_list_to_db
 from ceasiompy.utils.ceasiompyutils import aircraft_name
 
 from pathlib import Path
@@ -76,27 +76,19 @@ def store_dynstab_data(
         span = get_value(tixi, DYNAMICSTABILITY_NSPANWISE_XPATH)
         method = "DLM"
 
-        # Iterate over the rows of the DataFrame
-        for _, row in df.iterrows():
-            # Populate the data dictionary with the values from the DataFrame row
-            data = {
-                "aircraft": name,
-                "method": method,
-                "chord": chord,
-                "span": span,
-                "mach": row['mach'],
-                "x_ref": row['x_ref'],
-                "y_ref": row['y_ref'],
-                "z_ref": row['z_ref'],
-                "cm_alphaprim": row['cm_alphaprim'],
-                "cz_alphaprim": row['cz_alphaprim'],
-                "cx_alphaprim": row['cx_alphaprim'],
-                "cy_betaprim": row['cy_betaprim'],
-                "cl_betaprim": row['cl_betaprim'],
-                "cn_betaprim": row['cn_betaprim'],
-            }
-
-            data_to_db(cursor, data, table_name)
+        columns = [
+            "mach", "x_ref", "y_ref", "z_ref",
+            "cm_alphaprim", "cz_alphaprim", "cx_alphaprim",
+            "cy_betaprim", "cl_betaprim", "cn_betaprim",
+        ]
+
+        # One line per row of the DataFrame
+        data_list = [
+            {"aircraft": name, "method": method, "chord": chord, "span": span, **row}
+            for row in df[columns].to_dict(orient="records")
+        ]
+
+        data_list_to_db(cursor, data_list, table_name)
 
 # ==============================================================================
 #    MAIN
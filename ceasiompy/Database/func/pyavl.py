@@ -18,8 +18,8 @@ Store data from workflow modules.
 from ceasiompy.utils.ceasiompyutils import aircraft_name
 
 from ceasiompy.Database.func.utils import (
-    data_to_db,
     split_line,
+    data_list_to_db,
 )
 
 from typing import Dict
@@ -107,6 +107,7 @@ def store_pyavl_data(
     case_dir_list = [case_dir for case_dir in wkdir.iterdir() if "Case" in case_dir.name]
     txt_file_name = "st.txt"
     name = str(aircraft_name(tixi))
+    data_list = []
 
     for config_dir in sorted(case_dir_list):
         # Checks if config_dir is a directory
@@ -124,8 +125,9 @@ def store_pyavl_data(
         data = get_avl_data(file_path)
         data["aircraft"] = name
         data["alt"] = alt
+        data_list.append(data)
 
-        data_to_db(cursor, data, table_name)
+    data_list_to_db(cursor, data_list, table_name)
 
 # ==============================================================================
 #    MAIN
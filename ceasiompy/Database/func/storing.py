@@ -15,7 +15,12 @@ Store data from workflow modules.
 #   IMPORTS
 # ==============================================================================
 
+import os
+import atexit
+import threading
+
 from sqlite3 import connect
+from sqlite3 import IntegrityError
 from ceasiompy.Database.func.utils import create_db
 from ceasiompy.Database.func.pyavl import store_pyavl_data
 from ceasiompy.Database.func.su2run import store_su2run_data
@@ -29,6 +34,7 @@ from sqlite3 import Connection
 from tixi3.tixi3wrapper import Tixi3
 
 from typing import (
+    Dict,
     List,
     Tuple,
     Callable,
@@ -41,7 +47,21 @@ from ceasiompy.utils.commonpaths import CEASIOMPY_DB_PATH
 from ceasiompy.CPACS2GMSH import MODULE_NAME as CPACS2GMSH_NAME
 from ceasiompy.DynamicStability import MODULE_NAME as DYNSTAB_NAME
 
-from ceasiompy.Database.func import TABLE_DICT, ALLOWED_TABLES, ALLOWED_COLUMNS
+from ceasiompy.Database.func import (
+    TABLE_DICT,
+    TABLE_KEYS,
+    ALLOWED_TABLES,
+    ALLOWED_COLUMNS,
+    TABLE_NULLABLE_KEYS,
+)
+
+# ==============================================================================
+#   CONSTANTS
+# ==============================================================================
+
+# Open connections, by process id, thread id and database path
+DB_CONNECTIONS: Dict[Tuple[int, int, Path], Connection] = {}
+DB_CONNECTIONS_LOCK = threading.Lock()
 
 # ==============================================================================
 #   CLASS
@@ -59,16 +79,10 @@ class CeasiompyDb:
         self.db_path = db_path
         self.db_name = self.db_path.name
 
-        # Create db if not exists
-        if not self.db_path.exists():
-            create_db(self.db_path)
-
-        self.connection: Connection = connect(self.db_path)
+        # Connect to db, created if not exists
+        self.connection: Connection = get_db_connection(self.db_path)
         self.cursor: Cursor = self.connection.cursor()
 
-        log.info(
-            f"Connecting to database {self.db_name} at path {self.db_path}")
-
     def connect_to_table(self, module_name: str) -> str:
         table_name, table_schema = self.get_table_parameters(module_name)
         # Codacy: Table and column names are strictly validated against whitelisted values.
@@ -87,10 +101,64 @@ class CeasiompyDb:
         """
 
         self.cursor.execute(create_table_query)
+        self.add_missing_columns(table_name, table_schema)
+        self.create_table_index(table_name)
         self.commit()
 
         return table_name
 
+    def add_missing_columns(self, table_name: str, table_schema: str) -> None:
+        """
+        Add the columns of the schema missing in a table created by an older version.
+        """
+
+        self.cursor.execute(f"PRAGMA table_info({table_name})")
+        columns = [column[1] for column in self.cursor.fetchall()]
+
+        for line in table_schema.splitlines():
+            if not line.strip():
+                continue
+            column, column_type = line.strip().rstrip(",").split()[:2]
+            if column not in columns:
+                log.info(f"Adding column {column} to table {table_name}.")
+                self.cursor.execute(
+                    f"ALTER TABLE {table_name} ADD COLUMN {column} {column_type}"  # nosec
+                )
+
+    def create_table_index(self, table_name: str) -> None:
+        """
+        Create the unique index on the keys of a table. The index is not created if lines
+        with the same keys were stored before it existed, these lines are kept.
+        An index created by an older version with other keys is replaced.
+        """
+
+        nullable_keys = TABLE_NULLABLE_KEYS.get(table_name, [])
+        keys_str = ", ".join(
+            f'IFNULL("{col}", 0)' if col in nullable_keys else f'"{col}"'
+            for col in TABLE_KEYS[table_name]
+        )
+        index_name = f"{table_name}_keys"
+
+        self.cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?", (index_name,)
+        )
+        index_sql = self.cursor.fetchone()
+        if index_sql is not None and not index_sql[0].strip().endswith(f"({keys_str})"):
+            self.cursor.execute(f"DROP INDEX {index_name}")
+
+        create_index_query = f"""
+            CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table_name} ({keys_str})
+        """  # nosec
+
+        try:
+            self.cursor.execute(create_index_query)
+        except IntegrityError:
+            log.warning(
+                f"Table {table_name} has lines with the same keys, new lines are added "
+                "without replacing the previous ones. Remove the duplicated lines to "
+                "create the unique index."
+            )
+
     def get_table_name(self, module_name: str) -> str:
         return self.table_dict[module_name][0]
 
@@ -104,8 +172,13 @@ class CeasiompyDb:
         self.connection.commit()
 
     def close(self) -> None:
-        log.info(f"Closing connection to database {self.db_name}.")
-        self.connection.close()
+        """
+        Commit and release the cursor. The connection is owned by the connections of
+        'get_db_connection', it stays open for the next session of the same thread and
+        is closed at the end of the process.
+        """
+        self.commit()
+        self.cursor.close()
 
     def get_data(
         self,
@@ -155,6 +228,64 @@ class CeasiompyDb:
 # ==============================================================================
 
 
+def get_db_connection(db_path: Path) -> Connection:
+    """
+    Returns the connection of the current thread to a database. Each thread has its own
+    connection, and therefore its own transaction, which is opened once and kept until
+    the end of the thread (closed by the next call of another thread) or of the process.
+    """
+
+    key = (os.getpid(), threading.get_ident(), Path(db_path).resolve())
+
+    with DB_CONNECTIONS_LOCK:
+        close_dead_thread_connections()
+        connection = DB_CONNECTIONS.get(key)
+
+        # Database file removed since the connection was opened
+        if connection is not None and not db_path.exists():
+            connection.close()
+            connection = None
+
+        if connection is None:
+            if not db_path.exists():
+                create_db(db_path)
+
+            # Closed by 'close_db_connections' from the main thread at exit
+            connection = connect(db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            DB_CONNECTIONS[key] = connection
+
+            log.info(f"Connecting to database {db_path.name} at path {db_path}")
+
+    return connection
+
+
+def close_dead_thread_connections() -> None:
+    """
+    Close the connections of the threads of this process which have ended.
+    To be called with DB_CONNECTIONS_LOCK acquired.
+    """
+
+    alive_threads = {thread.ident for thread in threading.enumerate()}
+    for key in [
+        key for key in DB_CONNECTIONS
+        if key[0] == os.getpid() and key[1] not in alive_threads
+    ]:
+        DB_CONNECTIONS.pop(key).close()
+
+
+@atexit.register
+def close_db_connections() -> None:
+    """
+    Close the connections opened by this process.
+    """
+
+    with DB_CONNECTIONS_LOCK:
+        for key in [key for key in DB_CONNECTIONS if key[0] == os.getpid()]:
+            DB_CONNECTIONS.pop(key).close()
+
+
 def call_store_data(
     tixi: Tixi3,
     store2db: Callable[[Cursor, Path, Tixi3, str], None],
@@ -169,12 +300,15 @@ def call_store_data(
     ceasiompy_db = CeasiompyDb()
     table_name = ceasiompy_db.connect_to_table(module_name)
 
-    # Store data
-    store2db(ceasiompy_db.cursor, wkdir, tixi, table_name)
+    # Store data in one transaction
+    try:
+        store2db(ceasiompy_db.cursor, wkdir, tixi, table_name)
+    except Exception:
+        ceasiompy_db.connection.rollback()
+        raise
     log.info(f"Finished storing data in table {table_name}.")
 
-    # Commit changes and close the connection
-    ceasiompy_db.commit()
+    # Commit changes and close the session
     ceasiompy_db.close()
 
 
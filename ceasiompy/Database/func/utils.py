@@ -15,7 +15,9 @@ Utils for Database module.
 #   IMPORTS
 # ==============================================================================
 
+import zlib
 import sqlite3
+import hashlib
 
 from pathlib import Path
 from sqlite3 import Cursor
@@ -23,6 +25,7 @@ from sqlite3 import Cursor
 from typing import (
     List,
     Dict,
+    BinaryIO,
 )
 
 from ceasiompy import log
@@ -31,6 +34,9 @@ from ceasiompy.utils.commonpaths import CEASIOMPY_DB_PATH
 from ceasiompy.Database.func import (
     ALLOWED_TABLES,
     ALLOWED_COLUMNS,
+    FILE_CHUNK_SIZE,
+    FILE_CHUNKS_TABLE,
+    FILE_COMPRESSION_LEVEL,
 )
 
 # ==============================================================================
@@ -61,35 +67,34 @@ def create_db(path: Path = CEASIOMPY_DB_PATH) -> None:
     log.info(f"Database created at {path}.")
 
 
-def check_in_table(cursor: Cursor, data: Dict, columns: List, table_name: str) -> bool:
+def data_to_db(cursor: Cursor, data: Dict, table_name: str) -> None:
     """
-    Checks if data is already in the table using a raw cursor.
+    Inserts one line, which replaces the line with the same keys if already in table.
     """
-    # Codacy: Table and column names are strictly validated against whitelisted values.
-    # Validate table name
-    if table_name not in ALLOWED_TABLES:
-        raise ValueError(f"Invalid table name: {table_name}")
-
-    # Validate column names
-    if not all(col in ALLOWED_COLUMNS[table_name] for col in columns):
-        raise ValueError(f"Invalid column name(s): {columns}")
+    data_list_to_db(cursor, [data], table_name)
 
-    # Build the WHERE clause dynamically
-    where_clause = " AND ".join([f"{col} = ?" for col in columns])
-    query = f"SELECT 1 FROM {table_name} WHERE {where_clause} LIMIT 1"  # nosec
-    params = tuple(data[col] for col in columns)
 
-    cursor.execute(query, params)
-    return cursor.fetchone() is not None
+def data_list_to_db(
+    cursor: Cursor,
+    data_list: List[Dict],
+    table_name: str,
+) -> None:
+    """
+    Inserts several lines in one statement. Lines with the same keys (TABLE_KEYS) as a line
+    already in the table replace it, as the newest results are the ones read back.
 
+    Args:
+        cursor (Cursor): Cursor of the database.
+        data_list (List[Dict]): Lines to insert, all with the same columns.
+        table_name (str): Name of the table.
 
-def data_to_db(cursor: Cursor, data: Dict, table_name: str) -> None:
-    """
-    Inserts one line at a time if not already in table.
     """
 
+    if not data_list:
+        return
+
     # Table names are validated against ALLOWED_TABLES.
-    columns = list(data.keys())
+    columns = list(data_list[0].keys())
 
     # Validate table name
     if table_name not in ALLOWED_TABLES:
@@ -100,27 +105,114 @@ def data_to_db(cursor: Cursor, data: Dict, table_name: str) -> None:
     if invalid_columns:
         raise ValueError(f"Invalid column name(s): {invalid_columns}")
 
-    if check_in_table(cursor, data, columns, table_name):
-        log.info(f"{data.values()} already in {table_name}.")
-    else:
-        # Safely escape table and column names
-        escaped_table_name = f'"{table_name}"'
-        escaped_columns = ", ".join(f'"{col}"' for col in columns)
-
-        # Create the SQL statement dynamically
-        placeholders = ", ".join(["?" for _ in columns])
-
-        # Codacy: Table and column names are strictly validated against whitelisted values.
-        query = f"""
-                    INSERT INTO {escaped_table_name} (
-                        {escaped_columns}
-                    ) VALUES (
-                        {placeholders}
-                    )
-                """  # nosec
-
-        # Execute the statement with values
-        cursor.execute(query, tuple(data.values()))
+    # Safely escape table and column names
+    escaped_table_name = f'"{table_name}"'
+    escaped_columns = ", ".join(f'"{col}"' for col in columns)
+
+    # Create the SQL statement dynamically
+    placeholders = ", ".join(["?" for _ in columns])
+
+    # Codacy: Table and column names are strictly validated against whitelisted values.
+    query = f"""
+                INSERT OR REPLACE INTO {escaped_table_name} (
+                    {escaped_columns}
+                ) VALUES (
+                    {placeholders}
+                )
+            """  # nosec
+
+    # Execute the statement with values
+    cursor.executemany(query, [tuple(data[col] for col in columns) for data in data_list])
+
+
+def create_file_chunks_table(cursor: Cursor) -> None:
+    """
+    Creates the table of compressed file chunks if it does not exist.
+    """
+
+    cursor.execute(
+        f"""
+            CREATE TABLE IF NOT EXISTS {FILE_CHUNKS_TABLE} (
+                hash TEXT NOT NULL,
+                chunk INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (hash, chunk)
+            )
+        """
+    )
+
+
+def stream_to_db(cursor: Cursor, stream: BinaryIO) -> str:
+    """
+    Stores the content of a binary stream as zlib compressed chunks, once per content.
+
+    Args:
+        cursor (Cursor): Cursor of the database.
+        stream (BinaryIO): Seekable binary stream, read twice (hash and compression).
+
+    Returns:
+        file_hash (str): SHA256 of the content, used to retrieve it.
+
+    """
+
+    sha = hashlib.sha256()
+    for data in iter(lambda: stream.read(FILE_CHUNK_SIZE), b""):
+        sha.update(data)
+    file_hash = sha.hexdigest()
+
+    create_file_chunks_table(cursor)
+    cursor.execute(f"SELECT 1 FROM {FILE_CHUNKS_TABLE} WHERE hash = ? LIMIT 1", (file_hash,))
+    if cursor.fetchone() is not None:
+        log.info(f"File {file_hash[:12]} already in {FILE_CHUNKS_TABLE}.")
+        return file_hash
+
+    query = f"INSERT INTO {FILE_CHUNKS_TABLE} (hash, chunk, data) VALUES (?, ?, ?)"
+    compressor = zlib.compressobj(FILE_COMPRESSION_LEVEL)
+    chunk = 0
+    buffer = b""
+
+    stream.seek(0)
+    for data in iter(lambda: stream.read(FILE_CHUNK_SIZE), b""):
+        buffer += compressor.compress(data)
+        if len(buffer) >= FILE_CHUNK_SIZE:
+            cursor.execute(query, (file_hash, chunk, buffer))
+            chunk += 1
+            buffer = b""
+
+    cursor.execute(query, (file_hash, chunk, buffer + compressor.flush()))
+
+    return file_hash
+
+
+def file_to_db(cursor: Cursor, file_path: Path) -> str:
+    """
+    Stores a file as zlib compressed chunks, once per content. Returns its hash.
+    """
+
+    with open(file_path, "rb") as f:
+        return stream_to_db(cursor, f)
+
+
+def db_to_file(cursor: Cursor, file_hash: str, file_path: Path) -> None:
+    """
+    Writes a file stored with 'file_to_db', decompressing one chunk at a time.
+    """
+
+    cursor.execute(
+        f"SELECT data FROM {FILE_CHUNKS_TABLE} WHERE hash = ? ORDER BY chunk", (file_hash,)
+    )
+
+    decompressor = zlib.decompressobj()
+    nb_chunks = 0
+
+    with open(file_path, "wb") as f:
+        for (data,) in cursor:
+            f.write(decompressor.decompress(data))
+            nb_chunks += 1
+        f.write(decompressor.flush())
+
+    if not nb_chunks:
+        raise ValueError(f"File {file_hash} has not been found in {FILE_CHUNKS_TABLE}.")
 
 
 # ==============================================================================
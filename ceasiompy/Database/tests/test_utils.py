@@ -19,16 +19,23 @@ from ceasiompy.utils.decorators import log_test
 
 from ceasiompy.Database.func.utils import (
     create_db,
+    db_to_file,
+    file_to_db,
     data_to_db,
+    data_list_to_db,
 )
 
 from pathlib import Path
+from sqlite3 import connect
+from threading import Thread
+from tempfile import TemporaryDirectory
 from unittest import main
-from ceasiompy.Database.func.storing import CeasiompyDb
+from ceasiompy.Database.func.storing import CeasiompyDb, close_db_connections
 from ceasiompy.utils.ceasiompytest import CeasiompyTest
 
 from ceasiompy import log
 from ceasiompy.PyAVL import MODULE_NAME as PYAVL_NAME
+from ceasiompy.DynamicStability import MODULE_NAME as DYNSTAB_NAME
 from ceasiompy.utils.commonpaths import TESTCEASIOMPY_DB_PATH
 
 # =================================================================================================
@@ -76,6 +83,145 @@ class TestDatabase(CeasiompyTest):
         testceasiompy_db.commit()
         testceasiompy_db.close()
 
+    @log_test
+    def test_data_list_to_db(self: 'TestDatabase') -> None:
+        module_name = DYNSTAB_NAME
+        data_list = [
+            {
+                "aircraft": "test_aircraft", "method": "DLM", "chord": 4, "span": 8,
+                "mach": mach, "x_ref": 0.0, "y_ref": 0.0, "z_ref": 0.0,
+                "cm_alphaprim": 1.0, "cz_alphaprim": 1.0, "cx_alphaprim": 1.0,
+                "cy_betaprim": 1.0, "cl_betaprim": 1.0, "cn_betaprim": 1.0,
+            }
+            for mach in [0.1, 0.2, 0.3]
+        ]
+
+        testceasiompy_db = CeasiompyDb(db_path=self.testceasiompy_db_path)
+        table_name = testceasiompy_db.connect_to_table(module_name)
+        testceasiompy_db.cursor.execute(f"DELETE FROM {table_name}")
+
+        # Lines with the same keys are only stored once, the newest results are kept
+        data_list_to_db(testceasiompy_db.cursor, data_list, table_name)
+        for data in data_list[1:]:
+            data["cm_alphaprim"] = 2.0
+        data_list_to_db(testceasiompy_db.cursor, data_list[1:], table_name)
+
+        data = testceasiompy_db.get_data(table_name, ["mach", "cm_alphaprim"])
+        self.assertEqual(sorted(data), [(0.1, 1.0), (0.2, 2.0), (0.3, 2.0)])
+
+        # Same connection for all sessions on the same database
+        self.assertIs(
+            CeasiompyDb(db_path=self.testceasiompy_db_path).connection,
+            testceasiompy_db.connection,
+        )
+
+        testceasiompy_db.close()
+
+    @log_test
+    def test_create_table_index(self: 'TestDatabase') -> None:
+        data = {
+            "aircraft": "test_aircraft", "method": "DLM", "chord": 4, "span": 8,
+            "mach": 0.1, "x_ref": 0.0, "y_ref": 0.0, "z_ref": 0.0,
+        }
+
+        with TemporaryDirectory() as tmp_dir:
+            test_db = CeasiompyDb(db_path=Path(tmp_dir, "test.db"))
+            table_name = test_db.connect_to_table(DYNSTAB_NAME)
+
+            # Lines with the same keys stored before the index existed
+            test_db.cursor.execute(f"DROP INDEX {table_name}_keys")
+            data_list_to_db(test_db.cursor, [data, data], table_name)
+
+            # The lines are not removed
+            test_db.connect_to_table(DYNSTAB_NAME)
+            self.assertEqual(len(test_db.get_data(table_name, ["mach"])), 2)
+
+            test_db.close()
+            close_db_connections()
+
+    @log_test
+    def test_data_to_db_no_deflection(self: 'TestDatabase') -> None:
+        data = {
+            "aircraft": "test_aircraft", "alt": 0.0, "mach": 0.3, "alpha": 2.0, "beta": 0.0,
+            "pb_2V": 0.0, "qc_2V": 0.0, "rb_2V": 0.0,
+            "flap": None, "aileron": None, "elevator": None, "rudder": None,
+            "xref": 0.0, "yref": 0.0, "zref": 0.0, "cl": 0.1,
+        }
+
+        with TemporaryDirectory() as tmp_dir:
+            test_db = CeasiompyDb(db_path=Path(tmp_dir, "test.db"))
+            table_name = test_db.connect_to_table(PYAVL_NAME)
+
+            # Same case without control surface deflection, the newest line is kept
+            data_to_db(test_db.cursor, data, table_name)
+            data_to_db(test_db.cursor, {**data, "cl": 0.2}, table_name)
+            self.assertEqual(test_db.get_data(table_name, ["cl"]), [(0.2,)])
+
+            test_db.close()
+            close_db_connections()
+
+    @log_test
+    def test_thread_connections(self: 'TestDatabase') -> None:
+        data = {
+            "aircraft": "test_aircraft", "method": "DLM", "chord": 4, "span": 8,
+            "mach": 0.1, "x_ref": 0.0, "y_ref": 0.0, "z_ref": 0.0,
+        }
+
+        with TemporaryDirectory() as tmp_dir:
+            db_path = Path(tmp_dir, "test.db")
+            test_db = CeasiompyDb(db_path=db_path)
+            table_name = test_db.connect_to_table(DYNSTAB_NAME)
+
+            # Not committed yet
+            data_to_db(test_db.cursor, data, table_name)
+
+            thread_data = {}
+
+            def read_in_thread():
+                thread_db = CeasiompyDb(db_path=db_path)
+                thread_data["connection"] = thread_db.connection
+                thread_data["lines"] = thread_db.get_data(table_name, ["mach"])
+                thread_db.connection.rollback()
+
+            thread = Thread(target=read_in_thread)
+            thread.start()
+            thread.join()
+
+            # Other threads have their own transaction
+            self.assertIsNot(thread_data["connection"], test_db.connection)
+            self.assertEqual(thread_data["lines"], [])
+
+            test_db.close()
+            test_db = CeasiompyDb(db_path=db_path)
+            self.assertEqual(test_db.get_data(table_name, ["mach"]), [(0.1,)])
+
+            test_db.close()
+            close_db_connections()
+
+    @log_test
+    def test_file_to_db(self: 'TestDatabase') -> None:
+        cursor = connect(":memory:").cursor()
+
+        with TemporaryDirectory() as tmp_dir:
+            su2_path = Path(tmp_dir, "mesh.su2")
+            su2_path.write_bytes(b"NDIME= 3\n" + b"0.0 1.0 2.0 0\n" * 10000)
+
+            file_hash = file_to_db(cursor, su2_path)
+
+            # Identical files are stored once
+            self.assertEqual(file_to_db(cursor, su2_path), file_hash)
+            cursor.execute("SELECT COUNT(DISTINCT hash), SUM(LENGTH(data)) FROM file_chunks")
+            nb_files, size = cursor.fetchone()
+            self.assertEqual(nb_files, 1)
+            self.assertLess(size, su2_path.stat().st_size)
+
+            out_path = Path(tmp_dir, "out.su2")
+            db_to_file(cursor, file_hash, out_path)
+            self.assertEqual(out_path.read_bytes(), su2_path.read_bytes())
+
+            with self.assertRaises(ValueError):
+                db_to_file(cursor, "unknown", out_path)
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
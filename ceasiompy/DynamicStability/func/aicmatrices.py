@@ -0,0 +1,150 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+AIC matrices of PanelAero's Doublet Lattice Method.
+
+The matrices are saved as .npy files shared by all workflows, named after a hash of the
+aerogrid, the Mach number and the reduced frequency. They are loaded memory-mapped, so a
+matrix already computed for the same panel grid is never computed again. The missing
+matrices are computed in parallel processes.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import os
+import hashlib
+
+import numpy as np
+
+from pathlib import Path
+from panelaero import DLM
+from numpy import ndarray
+from concurrent.futures import ProcessPoolExecutor
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.commonpaths import AIC_MATRICES_PATH
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_aerogrid_hash(aerogrid: Dict) -> str:
+    """
+    Returns a hash of the panels of a PanelAero aerogrid.
+    """
+
+    sha = hashlib.sha256()
+    for key in sorted(aerogrid):
+        value = aerogrid[key]
+        sha.update(key.encode())
+        if isinstance(value, ndarray):
+            sha.update(str((value.dtype, value.shape)).encode())
+            sha.update(np.ascontiguousarray(value).tobytes())
+        else:
+            sha.update(repr(value).encode())
+
+    return sha.hexdigest()
+
+
+def get_aic_path(grid_hash: str, mach: float, k: float) -> Path:
+    """
+    Returns the path of the AIC matrix of an aerogrid for a Mach number and a reduced frequency.
+    """
+
+    return Path(AIC_MATRICES_PATH, f"{grid_hash[:16]}_M{float(mach)!r}_k{float(k)!r}.npy")
+
+
+def compute_aic_matrix(aerogrid: Dict, aic_path: Path, mach: float, k: float) -> Path:
+    """
+    Compute an AIC matrix with PanelAero's Doublet Lattice Method and save it.
+
+    Args:
+        aerogrid (Dict): PanelAero aerogrid.
+        aic_path (Path): Path of the .npy file.
+        mach (float): Mach number.
+        k (float): Reduced frequency (omega / velocity).
+
+    Returns:
+        aic_path (Path): Path of the .npy file.
+
+    """
+
+    q_jj = DLM.calc_Qjj(aerogrid, Ma=mach, k=k)
+
+    aic_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = aic_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as tmp_file:
+        np.save(tmp_file, q_jj)
+    os.replace(tmp_path, aic_path)
+
+    return aic_path
+
+
+def get_aic_matrices(
+    aerogrid: Dict,
+    cases: List[Tuple[float, float]],
+    nb_proc: int = 1,
+) -> Dict[Tuple[float, float], ndarray]:
+    """
+    Returns the AIC matrices of an aerogrid, loaded from the saved files. Missing
+    matrices are computed first, in parallel processes.
+
+    Args:
+        aerogrid (Dict): PanelAero aerogrid.
+        cases (List[Tuple[float, float]]): Mach number and reduced frequency of each matrix.
+        nb_proc (int): Number of processes used to compute the missing matrices.
+
+    Returns:
+        (Dict[Tuple[float, float], ndarray]): Memory-mapped AIC matrices, by (mach, k).
+
+    """
+
+    grid_hash = get_aerogrid_hash(aerogrid)
+    aic_paths = {case: get_aic_path(grid_hash, *case) for case in dict.fromkeys(cases)}
+    missing = [case for case, aic_path in aic_paths.items() if not aic_path.exists()]
+
+    log.info(
+        f"{len(aic_paths) - len(missing)} AIC matrices loaded from {AIC_MATRICES_PATH}, "
+        f"{len(missing)} to compute."
+    )
+
+    nb_proc = max(1, min(int(nb_proc), len(missing)))
+
+    if nb_proc == 1:
+        for mach, k in missing:
+            log.info(f"--- Computing AIC Matrix for mach: {mach}, k: {k} ---")
+            compute_aic_matrix(aerogrid, aic_paths[(mach, k)], mach, k)
+    else:
+        log.info(f"Computing {len(missing)} AIC matrices on {nb_proc} processes.")
+        with ProcessPoolExecutor(max_workers=nb_proc) as executor:
+            futures = [
+                executor.submit(compute_aic_matrix, aerogrid, aic_paths[(mach, k)], mach, k)
+                for mach, k in missing
+            ]
+            for future in futures:
+                future.result()
+
+    return {case: np.load(aic_path, mmap_mode="r") for case, aic_path in aic_paths.items()}
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
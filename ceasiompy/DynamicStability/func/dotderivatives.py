@@ -38,10 +38,11 @@ from ceasiompy.DynamicStability.func.utils import (
     complex_decomposition,
 )
 
-from panelaero import DLM
 from numpy import ndarray
 from pandas import DataFrame
 from ceasiompy.Database.func.storing import CeasiompyDb
+from ceasiompy.utils.ceasiompyutils import get_reasonable_nb_cpu
+from ceasiompy.DynamicStability.func.aicmatrices import get_aic_matrices
 
 from ceasiompy.DynamicStability.func.panelaeroconfig import (
     AeroModel,
@@ -573,12 +574,16 @@ def compute_dot_derivatives(self) -> DataFrame:
 
     log.info(f"--- Computing AIC Matrices for machs in {mach_list} ---")
 
-    for mach in mach_list:
-        log.info(f"--- Computing AIC Matrix for mach: {mach} ---")
+    # AIC Matrices np.identity(model.aerogrid['n']), shared when k_alpha = k_beta
+    aic_matrices = get_aic_matrices(
+        aerogrid,
+        cases=[(mach, k) for mach in mach_list for k in (k_alpha_model, k_beta_model)],
+        nb_proc=get_reasonable_nb_cpu(),
+    )
 
-        # AIC Matrix np.identity(model.aerogrid['n'])
-        q_alpha_jj = DLM.calc_Qjj(aerogrid, Ma=mach, k=k_alpha_model)
-        q_beta_jj = DLM.calc_Qjj(aerogrid, Ma=mach, k=k_beta_model)
+    for mach in mach_list:
+        q_alpha_jj = aic_matrices[(mach, k_alpha_model)]
+        q_beta_jj = aic_matrices[(mach, k_beta_model)]
 
         # Get angular frequencies
         omegaalpha, omegabeta, q_dyn = compute_velocity_attributes(
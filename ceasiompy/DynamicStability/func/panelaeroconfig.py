@@ -33,6 +33,35 @@ if os.environ.get('DISPLAY', '') == '':
 else:
     matplotlib.use('TkAgg')
 
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_grid_indices(grid_ids: np.ndarray, cornerpoints: np.ndarray) -> np.ndarray:
+    """
+    Returns the indices in 'grid_ids' of the grid IDs of 'cornerpoints'.
+
+    Args:
+        grid_ids (np.ndarray): IDs of the grid points (m, ).
+        cornerpoints (np.ndarray): Grid IDs of the corner points of each panel (n, 4).
+
+    Returns:
+        (np.ndarray): Indices of the corner points in the grid (n, 4).
+
+    """
+
+    order = np.argsort(grid_ids, kind='stable')
+    positions = np.searchsorted(grid_ids[order], cornerpoints)
+    positions = np.minimum(positions, len(grid_ids) - 1)
+    indices = order[positions]
+
+    if not np.array_equal(grid_ids[indices], cornerpoints):
+        raise ValueError("Corner points of the panels are missing in the aerogrid.")
+
+    return indices
+
+
 # =================================================================================================
 #   CLASSES
 # =================================================================================================
@@ -46,61 +75,6 @@ class AeroModel():
 
     def build_aerogrid(self):
         caero_grid, caero_panels, caerocards = self.read_CAERO(0)
-        ID = []
-        length = []  # length of panel
-        A = []  # area of one panel
-        N = []  # unit normal vector
-        offset_l = []  # 25% point l
-        offset_k = []  # 50% point k
-        offset_j = []  # 75% downwash control point j
-        offset_P1 = []  # Vortex point at 25% chord, 0% span
-        offset_P3 = []  # Vortex point at 25% chord, 100% span
-        r = []  # vector P1 to P3, span of panel
-
-        for i_panel in range(len(caero_panels['ID'])):
-
-            #
-            #                   l_2
-            #             4 o---------o 3
-            #               |         |
-            #  u -->    b_1 | l  k  j | b_2
-            #               |         |
-            #             1 o---------o 2
-            #         y         l_1
-            #         |
-            #        z.--- x
-
-            indices = [
-                np.where(caero_panels['cornerpoints'][i_panel][j] == caero_grid['ID'])[0][0]
-                for j in range(4)
-            ]
-
-            l_1 = caero_grid['offset'][indices[1]] - caero_grid['offset'][indices[0]]
-            l_2 = caero_grid['offset'][indices[2]] - caero_grid['offset'][indices[3]]
-            b_1 = caero_grid['offset'][indices[3]] - caero_grid['offset'][indices[0]]
-            b_2 = caero_grid['offset'][indices[2]] - caero_grid['offset'][indices[1]]
-            l_m = (l_1 + l_2) / 2.0
-            b_m = (b_1 + b_2) / 2.0
-
-            ID.append(caero_panels['ID'][i_panel])
-            length.append(l_m[0])
-            # A.append(l_m[0]*b_m[1])
-            A.append(np.linalg.norm(np.cross(l_m, b_m)))
-            normal = np.cross(l_1, b_1) / np.linalg.norm(np.cross(l_1, b_1))
-            if normal[2] < 0.0:
-                normal = -normal
-            N.append(normal)
-            offset_l.append(caero_grid['offset'][indices[0]] + 0.25 * l_m + 0.50 * b_1)
-            offset_k.append(caero_grid['offset'][indices[0]] + 0.50 * l_m + 0.50 * b_1)
-            offset_j.append(caero_grid['offset'][indices[0]] + 0.75 * l_m + 0.50 * b_1)
-            offset_P1.append(caero_grid['offset'][indices[0]] + 0.25 * l_1)
-            offset_P3.append(caero_grid['offset'][indices[3]] + 0.25 * l_2)
-            r.append((caero_grid['offset'][indices[3]] + 0.25 * l_2)
-                     - (caero_grid['offset'][indices[0]] + 0.25 * l_1))
-
-        n = len(ID)
-        arange = np.arange(n * 6).reshape((n, 6))
-        set_l, set_k, set_j = arange, arange, arange
 
         # Assure corner points are correctly generated
         if not isinstance(caero_grid['ID'], np.ndarray):
@@ -110,20 +84,59 @@ class AeroModel():
         if caero_grid['ID'].shape[0] != caero_grid['offset'].shape[0]:
             raise ValueError("'ID' and 'offset' must have the same number of rows.")
 
+        #
+        #                   l_2
+        #             4 o---------o 3
+        #               |         |
+        #  u -->    b_1 | l  k  j | b_2
+        #               |         |
+        #             1 o---------o 2
+        #         y         l_1
+        #         |
+        #        z.--- x
+
+        # Grid indices of the 4 corner points of each panel (n, 4), through a sorted index
+        indices = get_grid_indices(caero_grid['ID'], caero_panels['cornerpoints'])
+
+        # Corner points (n, 3)
+        p_1, p_2, p_3, p_4 = np.moveaxis(caero_grid['offset'][indices], 1, 0)
+
+        l_1 = p_2 - p_1
+        l_2 = p_3 - p_4
+        b_1 = p_4 - p_1
+        b_2 = p_3 - p_2
+        l_m = (l_1 + l_2) / 2.0
+        b_m = (b_1 + b_2) / 2.0
+
+        # Area of one panel
+        A = np.linalg.norm(np.cross(l_m, b_m), axis=1)
+
+        # Unit normal vector, pointing upwards
+        N = np.cross(l_1, b_1)
+        N /= np.linalg.norm(N, axis=1)[:, None]
+        N[N[:, 2] < 0.0] *= -1.0
+
+        offset_P1 = p_1 + 0.25 * l_1  # Vortex point at 25% chord, 0% span
+        offset_P3 = p_4 + 0.25 * l_2  # Vortex point at 25% chord, 100% span
+
+        n = len(caero_panels['ID'])
+        arange = np.arange(n * 6).reshape((n, 6))
+        set_l, set_k, set_j = arange, arange, arange
+
         reshaped_id = np.reshape(caero_grid['ID'], (-1, 1))
-        corner_points = np.hstack(reshaped_id, caero_grid['offset'])
+        corner_points = np.hstack((reshaped_id, caero_grid['offset']))
 
         aerogrid = {
-            'ID': np.array(ID),
-            'l': np.array(length),
-            'A': np.array(A),
-            'N': np.array(N),
-            'offset_l': np.array(offset_l),
-            'offset_k': np.array(offset_k),
-            'offset_j': np.array(offset_j),
-            'offset_P1': np.array(offset_P1),
-            'offset_P3': np.array(offset_P3),
-            'r': np.array(r),
+            'ID': caero_panels['ID'],
+            'l': l_m[:, 0],  # length of panel
+            'A': A,
+            'N': N,
+            'offset_l': p_1 + 0.25 * l_m + 0.50 * b_1,  # 25% point l
+            'offset_k': p_1 + 0.50 * l_m + 0.50 * b_1,  # 50% point k
+            'offset_j': p_1 + 0.75 * l_m + 0.50 * b_1,  # 75% downwash control point j
+            'offset_P1': offset_P1,
+            'offset_P3': offset_P3,
+            'r': offset_P3 - offset_P1,  # vector P1 to P3, span of panel
             'set_l': set_l,
             'set_k': set_k,
             'set_j': set_j,
@@ -205,45 +218,40 @@ class AeroModel():
             # Building matrix of corner points
             #######################################################################################
 
-            # Instantiate the grid of size n_chord x n_span
-            grids_map = np.zeros((caerocard['n_chord'] + 1, caerocard['n_span'] + 1), dtype='int')
+            n_rows = caerocard['n_chord'] + 1
+            n_strips = caerocard['n_span'] + 1
 
-            for i_strip in range(caerocard['n_span'] + 1):
-                for i_row in range(caerocard['n_chord'] + 1):
-                    # Define offset
-                    offset = caerocard['X1'] \
-                        + LE * d_span[i_strip] \
-                        + (Root * (1.0 - d_span[i_strip]) + Tip * d_span[i_strip]) * d_chord[i_row]
-                    grids['offset'].append(offset)
+            # Grid IDs of size n_chord x n_span, numbered row by row within each strip
+            grids_map = grid_ID + np.arange(n_strips * n_rows).reshape((n_strips, n_rows)).T
+            grid_ID += n_strips * n_rows
 
-                    grids['ID'].append(grid_ID)
-                    grids_map[i_row, i_strip] = grid_ID
+            # Offsets (n_strips, n_rows, 3), in the order of the grid IDs
+            span = d_span[:, None, None]
+            offset = caerocard['X1'] \
+                + LE * span \
+                + (Root * (1.0 - span) + Tip * span) * d_chord[None, :, None]
 
-                    grid_ID += 1
+            grids['offset'].append(offset.reshape((-1, 3)))
+            grids['ID'].append(grids_map.T.ravel())
 
             # build panels from cornerpoints
             # index based on n_boxes
-            panel_ID = caerocard['EID']
-            for i_strip in range(caerocard['n_span']):
-                for i_row in range(caerocard['n_chord']):
-                    panels['ID'].append(panel_ID)
-                    panels['CP'].append(caerocard['CP'])  # applying CP of CAERO card to all grids
-                    panels['CD'].append(caerocard['CP'])
-                    panels['cornerpoints'].append([
-                        grids_map[i_row, i_strip],
-                        grids_map[i_row + 1, i_strip],
-                        grids_map[i_row + 1, i_strip + 1],
-                        grids_map[i_row, i_strip + 1]
-                    ])
-
-                    panel_ID += 1
-
-        panels['ID'] = np.array(panels['ID'])
-        panels['CP'] = np.array(panels['CP'])
-        panels['CD'] = np.array(panels['CD'])
-        panels['cornerpoints'] = np.array(panels['cornerpoints'])
-        grids['ID'] = np.array(grids['ID'])
-        grids['offset'] = np.array(grids['offset'])
+            cornerpoints = np.stack([
+                grids_map[:-1, :-1],
+                grids_map[1:, :-1],
+                grids_map[1:, 1:],
+                grids_map[:-1, 1:],
+            ], axis=-1).transpose((1, 0, 2)).reshape((-1, 4))
+            n_panels = len(cornerpoints)
+
+            panels['ID'].append(caerocard['EID'] + np.arange(n_panels))
+            # applying CP of CAERO card to all grids
+            panels['CP'].append(np.full(n_panels, caerocard['CP']))
+            panels['CD'].append(np.full(n_panels, caerocard['CP']))
+            panels['cornerpoints'].append(cornerpoints)
+
+        panels = {key: np.concatenate(value) for key, value in panels.items()}
+        grids = {key: np.concatenate(value) for key, value in grids.items()}
 
         return grids, panels, caerocards
 
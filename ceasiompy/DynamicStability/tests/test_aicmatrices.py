@@ -0,0 +1,89 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'DynamicStability/func/aicmatrices.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import numpy as np
+
+from ceasiompy.DynamicStability.func import aicmatrices
+from ceasiompy.DynamicStability.func.aicmatrices import (
+    get_aic_path,
+    get_aic_matrices,
+    get_aerogrid_hash,
+)
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class CountingDLM:
+    """Replace PanelAero's DLM, returns a diagonal AIC matrix"""
+
+    def __init__(self):
+        self.nb_calls = 0
+
+    def calc_Qjj(self, aerogrid, Ma, k):
+        self.nb_calls += 1
+        return np.identity(aerogrid["n"]) * complex(Ma, k)
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_get_aic_path():
+    """Test that the aerogrid, the Mach number and k change the AIC path"""
+
+    aerogrid = {"n": 2, "offset_j": np.zeros((2, 3))}
+    grid_hash = get_aerogrid_hash(aerogrid)
+
+    path = get_aic_path(grid_hash, 0.3, 0.1)
+    assert path.suffix == ".npy"
+    assert get_aic_path(grid_hash, 0.3, 0.2) != path
+    assert get_aic_path(grid_hash, 0.5, 0.1) != path
+
+    aerogrid["offset_j"] = np.ones((2, 3))
+    assert get_aerogrid_hash(aerogrid) != grid_hash
+
+
+def test_get_aic_matrices(tmp_path, monkeypatch):
+    """Test that AIC matrices are computed once and shared between alpha and beta"""
+
+    dlm = CountingDLM()
+    monkeypatch.setattr(aicmatrices, "DLM", dlm)
+    monkeypatch.setattr(aicmatrices, "AIC_MATRICES_PATH", tmp_path)
+
+    aerogrid = {"n": 3, "offset_j": np.zeros((3, 3))}
+    cases = [(0.3, 0.1), (0.3, 0.1), (0.5, 0.2)]
+
+    aic_matrices = get_aic_matrices(aerogrid, cases)
+    assert dlm.nb_calls == 2
+    np.testing.assert_array_equal(aic_matrices[(0.5, 0.2)], np.identity(3) * complex(0.5, 0.2))
+
+    # Loaded from the saved files
+    aic_matrices = get_aic_matrices(aerogrid, cases)
+    assert dlm.nb_calls == 2
+    assert isinstance(aic_matrices[(0.3, 0.1)], np.memmap)
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test aicmatrices.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
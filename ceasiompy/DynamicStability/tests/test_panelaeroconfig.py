@@ -0,0 +1,83 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'DynamicStability/func/panelaeroconfig.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import pytest
+
+import numpy as np
+
+from ceasiompy.DynamicStability.func.panelaeroconfig import (
+    AeroModel,
+    get_grid_indices,
+)
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_get_grid_indices():
+    """Test function 'get_grid_indices'"""
+
+    grid_ids = np.array([5, 3, 9, 7])
+    cornerpoints = np.array([[3, 5, 7, 9], [9, 9, 3, 5]])
+
+    indices = get_grid_indices(grid_ids, cornerpoints)
+    np.testing.assert_array_equal(grid_ids[indices], cornerpoints)
+
+    with pytest.raises(ValueError):
+        get_grid_indices(grid_ids, np.array([[3, 5, 7, 10]]))
+
+
+def test_build_aerogrid():
+    """Test the aerogrid of a flat trapezoidal wing and its symmetric"""
+
+    wings_list = [
+        {
+            'EID': 0,
+            'CP': 0,
+            'n_span': 6,
+            'n_chord': 4,
+            'X1': np.array([0.0, 0.0, 0.0]),
+            'length12': 4.0,
+            'X4': np.array([2.0, 10.0, 0.0]),
+            'length43': 2.0,
+        }
+    ]
+
+    model = AeroModel(wings_list)
+    model.build_aerogrid()
+    aerogrid = model.aerogrid
+
+    assert aerogrid['n'] == 2 * 6 * 4
+    assert aerogrid['cornerpoint_grids'].shape == (2 * 7 * 5, 4)
+
+    # Planform area of both sides
+    assert aerogrid['A'].sum() == pytest.approx(2 * 10.0 * (4.0 + 2.0) / 2.0)
+    np.testing.assert_allclose(aerogrid['N'], np.tile([0.0, 0.0, 1.0], (aerogrid['n'], 1)))
+
+    # Control points at 75% of the panels, inside the wing
+    assert np.all(aerogrid['offset_j'][:, 0] > aerogrid['offset_l'][:, 0])
+    np.testing.assert_allclose(aerogrid['r'], aerogrid['offset_P3'] - aerogrid['offset_P1'])
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test panelaeroconfig.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
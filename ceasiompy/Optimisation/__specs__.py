@@ -97,6 +97,33 @@ cpacs_inout.add_input(
     gui_group="Optimisation settings",
 )
 
+cpacs_inout.add_input(
+    var_name="use_surrogate",
+    var_type=bool,
+    default_value=False,
+    unit=None,
+    descr="""Train a Kriging model on an initial DoE and only evaluate the modules at the
+    points of maximum expected improvement. The constraints are modelled by their own Kriging
+    models. The max number of iterations is then the max number of evaluations of the
+    modules.""",
+    xpath=OPTIM_XPATH + "/parameters/surrogate/adaptive",
+    gui=include_gui,
+    gui_name="Surrogate-accelerated",
+    gui_group="Optimisation settings",
+)
+
+cpacs_inout.add_input(
+    var_name="sm_doe_nb",
+    var_type=int,
+    default_value=10,
+    unit=None,
+    descr="Number of samples of the initial DoE of the surrogate-accelerated optimisation",
+    xpath=OPTIM_XPATH + "/parameters/surrogate/initialSampleNB",
+    gui=include_gui,
+    gui_name="Initial samples (surrogate)",
+    gui_group="Optimisation settings",
+)
+
 # Is it ok to comment that?
 # cpacs_inout.add_input(
 #     var_name='modules',
@@ -131,6 +158,18 @@ cpacs_inout.add_input(
     gui_group="DoE settings",
 )
 
+cpacs_inout.add_input(
+    var_name="nb_proc",
+    var_type=int,
+    default_value=1,
+    unit=None,
+    descr="Number of DoE samples run at the same time, each one in its own process",
+    xpath=OPTIM_XPATH + "/parameters/DoE/nbProc",
+    gui=include_gui,
+    gui_name="Parallel samples",
+    gui_group="DoE settings",
+)
+
 cpacs_inout.add_input(
     var_name="UseAeromap",
     var_type=bool,
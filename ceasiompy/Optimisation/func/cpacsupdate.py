@@ -0,0 +1,264 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Update plan of the design variables of the optimisation module.
+
+The design variables are compiled once into a list of updates, either a value written at
+an xpath (or at an index of a vector) of the CPACS, or a TiGL configuration command. The
+commands are parsed and checked when the plan is compiled, they are then evaluated by
+calling the methods of the TiGL configuration, without 'eval'. The updates are applied on
+an in-memory Tixi handle.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import ast
+
+from tigl3 import geometry
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Callable,
+    Optional,
+    NamedTuple,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.moduleinterfaces import get_specs_for_module
+from cpacspy.cpacsfunctions import get_tigl_configuration, open_tigl
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Objects which can start a TiGL configuration command
+COMMAND_ROOTS = ["wings", "fuselage", "geometry"]
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class CpacsUpdate(NamedTuple):
+    """Update of the CPACS for one design variable"""
+
+    name: str
+    xpath: str = ""
+    index: Optional[int] = None  # Index in a vector element, None for a scalar element
+    transform: Callable[[float], str] = str
+    command: Optional[ast.AST] = None  # TiGL configuration command, instead of the xpath
+
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def check_command_node(node: ast.AST, var_names: List[str]) -> None:
+    """Check that a node of a command is a method call chain on a TiGL object.
+
+    Args:
+        node (ast.AST): Node of the parsed command.
+        var_names (List[str]): Names of the design variables which can be used as arguments.
+
+    Raises:
+        ValueError: If the node is not allowed.
+
+    """
+
+    if isinstance(node, ast.Call):
+        check_command_node(node.func, var_names)
+        for arg in node.args:
+            check_command_node(arg, var_names)
+        if node.keywords:
+            raise ValueError("Keyword arguments are not supported.")
+    elif isinstance(node, ast.Attribute):
+        if node.attr.startswith("_"):
+            raise ValueError(f"Private attribute '{node.attr}' is not allowed.")
+        check_command_node(node.value, var_names)
+    elif isinstance(node, ast.Name):
+        if node.id not in COMMAND_ROOTS + var_names:
+            raise ValueError(f"Unknown name '{node.id}'.")
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        check_command_node(node.operand, var_names)
+    elif not (isinstance(node, ast.Constant) and isinstance(node.value, (int, float))):
+        raise ValueError(f"'{type(node).__name__}' is not allowed.")
+
+
+def compile_command(setcommand: str, var_names: List[str]) -> List[ast.AST]:
+    """Parse and check the TiGL configuration commands of a design variable.
+
+    Args:
+        setcommand (str): Commands separated by ';' (e.g. 'fuselage.set_length(fus_length)').
+        var_names (List[str]): Names of the design variables.
+
+    Returns:
+        (List[ast.AST]): Checked expression of each command.
+
+    """
+
+    nodes = []
+    for command in setcommand.split(";"):
+        if command.strip():
+            node = ast.parse(command.strip(), mode="eval").body
+            try:
+                check_command_node(node, var_names)
+            except ValueError as err:
+                raise ValueError(f"Invalid command '{command}': {err}")
+            nodes.append(node)
+
+    return nodes
+
+
+def eval_command(node: ast.AST, namespace: Dict[str, Any]) -> Any:
+    """Evaluate a checked command in a namespace of TiGL objects and variable values."""
+
+    if isinstance(node, ast.Call):
+        func = eval_command(node.func, namespace)
+        return func(*[eval_command(arg, namespace) for arg in node.args])
+    if isinstance(node, ast.Attribute):
+        return getattr(eval_command(node.value, namespace), node.attr)
+    if isinstance(node, ast.Name):
+        return namespace[node.id]
+    if isinstance(node, ast.UnaryOp):
+        return -eval_command(node.operand, namespace)
+
+    return node.value
+
+
+def format_int(value: float) -> str:
+    """Format the value of an integer CPACS element."""
+
+    return str(int(round(float(value))))
+
+
+def get_int_xpaths(module_names: List[str]) -> List[str]:
+    """Returns the xpaths of the inputs declared as integers in the __specs__ of modules.
+
+    Args:
+        module_names (List[str]): Names of the modules.
+
+    """
+
+    int_xpaths = []
+
+    for module_name in module_names:
+        try:
+            specs = get_specs_for_module(module_name, raise_error=False)
+        except AttributeError:
+            # Some __specs__ depend on the GUI session state
+            specs = None
+
+        if specs is not None:
+            int_xpaths += [
+                entry.xpath for entry in specs.cpacs_inout.inputs if entry.var_type is int
+            ]
+
+    return int_xpaths
+
+
+def compile_update_plan(
+    tixi, optim_var_dict: Dict, int_xpaths: Optional[List[str]] = None
+) -> List[CpacsUpdate]:
+    """Compile the design variables into a list of CPACS updates.
+
+    The values are rounded to integers only for the xpaths declared as integers, a float
+    design variable is never rounded, even if its initial value is an integer.
+
+    Args:
+        tixi (Tixi3 handle): Handle of the initial CPACS, used to find the vector elements.
+        optim_var_dict (dict): Dictionary of the variables to update.
+        int_xpaths (List[str]): Xpaths of the integer elements (see 'get_int_xpaths').
+
+    Returns:
+        plan (List[CpacsUpdate]): Update of each design variable.
+
+    """
+
+    plan = []
+    var_names = list(optim_var_dict)
+    int_xpaths = int_xpaths or []
+
+    for name, (val_type, listval, _, _, getcommand, setcommand) in optim_var_dict.items():
+
+        if val_type != "des" or listval[0] in ["-", "True", "False"]:
+            continue
+
+        if setcommand not in ["-", ""]:
+            for node in compile_command(setcommand, var_names):
+                plan.append(CpacsUpdate(name=name, command=node))
+            continue
+
+        text = tixi.getTextElement(getcommand).strip() if tixi.checkElement(getcommand) else ""
+        index = 0 if ";" in text else None
+        transform = format_int if getcommand in int_xpaths else str
+
+        plan.append(CpacsUpdate(name=name, xpath=getcommand, index=index, transform=transform))
+
+    log.info(f"CPACS update plan compiled with {len(plan)} updates.")
+
+    return plan
+
+
+def apply_update_plan(tixi, plan: List[CpacsUpdate], optim_var_dict: Dict) -> None:
+    """Apply the last values of the design variables to an in-memory CPACS.
+
+    Args:
+        tixi (Tixi3 handle): Handle of the CPACS to update.
+        plan (List[CpacsUpdate]): Updates compiled with 'compile_update_plan'.
+        optim_var_dict (dict): Dictionary of the variables, the last value is used.
+
+    """
+
+    values = {name: infos[1][-1] for name, infos in optim_var_dict.items()}
+
+    for update in plan:
+        if update.command is not None:
+            continue
+
+        value = update.transform(values[update.name])
+        if update.index is None:
+            tixi.updateTextElement(update.xpath, value)
+        else:
+            vector = tixi.getTextElement(update.xpath).split(";")
+            vector[update.index] = value
+            tixi.updateTextElement(update.xpath, ";".join(vector))
+
+    commands = [update.command for update in plan if update.command is not None]
+    if commands:
+        tigl = open_tigl(tixi)
+        aircraft = get_tigl_configuration(tigl)
+
+        namespace = {
+            "wings": aircraft.get_wings(),
+            "fuselage": (
+                aircraft.get_fuselages().get_fuselage(1)
+                if aircraft.get_fuselage_count() else None
+            ),
+            "geometry": geometry,
+            **values,
+        }
+        for command in commands:
+            eval_command(command, namespace)
+
+        # Write the modified configuration in the Tixi handle
+        aircraft.write_cpacs(aircraft.get_uid())
+        tigl.close()
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
@@ -86,10 +86,15 @@ class Routine:
         self.max_iter = 200
         self.tol = 1e-3
 
+        # Surrogate-accelerated optimisation
+        self.use_surrogate = False
+        self.sm_doe_nb = 10
+
         # DoE
         self.doedriver = "Uniform"
         self.samplesnb = 3
         self.doe_file = ""
+        self.nb_proc = 1
 
         # User specified configuration file path
         self.user_config = Path(MODULE_DIR, "files", "Default_config.csv")
@@ -99,6 +104,22 @@ class Routine:
         # Counter
         self.counter = 0
 
+        # Samples, each one is run in its own directory
+        self.base_tixi = None
+        self.sample_dir = None
+
+        # Problem run by the worker processes and samples they evaluated (DoE)
+        self.problem = None
+        self.evaluated_samples = set()
+
+        # Input CPACS of the current sample, kept in memory
+        self.tixi = None
+        self.sample_cpacs = None
+        self.sample_saved = False
+
+        # Updates of the geometric design variables
+        self.update_plan = []
+
         # Optimisation directory
         self.optim_dir = None
 
@@ -131,6 +152,12 @@ class Routine:
         self.save_iter = int(get_value_or_default(
             tixi, OPTIM_XPATH + "/saving/perIter", 1))
 
+        # Surrogate-accelerated optimisation parameters
+        self.use_surrogate = get_value_or_default(
+            tixi, OPTIM_XPATH + "/parameters/surrogate/adaptive", False)
+        self.sm_doe_nb = int(get_value_or_default(
+            tixi, OPTIM_XPATH + "/parameters/surrogate/initialSampleNB", 10))
+
         # Specific DoE parameters
         self.doedriver = get_value_or_default(
             tixi, OPTIM_XPATH + "/parameters/DoE/driver", "Uniform"
@@ -142,6 +169,8 @@ class Routine:
                 3,
             )
         )
+        self.nb_proc = int(get_value_or_default(
+            tixi, OPTIM_XPATH + "/parameters/DoE/nbProc", 1))
 
         # User specified configuration file path
         self.user_config = str(get_value_or_default(
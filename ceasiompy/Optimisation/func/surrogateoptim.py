@@ -0,0 +1,260 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Surrogate-accelerated optimisation for the optimisation module.
+
+A Kriging model is trained on an initial DoE of the real module chain. The point which
+maximises the expected improvement of the model is then evaluated with the module chain
+and added to the training data, until the maximum number of evaluations is reached or the
+expected improvement is below the tolerance. The hyperparameters of the previous model are
+used as initial values at each training.
+
+Constraints (g <= 0) are modelled by one Kriging model each, the expected improvement is
+multiplied by the probability that all the constraints are satisfied. As long as no feasible
+point has been evaluated, the infill point maximises the probability of feasibility.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import numpy as np
+
+from scipy.stats import norm
+from scipy.optimize import minimize
+from smt.sampling_methods import LHS
+from smt.surrogate_models import KRG
+
+from typing import (
+    List,
+    Tuple,
+    Callable,
+    Optional,
+)
+
+from ceasiompy import log
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Number of random candidates for the maximisation of the expected improvement, per variable
+CANDIDATES_PER_VAR = 200
+
+# Minimal distance between two evaluated points, relative to the design space size
+MIN_DISTANCE = 1e-6
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def expected_improvement(sm, x: np.ndarray, y_min: float) -> np.ndarray:
+    """Expected improvement of a Kriging model over the best evaluated value.
+
+    Args:
+        sm (SurrogateModel): Trained SMT model with variance prediction.
+        x (np.ndarray): Points to evaluate (n, nb_var).
+        y_min (float): Best (minimal) value evaluated with the module chain.
+
+    Returns:
+        (np.ndarray): Expected improvement at each point (n, ).
+
+    """
+
+    mean = sm.predict_values(x).ravel()
+    std = np.sqrt(np.maximum(sm.predict_variances(x).ravel(), 0.0))
+
+    improvement = y_min - mean
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = improvement / std
+        ei = improvement * norm.cdf(z) + std * norm.pdf(z)
+
+    # No uncertainty at the training points
+    return np.where(std > 0.0, ei, np.maximum(improvement, 0.0))
+
+
+def probability_of_feasibility(constraint_sms: List, x: np.ndarray) -> np.ndarray:
+    """Probability that all the constraints are satisfied (g <= 0).
+
+    Args:
+        constraint_sms (List[SurrogateModel]): Trained SMT model of each constraint.
+        x (np.ndarray): Points to evaluate (n, nb_var).
+
+    Returns:
+        (np.ndarray): Probability of feasibility at each point (n, ).
+
+    """
+
+    pof = np.ones(len(x))
+
+    for sm in constraint_sms:
+        mean = sm.predict_values(x).ravel()
+        std = np.sqrt(np.maximum(sm.predict_variances(x).ravel(), 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pof *= np.where(std > 0.0, norm.cdf(-mean / std), (mean <= 0.0).astype(float))
+
+    return pof
+
+
+def acquisition(sm, constraint_sms: List, x: np.ndarray, y_min: Optional[float]) -> np.ndarray:
+    """Expected improvement times the probability of feasibility, only the probability of
+    feasibility if no feasible point has been evaluated yet (y_min is None)."""
+
+    pof = probability_of_feasibility(constraint_sms, x)
+
+    if y_min is None:
+        return pof
+
+    return expected_improvement(sm, x, y_min) * pof
+
+
+def get_infill_point(
+    sm, xlimits: np.ndarray, y_min: Optional[float], random_state: int, constraint_sms=()
+) -> Tuple[np.ndarray, float]:
+    """Returns the point which maximises the acquisition function.
+
+    The best of a set of LHS candidates is refined with a bounded gradient-based search.
+
+    Args:
+        sm (SurrogateModel): Trained SMT model with variance prediction.
+        xlimits (np.ndarray): Lower and upper bound of each variable (nb_var, 2).
+        y_min (float): Best (minimal) feasible value evaluated with the module chain, None
+            if no feasible point has been evaluated.
+        random_state (int): Seed of the candidates sampling.
+        constraint_sms (List[SurrogateModel]): Trained SMT model of each constraint.
+
+    Returns:
+        (Tuple[np.ndarray, float]): Infill point and its acquisition value.
+
+    """
+
+    sampling = LHS(xlimits=xlimits, random_state=random_state)
+    candidates = sampling(CANDIDATES_PER_VAR * len(xlimits))
+    x_start = candidates[np.argmax(acquisition(sm, constraint_sms, candidates, y_min))]
+
+    result = minimize(
+        lambda x: -acquisition(sm, constraint_sms, x.reshape(1, -1), y_min)[0],
+        x_start,
+        method="L-BFGS-B",
+        bounds=xlimits,
+    )
+
+    return result.x, -result.fun
+
+
+def get_best_index(y: np.ndarray, g: np.ndarray) -> int:
+    """Returns the index of the best feasible point (g <= 0), of the point with the smallest
+    constraint violation if no point is feasible.
+
+    Args:
+        y (np.ndarray): Values of the evaluated points (n, ).
+        g (np.ndarray): Constraints of the evaluated points (n, nb_constraints).
+
+    """
+
+    violation = np.maximum(g, 0.0).sum(axis=1)
+    feasible = violation == 0.0
+
+    if not feasible.any():
+        return int(np.argmin(violation))
+
+    return int(np.flatnonzero(feasible)[np.argmin(y[feasible])])
+
+
+def train_model(x: np.ndarray, y: np.ndarray, theta0: List[float]):
+    """Returns a Kriging model trained on the evaluated points."""
+
+    sm = KRG(theta0=theta0, print_global=False)
+    sm.set_training_values(x, y)
+    sm.train()
+
+    return sm
+
+
+def run_surrogate_optimisation(
+    evaluate: Callable[[np.ndarray], Tuple[float, np.ndarray]],
+    xlimits: np.ndarray,
+    nb_doe: int,
+    max_eval: int,
+    tol: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Minimise a function under constraints with Kriging models and expected improvement
+    infill.
+
+    Args:
+        evaluate (Callable): Function which runs the module chain at a point and returns
+            the value to minimise and the constraints, which are satisfied if g <= 0.
+        xlimits (np.ndarray): Lower and upper bound of each variable (nb_var, 2).
+        nb_doe (int): Number of points of the initial DoE.
+        max_eval (int): Maximum number of evaluations of the module chain, DoE included.
+        tol (float): Minimal acquisition value (expected improvement times probability of
+            feasibility) to continue.
+
+    Returns:
+        (Tuple[np.ndarray, np.ndarray, np.ndarray]): Evaluated points, their values and
+            their constraints (n, nb_constraints).
+
+    """
+
+    xlimits = np.asarray(xlimits, dtype=float)
+    scale = xlimits[:, 1] - xlimits[:, 0]
+
+    log.info(f"Initial DoE of {nb_doe} points for the surrogate model.")
+    x = LHS(xlimits=xlimits, criterion="ese", random_state=0)(nb_doe)
+    results = [evaluate(xi) for xi in x]
+    y = np.array([value for value, _ in results])
+    g = np.array([np.atleast_1d(constraints) for _, constraints in results], dtype=float)
+
+    theta0 = [1e-2] * len(xlimits)
+    constraint_theta0 = [list(theta0) for _ in range(g.shape[1])]
+
+    while len(y) < max_eval:
+        sm = train_model(x, y, theta0)
+        theta0 = list(sm.optimal_theta)
+
+        constraint_sms = []
+        for i in range(g.shape[1]):
+            constraint_sms.append(train_model(x, g[:, i], constraint_theta0[i]))
+            constraint_theta0[i] = list(constraint_sms[i].optimal_theta)
+
+        feasible = np.all(g <= 0.0, axis=1)
+        y_min = y[feasible].min() if feasible.any() else None
+
+        x_new, value = get_infill_point(sm, xlimits, y_min, len(y), constraint_sms)
+        log.info(f"Infill point {x_new}, acquisition value: {value:.3e}")
+
+        # The search for a feasible point is not stopped by the tolerance
+        if y_min is not None and value < tol:
+            log.info("Expected improvement below the tolerance, end of the optimisation.")
+            break
+
+        if np.min(np.max(np.abs(x - x_new) / scale, axis=1)) < MIN_DISTANCE:
+            log.info("Infill point already evaluated, end of the optimisation.")
+            break
+
+        value, constraints = evaluate(x_new)
+        x = np.vstack([x, x_new])
+        y = np.append(y, value)
+        g = np.vstack([g, np.atleast_1d(constraints)])
+
+    best = get_best_index(y, g)
+    if np.any(g[best] > 0.0):
+        log.warning("No evaluated point satisfies the constraints.")
+    log.info(f"Best value {y[best]} at {x[best]}, after {len(y)} evaluations.")
+
+    return x, y, g
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
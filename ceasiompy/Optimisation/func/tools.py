@@ -221,7 +221,7 @@ def save_results(optim_dir_path, optim_var_dict=None):
 # -----------------------------------------------------------#
 
 
-def plot_results(optim_dir_path, routine_type, optim_var_dict=None):
+def plot_results(optim_dir_path, routine_type, optim_var_dict=None, plot_obj=True):
     """Generate plots of the routine.
 
     Draw plots to vizualize the data. The evolution of each problem parameter
@@ -230,6 +230,7 @@ def plot_results(optim_dir_path, routine_type, optim_var_dict=None):
     Args:
         optim_dir_path (str) : Path to the routine working directory.
         routine_type (str) : Type of the routine, can be DoE or Optim
+        plot_obj (bool) : Plot the objective function from the driver recorder.
 
     """
 
@@ -253,7 +254,8 @@ def plot_results(optim_dir_path, routine_type, optim_var_dict=None):
     fig_path = Path(optim_dir_path, "plot_variable.png")
     plt.savefig(fig_path)
 
-    plot_objective(optim_dir_path)
+    if plot_obj:
+        plot_objective(optim_dir_path)
 
     if routine_type == "DoE":
         gen_plot(optim_dir_path, df, obj, des)
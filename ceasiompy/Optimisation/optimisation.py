@@ -17,8 +17,9 @@ Todo:
 
 """
 
-import ast
+import multiprocessing
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from re import split
 
@@ -35,6 +36,15 @@ from ceasiompy.Optimisation.func.optimfunctions import (
     create_variable_library,
     gen_doe_csv,
 )
+from ceasiompy.Optimisation.func.cpacsupdate import (
+    get_int_xpaths,
+    apply_update_plan,
+    compile_update_plan,
+)
+from ceasiompy.Optimisation.func.surrogateoptim import (
+    get_best_index,
+    run_surrogate_optimisation,
+)
 from ceasiompy.Optimisation.func.tools import change_var_name, is_digit, plot_results, save_results
 from ceasiompy.SMUse.smuse import load_surrogate, write_inouts
 from ceasiompy import log
@@ -49,6 +59,7 @@ from ceasiompy.utils.commonxpath import OPTIM_XPATH
 from cpacspy.cpacsfunctions import add_float_vector, get_value, open_tixi
 from cpacspy.cpacspy import CPACS
 from cpacspy.utils import COEFS, PARAMS
+from tixi3.tixi3wrapper import Tixi3
 
 # Do not remove: Called within eval() function
 # from tigl3.geometry import eval
@@ -76,52 +87,11 @@ class Geom_param(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         """Update the geometry of the CPACS"""
 
-        log.info(f"Start optimisation iteration: {Rt.counter}")
-
         # Update the geometry dictionary
         for name, infos in Rt.geom_dict.items():
             infos[1].append(inputs[name][0])
 
-        if Rt.counter == 0:
-
-            # For the first iteration, update the CPACS file from previous module
-            cpacs_in = Rt.modules[0].cpacs_in
-            cpacs_out = Rt.modules[0].cpacs_out
-            update_cpacs_file(cpacs_in, cpacs_out, Rt.geom_dict)
-
-        else:
-
-            for m, _ in enumerate(Rt.modules):
-
-                # Increment name of output CPACS file
-                Rt.modules[m].cpacs_out = Path(
-                    Rt.modules[m].cpacs_out.parents[0],
-                    "iter_" + str(Rt.counter).rjust(2, "0") + ".xml",
-                )
-
-                if m == 0:
-
-                    # Use output of the last module of the previous iteration as input
-                    Rt.modules[m].cpacs_in = Rt.modules[-1].cpacs_out
-
-                    # Update the geometry of the CPACS file
-                    cpacs_in = Rt.modules[m].cpacs_in
-                    cpacs_out = Rt.modules[m].cpacs_out
-                    update_cpacs_file(cpacs_in, cpacs_out, Rt.geom_dict)
-
-                    # # The first module of the loop must update its output where the input
-                    # # was saved because it has been updated by "update_cpacs_file" function.
-                    # Rt.modules[m].cpacs_in = Rt.modules[m].cpacs_out
-
-                else:
-
-                    # Increment name of input CPACS file
-                    Rt.modules[m].cpacs_in = Path(
-                        Rt.modules[m].cpacs_in.parents[0],
-                        "iter_" + str(Rt.counter).rjust(2, "0") + ".xml",
-                    )
-
-        Rt.counter += 1
+        start_sample()
 
 
 class ModuleComp(om.ExplicitComponent):
@@ -185,10 +155,12 @@ class ModuleComp(om.ExplicitComponent):
     def compute(self, inputs, outputs):
         """Launches the module"""
 
+        start_sample()
+
         module = [m for m in Rt.modules if m.name == self.module_name][0]
 
         # Updating inputs in CPACS file
-        tixi = open_tixi(module.cpacs_in)
+        tixi = get_cpacs_tixi(module.cpacs_in)
         for name in inputs:
             if name in Rt.optim_var_dict:
                 xpath = Rt.optim_var_dict[name][4]
@@ -201,13 +173,21 @@ class ModuleComp(om.ExplicitComponent):
                     tixi.updateFloatVector(xpath, v, size, "%g")
                 else:
                     add_float_vector(tixi, xpath, inputs[name])
-        tixi.save(module.cpacs_in)
+        if tixi is Rt.tixi:
+            Rt.sample_saved = False
+        else:
+            tixi.save(module.cpacs_in)
+            tixi.close()
 
-        # Running the module
-        run_module(module, Rt.wkflow_dir, Rt.counter)
+        # Running the module, the first iteration of the workflow was run before the routine
+        # and the samples evaluated by 'run_doe_samples' only have their results read
+        if module.cpacs_out != Rt.sample_cpacs and Rt.counter not in Rt.evaluated_samples:
+            if module.cpacs_in == Rt.sample_cpacs:
+                save_sample_cpacs()
+            run_module(module, Rt.sample_dir, Rt.counter + 1)
 
         # Feeding CPACS file results to outputs
-        tixi = open_tixi(module.cpacs_out)
+        tixi = get_cpacs_tixi(module.cpacs_out)
         for name in outputs:
             if name in Rt.optim_var_dict:
                 xpath = Rt.optim_var_dict[name][4]
@@ -220,6 +200,7 @@ class ModuleComp(om.ExplicitComponent):
                         outputs[name] = val
                 else:
                     outputs[name] = get_value(tixi, xpath)
+        close_cpacs_tixi(tixi)
 
 
 class SmComp(om.ExplicitComponent):
@@ -256,6 +237,9 @@ class SmComp(om.ExplicitComponent):
 
     def compute(self, inputs, outputs):
         """Make a prediction"""
+
+        start_sample()
+
         xp = []
         for name in self.xd.index:
             xp.append(inputs[name][0])
@@ -269,10 +253,11 @@ class SmComp(om.ExplicitComponent):
         module = [m for m in Rt.modules if m.name == self.module_name][0]
 
         # Write the inouts to the CPACS
-        tixi = open_tixi(module.cpacs_in)
+        tixi = get_cpacs_tixi(module.cpacs_in)
         write_inouts(self.xd, xp, tixi)
         write_inouts(self.yd, yp, tixi)
         tixi.save(str(module.cpacs_out))
+        close_cpacs_tixi(tixi)
 
 
 class Objective(om.ExplicitComponent):
@@ -293,13 +278,16 @@ class Objective(om.ExplicitComponent):
         """Compute the objective expression"""
 
         # Add new variables to dictionnary
-        cpacs = CPACS(Rt.modules[-1].cpacs_out)
-
-        update_dict(cpacs.tixi, Rt.optim_var_dict)
+        cpacs_out = Rt.modules[-1].cpacs_out
+        tixi = get_cpacs_tixi(cpacs_out)
+        update_dict(tixi, Rt.optim_var_dict)
+        close_cpacs_tixi(tixi)
 
         # Save the whole aeromap if needed
         if Rt.use_aeromap:
-            update_am_dict(cpacs, Rt.aeromap_uid, Rt.am_dict)
+            if cpacs_out == Rt.sample_cpacs:
+                save_sample_cpacs()
+            update_am_dict(CPACS(cpacs_out), Rt.aeromap_uid, Rt.am_dict)
 
         for obj in Rt.objective:
             var_list = split("[+*/-]", obj)
@@ -313,74 +301,143 @@ class Objective(om.ExplicitComponent):
             else:
                 outputs["Objective function " + obj] = -result
 
+        end_sample()
+
 
 # =================================================================================================
 #   FUNCTIONS
 # =================================================================================================
 
 
-def update_cpacs_file(cpacs_path, cpacs_out_path, optim_var_dict):
-    """Function to update a CPACS file with value from the optimiser
+def set_sample_modules(sample_dir: Path) -> None:
+    """Set the CPACS files and results directories of the modules in a sample directory.
+
+    Each sample of the routine runs the modules in its own directory, so that the files
+    of a sample are not overwritten by the following ones.
 
-    This function sets the new values of the design variables given by
-    the routine driver to the CPACS file, using the Tigl and Tixi handler.
+    Args:
+        sample_dir (Path): Directory of the sample.
+
+    """
+
+    cpacs_in = Path(sample_dir, "ToolInput.xml")
+
+    for m, module in enumerate(Rt.modules):
+        module.cpacs_in = cpacs_in
+
+        if module.name == MODULE_NAME:
+            # Not run during the routine (see 'run_module'), the input is passed on
+            module.cpacs_out = cpacs_in
+        else:
+            module_dir = Path(sample_dir, str(m + 1).rjust(2, "0") + "_" + module.name)
+            module_dir.mkdir(exist_ok=True)
+            module.cpacs_out = Path(module_dir, "ToolOutput.xml")
 
-    Source:
-        * See CPACSCreator api function,
+        if module.results_dir is not None:
+            module.results_dir = Path(sample_dir, "Results", module.name)
+            module.results_dir.mkdir(parents=True, exist_ok=True)
+
+        cpacs_in = module.cpacs_out
+
+
+def start_sample() -> None:
+    """Create the directory and the input CPACS of the current sample.
+
+    The input CPACS is a copy of the base CPACS updated with the geometric design variables.
+    It is kept in memory ('Rt.tixi') and only written when a module needs the file. Nothing
+    is done if the sample has already been started by a previous component.
+
+    """
+
+    if Rt.sample_dir is not None:
+        return
+
+    log.info(f"Start optimisation iteration: {Rt.counter}")
+
+    Rt.sample_dir = Path(
+        Rt.optim_dir,
+        "Samples",
+        "sample_" + str(Rt.counter).rjust(3, "0"),
+    )
+    Rt.sample_dir.mkdir(parents=True, exist_ok=True)
+
+    set_sample_modules(Rt.sample_dir)
+
+    Rt.sample_cpacs = Rt.modules[0].cpacs_in
+    Rt.sample_saved = False
+    Rt.tixi = copy_tixi(Rt.base_tixi)
+    apply_update_plan(Rt.tixi, Rt.update_plan, Rt.optim_var_dict)
+
+
+def end_sample() -> None:
+    """Close the current sample.
+
+    DoE samples all start from the initial CPACS, an optimisation iteration starts from
+    the output of the previous one. This output is read again from the output CPACS file
+    of the last module, it is only reused from memory if no module wrote it.
+
+    """
+
+    if Rt.type == "Optimisation":
+        Rt.base_tixi.close()
+        Rt.base_tixi = get_cpacs_tixi(Rt.modules[-1].cpacs_out)
+
+    if Rt.tixi is not Rt.base_tixi:
+        Rt.tixi.close()
+
+    Rt.tixi = None
+    Rt.sample_cpacs = None
+    Rt.sample_dir = None
+    Rt.counter += 1
+
+
+def copy_tixi(tixi) -> Tixi3:
+    """Returns a new Tixi handle on a copy of the document of a Tixi handle.
 
     Args:
-        cpacs_path (Path): Path to CPACS file to update
-        cpacs_out_path (Path):Path to the updated CPACS file
-        optim_var_dict (dict): Dictionary containing all the variable
-                               value/min/max and command to modify a CPACS file
+        tixi (Tixi3): Tixi handle to copy.
 
     """
 
-    log.info("----- Start of CPACSUpdater -----")
-    log.info(f"{cpacs_path} will be updated.")
+    tixi_copy = Tixi3()
+    tixi_copy.openString(tixi.exportDocumentAsString())
 
-    tixi = open_tixi(cpacs_path)
-    tigl = tixi
-    # open_tigl(tixi)
+    return tixi_copy
 
-    # Object seems to be unused, but are use in "eval" function
-    aircraft = tigl
-    # get_tigl_configuration(tigl)
-    # wings = aircraft.get_wings()
-    # fuselage = aircraft.get_fuselages().get_fuselage(1)
 
-    # Perform update of all the variable contained in 'optim_var_dict'
-    for name, variables in optim_var_dict.items():
+def get_cpacs_tixi(cpacs_path: Path):
+    """Returns the Tixi handle of a CPACS file of the sample, in memory for its input CPACS.
 
-        # Unpack the variables
-        val_type, listval, _, _, getcommand, setcommand = variables
+    Args:
+        cpacs_path (Path): Path of the CPACS file.
 
-        if val_type == "des" and listval[0] not in ["-", "True", "False"]:
+    """
 
-            if setcommand not in ["-", ""]:
+    if cpacs_path == Rt.sample_cpacs:
+        return Rt.tixi
 
-                # Define variable (var1,var2,..)
-                locals()[str(name)] = listval[-1]
+    return open_tixi(cpacs_path)
 
-                # Update value by using tigl configuration
-                if ";" in setcommand:  # if more than one command on the line
-                    command_split = setcommand.split(";")
-                    for setcommand in command_split:
-                        ast.literal_eval(setcommand)
-                else:
-                    ast.literal_eval(setcommand)
-            else:
 
-                # Update value directly in the CPACS file
-                xpath = getcommand
-                tixi.updateTextElement(xpath, str(listval[-1]))
+def close_cpacs_tixi(tixi) -> None:
+    """Close a Tixi handle returned by 'get_cpacs_tixi', except the one of the input CPACS
+    of the sample which is kept until the end of the sample.
 
-    aircraft.write_cpacs(aircraft.get_uid())
-    tigl.close()
-    tixi.save(str(cpacs_out_path))
+    Args:
+        tixi (Tixi3): Tixi handle to close.
+
+    """
 
-    log.info(f"{cpacs_out_path} has been saved.")
-    log.info("----- Start of CPACSUpdater -----")
+    if tixi is not Rt.tixi:
+        tixi.close()
+
+
+def save_sample_cpacs() -> None:
+    """Write the input CPACS of the sample, if it changed since it was last written."""
+
+    if not Rt.sample_saved:
+        Rt.tixi.save(str(Rt.sample_cpacs))
+        Rt.sample_saved = True
 
 
 def driver_setup(prob):
@@ -423,8 +480,6 @@ def driver_setup(prob):
             file = gen_doe_csv(Rt.user_config)
             driver_type = om.CSVGenerator(file)
         prob.driver = om.DOEDriver(driver_type)
-        prob.driver.options["run_parallel"] = True
-        prob.driver.options["procs_per_model"] = 1
     else:
         log.error("Type of optimisation not recognize!!!")
 
@@ -552,6 +607,153 @@ def create_om_problem(prob):
     prob.setup()
 
 
+def get_design_space():
+    """Get the design variables of the problem and their bounds.
+
+    Returns:
+        names (list): Names of the design variables.
+        xlimits (np.ndarray): Lower and upper bound of each design variable (nb_var, 2).
+
+    """
+
+    names = []
+    xlimits = []
+
+    for name, (val_type, listval, minval, maxval, _, _) in Rt.optim_var_dict.items():
+        if val_type == "des" and listval[-1] not in ["True", "False", "-"]:
+            if not (is_digit(minval) and is_digit(maxval)) or float(minval) >= float(maxval):
+                raise ValueError(
+                    f"Design variable {name} must have a lower and an upper bound "
+                    "for a surrogate-accelerated optimisation."
+                )
+            names.append(name)
+            xlimits.append([float(minval), float(maxval)])
+
+    return names, np.array(xlimits)
+
+
+def get_surrogate_constraints():
+    """Get the constraints of the problem as bounds on their variables.
+
+    Returns:
+        constraints (list): Name, bound and sign of each constraint, which is satisfied if
+            sign * (value - bound) <= 0.
+
+    """
+
+    constraints = []
+
+    for name, (val_type, _, minval, maxval, _, _) in Rt.optim_var_dict.items():
+        if val_type != "const":
+            continue
+        if is_digit(minval):
+            constraints.append((name, float(minval), -1.0))
+        if is_digit(maxval):
+            constraints.append((name, float(maxval), 1.0))
+
+    return constraints
+
+
+def run_surrogate_routine(prob):
+    """Run a surrogate-accelerated optimisation.
+
+    The modules are only evaluated at the points of the initial DoE and at the infill
+    points given by the maximum expected improvement of the Kriging model, weighted by the
+    probability that the constraints are satisfied. The problem is left at the best
+    feasible point.
+
+    Args:
+        prob (om.Problem object): Current problem that is being defined
+
+    """
+
+    names, xlimits = get_design_space()
+    obj_name = "Objective function " + Rt.objective[0]
+    constraints = get_surrogate_constraints()
+
+    def evaluate(x):
+        for name, value in zip(names, x):
+            prob.set_val(name, value)
+        prob.run_model()
+        g = [
+            sign * (float(prob.get_val(name)[0]) - bound) for name, bound, sign in constraints
+        ]
+        return float(prob.get_val(obj_name)[0]), np.array(g)
+
+    x, y, g = run_surrogate_optimisation(
+        evaluate, xlimits, Rt.sm_doe_nb, Rt.max_iter, Rt.tol
+    )
+
+    # The outputs and the CPACS files of the problem must be the ones of the best design
+    best = get_best_index(y, g)
+    if best != len(y) - 1:
+        log.info("The modules are run again at the best design.")
+        evaluate(x[best])
+
+
+def evaluate_doe_sample(counter: int, case: list) -> int:
+    """Run the modules of a DoE sample in a worker process of 'run_doe_samples'.
+
+    The problem is inherited from the main process (fork) and only its model is run, the
+    driver and its recorders are not used in the worker processes.
+
+    Args:
+        counter (int): Number of the sample.
+        case (list): Name and value of each design variable.
+
+    Returns:
+        counter (int): Number of the sample.
+
+    """
+
+    Rt.counter = counter
+    for name, value in case:
+        Rt.problem.set_val(name, value)
+    Rt.problem.model.run_solve_nonlinear()
+
+    return counter
+
+
+def run_doe_samples(prob):
+    """Run the samples of a DoE concurrently on 'Rt.nb_proc' processes.
+
+    The cases of the DoE generator are fixed, so that the driver runs the same ones
+    afterwards. Each sample is run in its own directory by a worker process. The driver
+    then goes through the samples without running the modules again, it only reads their
+    output CPACS, and the results are gathered in the recorder and the variable dictionary
+    as for a sequential DoE. Samples which failed in a worker process are run by the driver.
+
+    Args:
+        prob (om.Problem object): Current problem that is being defined
+
+    """
+
+    if Rt.nb_proc <= 1:
+        return
+
+    prob.final_setup()
+    generator = prob.driver.options["generator"]
+    cases = list(generator(prob.model.get_design_vars(), prob.model))
+    prob.driver.options["generator"] = om.ListGenerator(cases)
+
+    nb_proc = min(Rt.nb_proc, len(cases))
+    log.info(f"Running {len(cases)} DoE samples on {nb_proc} processes.")
+
+    Rt.problem = prob
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=nb_proc, mp_context=context) as executor:
+        futures = [
+            executor.submit(evaluate_doe_sample, Rt.counter + i, case)
+            for i, case in enumerate(cases)
+        ]
+        for i, future in enumerate(futures):
+            try:
+                Rt.evaluated_samples.add(future.result())
+            except Exception as err:
+                log.warning(f"DoE sample {Rt.counter + i} failed ({err}), it is run again.")
+    Rt.problem = None
+
+
 def generate_results(prob):
     """Create all results from the routine.
 
@@ -575,7 +777,9 @@ def generate_results(prob):
     prob.model.list_outputs()
 
     # Results processing
-    plot_results(Rt.optim_dir, "", Rt.optim_var_dict)
+    # The driver is not run by the surrogate-accelerated optimisation, its recorder is empty
+    use_driver = not (Rt.type == "Optimisation" and Rt.use_surrogate)
+    plot_results(Rt.optim_dir, "", Rt.optim_var_dict, plot_obj=use_driver)
     save_results(Rt.optim_dir, Rt.optim_var_dict)
 
 
@@ -600,6 +804,7 @@ def routine_launcher(optim_method, module_optim, wkflow_dir):
 
     # Cpacs from the ouput of the last module
     cpacs_path = Rt.modules[0].cpacs_in
+    Rt.base_tixi = open_tixi(cpacs_path)
 
     cpacs = CPACS(cpacs_path)
 
@@ -615,8 +820,18 @@ def routine_launcher(optim_method, module_optim, wkflow_dir):
     prob = om.Problem()
     create_om_problem(prob)
 
+    # Compile the updates of the geometric design variables ##
+    Rt.update_plan = compile_update_plan(
+        Rt.base_tixi, Rt.geom_dict, get_int_xpaths([module.name for module in Rt.modules])
+    )
+
     # Run the model ##
-    prob.run_driver()
+    if Rt.type == "Optimisation" and Rt.use_surrogate:
+        run_surrogate_routine(prob)
+    else:
+        if Rt.type == "DOE":
+            run_doe_samples(prob)
+        prob.run_driver()
 
     generate_results(prob)
 
@@ -0,0 +1,101 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'Optimisation/func/cpacsupdate.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import pytest
+
+from types import SimpleNamespace
+
+from ceasiompy.Optimisation.func.cpacsupdate import (
+    eval_command,
+    compile_command,
+    apply_update_plan,
+    compile_update_plan,
+)
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class DictTixi:
+    """In-memory CPACS with text elements only"""
+
+    def __init__(self, elements):
+        self.elements = elements
+
+    def checkElement(self, xpath):
+        return xpath in self.elements
+
+    def getTextElement(self, xpath):
+        return self.elements[xpath]
+
+    def updateTextElement(self, xpath, text):
+        self.elements[xpath] = text
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_compile_command():
+    """Test that only method call chains on TiGL objects are compiled"""
+
+    fuselage = SimpleNamespace(length=None)
+    fuselage.set_length = lambda value: setattr(fuselage, "length", value)
+
+    (node,) = compile_command("fuselage.set_length(fus_length)", ["fus_length"])
+    eval_command(node, {"fuselage": fuselage, "fus_length": 25.0})
+    assert fuselage.length == 25.0
+
+    for command in [
+        "__import__('os').remove('file')",
+        "fuselage.__class__",
+        "fuselage.set_length(fus_length + 1)",
+        "os.remove('file')",
+    ]:
+        with pytest.raises(ValueError):
+            compile_command(command, ["fus_length"])
+
+
+def test_update_plan():
+    """Test functions 'compile_update_plan' and 'apply_update_plan'"""
+
+    tixi = DictTixi({"/a": "1.5", "/b": "0.1;0.2", "/n": "3", "/x": "30"})
+    optim_var_dict = {
+        "a": ("des", [1.5, 2.5], 1.0, 3.0, "/a", "-"),
+        "b": ("des", [0.1, 0.3], 0.0, 1.0, "/b", "-"),
+        "n": ("des", [3.0, 4.2], 1.0, 5.0, "/n", ""),
+        "x": ("des", [30.0, 31.5], 20.0, 40.0, "/x", "-"),
+        "cl": ("obj", ["-"], "-", "-", "/cl", "-"),
+    }
+
+    plan = compile_update_plan(tixi, optim_var_dict, int_xpaths=["/n"])
+    assert [update.name for update in plan] == ["a", "b", "n", "x"]
+
+    # Only the elements declared as integers are rounded
+    apply_update_plan(tixi, plan, optim_var_dict)
+    assert tixi.elements == {"/a": "2.5", "/b": "0.3;0.2", "/n": "4", "/x": "31.5"}
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test cpacsupdate.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -0,0 +1,186 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'Optimisation/optimisation.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import shutil
+import pytest
+
+import openmdao.api as om
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import ceasiompy.Optimisation.optimisation as optimisation
+
+from ceasiompy.Optimisation.func.optimfunctions import Routine
+from ceasiompy.Optimisation.optimisation import (
+    end_sample,
+    start_sample,
+    run_doe_samples,
+    set_sample_modules,
+)
+from cpacspy.cpacsfunctions import open_tixi
+
+from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
+
+CPACS_IN_PATH = Path(CPACS_FILES_PATH, "D150_simple.xml")
+
+# =================================================================================================
+#   FIXTURES
+# =================================================================================================
+
+
+@pytest.fixture
+def rt(tmp_path, monkeypatch):
+    """Routine with an Optimisation module followed by two modules"""
+
+    wkflow_dir = Path(tmp_path, "Workflow_001")
+    routine = Routine()
+    routine.optim_dir = Path(wkflow_dir, "Results", "Optimisation")
+    routine.base_tixi = open_tixi(CPACS_IN_PATH)
+    routine.modules = [
+        SimpleNamespace(
+            name=name,
+            cpacs_in=Path(wkflow_dir, f"0{i}_{name}", "ToolInput.xml"),
+            cpacs_out=Path(wkflow_dir, f"0{i}_{name}", "ToolOutput.xml"),
+            results_dir=results_dir,
+        )
+        for i, (name, results_dir) in enumerate(
+            [
+                ("Optimisation", None),
+                ("PyAVL", Path(wkflow_dir, "Results", "PyAVL")),
+                ("SkinFriction", None),
+            ],
+            start=1,
+        )
+    ]
+
+    monkeypatch.setattr(optimisation, "Rt", routine)
+
+    return routine
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_set_sample_modules(rt, tmp_path):
+
+    sample_dir = Path(tmp_path, "sample")
+    sample_dir.mkdir()
+
+    set_sample_modules(sample_dir)
+    optim, pyavl, skf = rt.modules
+
+    # The input of the Optimisation module is passed on to the next module
+    assert optim.cpacs_in == optim.cpacs_out == Path(sample_dir, "ToolInput.xml")
+    assert not Path(sample_dir, "01_Optimisation").exists()
+
+    assert pyavl.cpacs_in == optim.cpacs_out
+    assert pyavl.cpacs_out == Path(sample_dir, "02_PyAVL", "ToolOutput.xml")
+    assert pyavl.results_dir == Path(sample_dir, "Results", "PyAVL")
+    assert pyavl.results_dir.is_dir()
+
+    assert skf.cpacs_in == pyavl.cpacs_out
+    assert skf.cpacs_out == Path(sample_dir, "03_SkinFriction", "ToolOutput.xml")
+    assert skf.results_dir is None
+    assert Path(sample_dir, "03_SkinFriction").is_dir()
+
+
+def test_start_sample(rt):
+
+    rt.counter = 2
+    start_sample()
+
+    sample_dir = Path(rt.optim_dir, "Samples", "sample_002")
+    assert rt.sample_dir == sample_dir
+    assert sample_dir.is_dir()
+
+    # Input CPACS of the sample kept in memory until a module needs it
+    assert rt.sample_cpacs == Path(sample_dir, "ToolInput.xml")
+    assert rt.modules[1].cpacs_in == rt.sample_cpacs
+    assert not rt.sample_saved
+
+    # The sample has its own copy of the base CPACS
+    assert rt.tixi is not rt.base_tixi
+    rt.tixi.updateTextElement("/cpacs/header/name", "Sample")
+    assert rt.base_tixi.getTextElement("/cpacs/header/name") != "Sample"
+
+    # Already started by a previous component
+    tixi = rt.tixi
+    start_sample()
+    assert rt.sample_dir == sample_dir
+    assert rt.tixi is tixi
+
+
+def test_end_sample(rt):
+
+    rt.type = "DOE"
+    base_tixi = rt.base_tixi
+
+    start_sample()
+    end_sample()
+
+    # DoE samples all start from the initial CPACS
+    assert rt.sample_dir is None
+    assert rt.tixi is None
+    assert rt.counter == 1
+    assert rt.base_tixi is base_tixi
+
+    start_sample()
+    assert rt.sample_dir == Path(rt.optim_dir, "Samples", "sample_001")
+
+    # An optimisation iteration starts from the output of the previous one
+    rt.type = "Optimisation"
+    rt.modules[-1].cpacs_out.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy(CPACS_IN_PATH, rt.modules[-1].cpacs_out)
+    end_sample()
+
+    assert rt.counter == 2
+    assert rt.base_tixi is not base_tixi
+
+
+def test_run_doe_samples(rt):
+
+    prob = om.Problem()
+    prob.model.add_subsystem("comp", om.ExecComp("y = 2 * x"), promotes=["*"])
+    prob.model.add_design_var("x", lower=0.0, upper=1.0)
+    prob.model.add_objective("y")
+    prob.driver = om.DOEDriver(om.UniformGenerator(num_samples=4))
+    prob.setup()
+
+    # Sequential DoE, nothing is done before the driver
+    run_doe_samples(prob)
+    assert isinstance(prob.driver.options["generator"], om.UniformGenerator)
+    assert not rt.evaluated_samples
+
+    rt.nb_proc = 2
+    run_doe_samples(prob)
+
+    # The driver runs the samples evaluated by the worker processes
+    assert isinstance(prob.driver.options["generator"], om.ListGenerator)
+    assert rt.evaluated_samples == {0, 1, 2, 3}
+    assert rt.problem is None
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test optimisation.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
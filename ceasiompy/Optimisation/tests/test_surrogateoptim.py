@@ -0,0 +1,149 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'Optimisation/func/surrogateoptim.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import numpy as np
+
+from pytest import approx
+from scipy.stats import norm
+
+from ceasiompy.Optimisation.func.surrogateoptim import (
+    get_best_index,
+    get_infill_point,
+    expected_improvement,
+    probability_of_feasibility,
+    run_surrogate_optimisation,
+)
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class QuadraticModel:
+    """Surrogate model of (x - 0.3)**2 with a variance which increases with the distance
+    to the training point x = 0."""
+
+    def predict_values(self, x):
+        return (x[:, :1] - 0.3) ** 2
+
+    def predict_variances(self, x):
+        return 0.01 * x[:, :1] ** 2
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_expected_improvement():
+
+    sm = QuadraticModel()
+    y_min = 0.5
+
+    # No uncertainty at the training point, only the improvement of the mean
+    assert expected_improvement(sm, np.array([[0.0]]), y_min)[0] == approx(0.5 - 0.09)
+    assert expected_improvement(sm, np.array([[0.0]]), 0.0)[0] == 0.0
+
+    x = np.array([[1.0]])
+    mean, std = 0.49, 0.1
+    z = (y_min - mean) / std
+    ei = (y_min - mean) * norm.cdf(z) + std * norm.pdf(z)
+    assert expected_improvement(sm, x, y_min)[0] == approx(ei)
+
+    # Points with a better mean have a larger expected improvement
+    ei = expected_improvement(sm, np.array([[0.3], [0.6], [0.9]]), y_min)
+    assert ei[0] > ei[1] > ei[2] > 0.0
+
+
+def test_get_infill_point():
+
+    sm = QuadraticModel()
+    xlimits = np.array([[-1.0, 1.0]])
+
+    x_new, ei = get_infill_point(sm, xlimits, y_min=0.5, random_state=0)
+
+    assert xlimits[0, 0] <= x_new[0] <= xlimits[0, 1]
+    assert x_new[0] == approx(0.3, abs=0.1)
+    assert ei == approx(expected_improvement(sm, x_new.reshape(1, -1), 0.5)[0])
+
+
+def test_run_surrogate_optimisation():
+
+    evaluations = []
+
+    def evaluate(x):
+        evaluations.append(x)
+        return float((x[0] - 0.3) ** 2), np.array([])
+
+    xlimits = np.array([[-1.0, 1.0]])
+    x, y, g = run_surrogate_optimisation(evaluate, xlimits, nb_doe=4, max_eval=10, tol=1e-8)
+
+    # Each evaluation of the module chain is returned
+    assert len(y) == len(evaluations) == len(x)
+    assert 4 < len(y) <= 10
+    assert np.all((x >= -1.0) & (x <= 1.0))
+
+    # Infill points improve the best value of the initial DoE
+    assert y.min() <= y[:4].min()
+    assert x[np.argmin(y)][0] == approx(0.3, abs=0.05)
+    assert g.shape == (len(y), 0)
+
+
+def test_probability_of_feasibility():
+
+    sm = QuadraticModel()
+    x = np.array([[0.3], [1.0]])
+
+    # Mean of the constraint at 0 and 0.49 with std 0.03 and 0.1
+    pof = probability_of_feasibility([sm], x)
+    assert pof[0] == approx(0.5)
+    assert pof[1] == approx(norm.cdf(-4.9))
+
+    assert np.all(probability_of_feasibility([], x) == 1.0)
+
+
+def test_get_best_index():
+
+    y = np.array([0.0, 1.0, 2.0])
+
+    assert get_best_index(y, np.array([[1.0], [-1.0], [0.0]])) == 1
+
+    # Smallest violation if no point is feasible
+    assert get_best_index(y, np.array([[1.0], [3.0], [0.5]])) == 2
+
+
+def test_run_surrogate_optimisation_constraints():
+
+    def evaluate(x):
+        # The unconstrained minimum (0.3) is infeasible, x >= 0.5
+        return float((x[0] - 0.3) ** 2), np.array([0.5 - x[0]])
+
+    xlimits = np.array([[-1.0, 1.0]])
+    x, y, g = run_surrogate_optimisation(evaluate, xlimits, nb_doe=4, max_eval=15, tol=1e-8)
+
+    best = get_best_index(y, g)
+    assert g[best, 0] <= 0.0
+    assert x[best][0] == approx(0.5, abs=0.1)
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test surrogateoptim.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -18,10 +18,13 @@ Utils for PyAVL module.
 import numpy as np
 
 from pydantic import validate_call
+from ceasiompy.PyAVL.func.plot import convert_ps_to_pdf
+from ceasiompy.utils.ceasiompyutils import run_software
 
 from pathlib import Path
 from numpy import ndarray
 from itertools import product
+from concurrent.futures import ThreadPoolExecutor
 from ambiance import Atmosphere
 from tixi3.tixi3wrapper import Tixi3
 from ceasiompy.utils.generalclasses import Point
@@ -31,6 +34,7 @@ from typing import (
     TextIO,
 )
 
+from ceasiompy.PyAVL import SOFTWARE_NAME
 from ceasiompy.utils.commonxpath import REF_XPATH
 from ceasiompy import (
     log,
@@ -158,6 +162,49 @@ def duplicate_elements(*lists: List) -> Tuple[List, ...]:
 
     return tuple(new_lists)
 
+
+def run_avl_case(case_dir_path: Path, command_path: Path, save_fig: bool) -> None:
+    """
+    Run AVL in a case directory with the commands of command_path.
+    """
+
+    with open(command_path, "r") as command_file:
+        run_software(
+            software_name=SOFTWARE_NAME,
+            arguments=[""],
+            wkdir=case_dir_path,
+            with_mpi=False,
+            stdin=command_file,
+        )
+
+    if save_fig:
+        convert_ps_to_pdf(case_dir_path)
+
+
+def run_avl_cases(cases: List[Tuple[Path, Path]], nb_cpu: int, save_fig: bool) -> None:
+    """
+    Run up to nb_cpu AVL cases at the same time. Each case runs in its own directory
+    in a separate AVL process.
+
+    Args:
+        cases (List[Tuple[Path, Path]]): Case directory and command file of each case.
+        nb_cpu (int): Number of AVL processes run at the same time.
+        save_fig (bool): Convert the AVL plots to pdf.
+
+    """
+
+    nb_workers = max(1, min(int(nb_cpu), len(cases)))
+    log.info(f"Running {len(cases)} AVL cases on {nb_workers} cpu(s).")
+
+    with ThreadPoolExecutor(max_workers=nb_workers) as executor:
+        futures = [
+            executor.submit(run_avl_case, case_dir_path, command_path, save_fig)
+            for case_dir_path, command_path in cases
+        ]
+        for future in futures:
+            future.result()
+
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
@@ -19,9 +19,9 @@ the vortex-lattice method (VLM)
 #   IMPORTS
 # ==============================================================================
 
-from ceasiompy.PyAVL.func.plot import convert_ps_to_pdf
 from ceasiompy.PyAVL.func.results import get_avl_results
 from ceasiompy.PyAVL.func.utils import (
+    run_avl_cases,
     create_case_dir,
     duplicate_elements,
 )
@@ -29,18 +29,12 @@ from ceasiompy.PyAVL.func.config import (
     write_command_file,
     retrieve_gui_values,
 )
-from ceasiompy.utils.ceasiompyutils import (
-    call_main,
-    run_software,
-)
+from ceasiompy.utils.ceasiompyutils import call_main
 
 from pathlib import Path
 from cpacspy.cpacspy import CPACS
 
-from ceasiompy.PyAVL import (
-    MODULE_NAME,
-    SOFTWARE_NAME,
-)
+from ceasiompy.PyAVL import MODULE_NAME
 
 # =================================================================================================
 #    MAIN
@@ -51,8 +45,9 @@ def main(cpacs: CPACS, results_dir: Path) -> None:
     """
     Run AVL calculations on specified CPACS file.
         1. Load the necessary data.
-        2. Run avl with p, q, r rate deflections.
-        3. Run avl with control surfaces deflections.
+        2. Write avl cases with p, q, r rate deflections.
+        3. Write avl cases with control surfaces deflections.
+        4. Run all cases on nb_cpu processors.
     """
 
     # 1. Load the necessary data
@@ -85,6 +80,7 @@ def main(cpacs: CPACS, results_dir: Path) -> None:
         list(set(rotation_rate_list)),
     )
     first_cases = len(new_alt_list)
+    cases = []
 
     for i_case, alt in enumerate(new_alt_list):
         mach = new_mach_list[i_case]
@@ -121,17 +117,7 @@ def main(cpacs: CPACS, results_dir: Path) -> None:
             alt=alt,
         )
 
-        run_software(
-            software_name=SOFTWARE_NAME,
-            arguments=[""],
-            wkdir=case_dir_path,
-            with_mpi=False,
-            nb_cpu=nb_cpu,
-            stdin=open(str(command_path), "r"),
-        )
-
-        if save_fig:
-            convert_ps_to_pdf(case_dir_path)
+        cases.append((case_dir_path, command_path))
 
     if control_surface_list != [0.0]:
 
@@ -184,17 +170,11 @@ def main(cpacs: CPACS, results_dir: Path) -> None:
                 elevator=elevator,
             )
 
-            run_software(
-                software_name=SOFTWARE_NAME,
-                arguments=[""],
-                wkdir=case_dir_path,
-                with_mpi=False,
-                nb_cpu=nb_cpu,
-                stdin=open(str(command_path), "r"),
-            )
+            cases.append((case_dir_path, command_path))
 
-            if save_fig:
-                convert_ps_to_pdf(case_dir_path)
+    #
+    # 4. Run all cases
+    run_avl_cases(cases, nb_cpu, save_fig)
 
     get_avl_results(cpacs, results_dir)
 
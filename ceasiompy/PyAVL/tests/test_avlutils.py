@@ -0,0 +1,108 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions of 'ceasiompy/PyAVL/func/utils.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import time
+import unittest
+import threading
+
+from pathlib import Path
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+
+from ceasiompy.utils.decorators import log_test
+from ceasiompy.PyAVL.func.utils import run_avl_cases
+
+from ceasiompy.utils.ceasiompytest import CeasiompyTest
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class FakeAvl:
+    """Replaces 'run_software', records the AVL runs and the number of concurrent runs"""
+
+    def __init__(self, failed_case: str = None):
+        self.failed_case = failed_case
+        self.runs = []
+        self.nb_running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, software_name, arguments, wkdir, with_mpi, stdin):
+        with self.lock:
+            self.nb_running += 1
+            self.max_running = max(self.max_running, self.nb_running)
+
+        time.sleep(0.05)
+
+        with self.lock:
+            self.nb_running -= 1
+            self.runs.append((wkdir.name, stdin.read()))
+
+        if wkdir.name == self.failed_case:
+            raise RuntimeError("AVL error")
+
+
+class TestAvlUtils(CeasiompyTest):
+
+    def get_cases(self, tmp_dir: str, nb_cases: int):
+        cases = []
+        for i in range(nb_cases):
+            case_dir_path = Path(tmp_dir, f"Case{i}")
+            case_dir_path.mkdir()
+            command_path = Path(case_dir_path, "avl_commands.txt")
+            command_path.write_text(f"commands {i}")
+            cases.append((case_dir_path, command_path))
+        return cases
+
+    @log_test
+    def test_run_avl_cases(self) -> None:
+        fake_avl = FakeAvl()
+
+        with TemporaryDirectory() as tmp_dir, patch(
+            "ceasiompy.PyAVL.func.utils.run_software", fake_avl
+        ):
+            run_avl_cases(self.get_cases(tmp_dir, 5), nb_cpu=2, save_fig=False)
+
+        # Each case is run once in its own directory, with its own commands
+        self.assertEqual(
+            sorted(fake_avl.runs), [(f"Case{i}", f"commands {i}") for i in range(5)]
+        )
+        self.assertEqual(fake_avl.max_running, 2)
+
+    @log_test
+    def test_run_avl_cases_failure(self) -> None:
+        fake_avl = FakeAvl(failed_case="Case1")
+
+        with TemporaryDirectory() as tmp_dir, patch(
+            "ceasiompy.PyAVL.func.utils.run_software", fake_avl
+        ):
+            with self.assertRaises(RuntimeError):
+                run_avl_cases(self.get_cases(tmp_dir, 3), nb_cpu=1, save_fig=False)
+
+        # The cases submitted before the error are all run
+        self.assertEqual(len(fake_avl.runs), 3)
+        self.assertEqual(fake_avl.max_running, 1)
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=0)
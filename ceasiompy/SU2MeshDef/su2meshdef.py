@@ -30,7 +30,9 @@ TODO:
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
 
 import numpy as np
 import pandas as pd
@@ -717,11 +719,66 @@ def generate_config_deformed_mesh(cpacs_path, cpacs_out_path, skip_config=False,
     tixi.save(cpacs_out_path)
 
 
+def run_ted_deformation(ted_dir: Path, nb_proc: int) -> List[str]:
+    """Function to run the configuration files of one TED directory with SU2_DEF.
+
+    The configuration files are run in alphabetical order to respect the order of
+    execution (DEF, ROT_, ROT_sym). SU2_DEF is run with 'ted_dir' as working directory,
+    the working directory of the Python process is not changed. The completely deformed
+    meshes are then moved in the MESH directory and the intermediate meshes are removed.
+
+    Args:
+        ted_dir (Path): Path to the TED directory.
+        nb_proc (int): Number of processors to use for SU2_DEF.
+
+    Returns:
+        (List[str]): Names of the deformed meshes moved in the MESH directory.
+
+    Raises:
+        RuntimeError: If SU2_DEF fails for one of the configuration files.
+
+    """
+
+    for cfg_file in sorted(ted_dir.glob("Config*")):
+
+        if cfg_file.is_file():
+            returncode = run_software(
+                software_name="SU2_DEF",
+                arguments=[cfg_file.name],
+                wkdir=ted_dir,
+                with_mpi=True,
+                nb_cpu=nb_proc,
+            )
+            if returncode != 0:
+                raise RuntimeError(
+                    f"SU2_DEF failed for TED {ted_dir.name} with {cfg_file.name} "
+                    f"(return code {returncode}), see logfile_SU2_DEF.log."
+                )
+        else:
+            raise ValueError("Not correct configuration file to run!")
+
+    su2_def_mesh_list = []
+
+    for su2_mesh in sorted(ted_dir.glob("*.su2")):
+        if not su2_mesh.name.startswith("_"):
+            # Rename in the MESH directory, on the same filesystem the mesh is not copied
+            su2_mesh.replace(Path(ted_dir.parent, su2_mesh.name))
+            log.info(su2_mesh.name + " mesh has been moved in the MESH dir.")
+            su2_def_mesh_list.append(su2_mesh.name)
+        else:
+            # Remove the intermediate SU2 meshes from the config folder (to save space)
+            su2_mesh.unlink()
+            log.info(su2_mesh.name + " mesh has been deleted from the temp mesh.")
+
+    return su2_def_mesh_list
+
+
 def run_mesh_deformation(tixi, wkdir):
     """Function to run all the configuration files with SU2_DEF.
 
     Function 'run_mesh_deformation' will check in all config file directory and run
-    SU2_DEF for each config file in order.
+    SU2_DEF for each config file in order. The TED directories are independent, they are
+    run concurrently and share the processors.
 
     Args:
         tixi (handles): TIXI Handle
@@ -731,46 +788,41 @@ def run_mesh_deformation(tixi, wkdir):
 
     log.info("All mesh deformation will be preformed.")
 
-    mesh_dir = os.path.join(wkdir, "MESH")
-    if not os.path.exists(mesh_dir):
-        raise OSError("The MESH directory : " + mesh_dir + "does not exit!")
-    os.chdir(mesh_dir)
-
-    su2_def_mesh_list = []
+    mesh_dir = Path(wkdir, "MESH")
+    if not mesh_dir.exists():
+        raise OSError(f"The MESH directory : {mesh_dir} does not exit!")
 
-    ted_dir_list = [dir for dir in os.listdir(mesh_dir) if "_TED_" in dir]
+    ted_dir_list = sorted(dir for dir in mesh_dir.iterdir() if "_TED_" in dir.name)
 
     # Get number of proc to use from the CPACS file
-    nb_proc = get_value_or_default(tixi, SU2_NB_CPU_XPATH, get_reasonable_nb_cpu())
+    nb_proc = int(get_value_or_default(tixi, SU2_NB_CPU_XPATH, get_reasonable_nb_cpu()))
 
-    # Iterate in all TED directory
-    for dir in sorted(ted_dir_list):
-        ted_dir = os.path.join(mesh_dir, dir)
-        os.chdir(ted_dir)
-
-        cfg_file_list = [file for file in os.listdir(ted_dir) if "Config" in file]
-
-        # Run all the config file in the directory with SU2_DEF, in alphabetical
-        # order to respect the order of execution (DEF,ROT_,ROT_sym)
-        for cfg_file in sorted(cfg_file_list):
-
-            if os.path.isfile(cfg_file):
-                run_software("SU2_DEF", cfg_file, ted_dir, nb_proc)
-            else:
-                raise ValueError("Not correct configuration file to run!")
-
-        tmp_su2_mesh_list = [file for file in os.listdir(ted_dir) if ".su2" in file]
+    su2_def_mesh_list = []
 
-        # Copy in the completely deform mesh in the MESH directory
-        for su2_mesh in tmp_su2_mesh_list:
-            if not su2_mesh.startswith("_"):
-                shutil.copyfile(su2_mesh, os.path.join("..", su2_mesh))
-                log.info(su2_mesh + " mesh has been copied in the MESH dir.")
-                su2_def_mesh_list.append(su2_mesh)
+    if ted_dir_list:
+        nb_workers = max(1, min(len(ted_dir_list), nb_proc))
+        ted_nb_proc = max(1, nb_proc // nb_workers)
+        log.info(
+            f"{len(ted_dir_list)} TED directories will be run on {nb_workers} "
+            f"worker(s) with {ted_nb_proc} cpu(s) each."
+        )
+
+        with ThreadPoolExecutor(max_workers=nb_workers) as executor:
+            futures = [
+                executor.submit(run_ted_deformation, ted_dir, ted_nb_proc)
+                for ted_dir in ted_dir_list
+            ]
+
+            failed = []
+            for ted_dir, future in zip(ted_dir_list, futures):
+                try:
+                    su2_def_mesh_list += future.result()
+                except Exception as error:
+                    log.error(f"Mesh deformation in {ted_dir} failed: {error}")
+                    failed.append(ted_dir.name)
 
-            # Remove all SU2 mesh from the config folder (to save space)
-            os.remove(su2_mesh)
-            log.info(su2_mesh + " mesh has been deleted from the temp mesh.")
+        if failed:
+            raise ValueError("Mesh deformation did not end correctly for: " + ", ".join(failed))
 
     # Add the list of available SU2 deformed mesh in the CPACS file
     add_string_vector(tixi, SU2_DEF_MESH_XPATH, su2_def_mesh_list)
@@ -0,0 +1,152 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'ceasiompy/SU2MeshDef/su2meshdef.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import pytest
+
+from pathlib import Path
+
+import ceasiompy.SU2MeshDef.su2meshdef as su2meshdef
+
+from ceasiompy.SU2MeshDef.su2meshdef import run_ted_deformation, run_mesh_deformation
+from ceasiompy.utils.commonpaths import CPACS_FILES_PATH
+from ceasiompy.utils.commonxpath import SU2_DEF_MESH_XPATH, SU2_NB_CPU_XPATH
+from cpacspy.cpacsfunctions import create_branch, get_string_vector, open_tixi
+
+CPACS_IN_PATH = Path(CPACS_FILES_PATH, "simpletest_cpacs.xml")
+
+CONFIG_NAMES = ["Config_DEF.cfg", "Config_ROT_sym.cfg", "Config_ROT_.cfg"]
+
+# =================================================================================================
+#   FIXTURES
+# =================================================================================================
+
+
+@pytest.fixture
+def su2_def_calls(monkeypatch):
+    """Replace SU2_DEF by a function which writes an intermediate mesh for each
+    configuration file and the final mesh for the last one."""
+
+    calls = []
+
+    def run_software(software_name, arguments, wkdir, with_mpi, nb_cpu):
+        calls.append((wkdir.name, arguments[0], nb_cpu))
+
+        # SU2_DEF error, the meshes are not written
+        if "failed" in wkdir.name:
+            return 1
+
+        Path(wkdir, f"_{Path(arguments[0]).stem}.su2").touch()
+        if arguments[0] == "Config_ROT_sym.cfg":
+            Path(wkdir, f"{wkdir.name}.su2").touch()
+
+        return 0
+
+    monkeypatch.setattr(su2meshdef, "run_software", run_software)
+
+    return calls
+
+
+def create_ted_dir(mesh_dir: Path, name: str) -> Path:
+    ted_dir = Path(mesh_dir, name)
+    ted_dir.mkdir(parents=True)
+    for config_name in CONFIG_NAMES:
+        Path(ted_dir, config_name).touch()
+    return ted_dir
+
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def test_run_ted_deformation(tmp_path, su2_def_calls):
+
+    ted_dir = create_ted_dir(Path(tmp_path, "MESH"), "Wing_TED_aileron")
+
+    su2_def_mesh_list = run_ted_deformation(ted_dir, 2)
+
+    # Configuration files run in alphabetical order
+    assert su2_def_calls == [
+        ("Wing_TED_aileron", "Config_DEF.cfg", 2),
+        ("Wing_TED_aileron", "Config_ROT_.cfg", 2),
+        ("Wing_TED_aileron", "Config_ROT_sym.cfg", 2),
+    ]
+
+    # Final mesh moved in the MESH directory, intermediate meshes removed
+    assert su2_def_mesh_list == ["Wing_TED_aileron.su2"]
+    assert Path(tmp_path, "MESH", "Wing_TED_aileron.su2").exists()
+    assert not list(ted_dir.glob("*.su2"))
+
+
+def test_run_ted_deformation_failure(tmp_path, su2_def_calls):
+
+    ted_dir = create_ted_dir(Path(tmp_path, "MESH"), "Wing_TED_failed")
+
+    # The next configuration files are not run
+    with pytest.raises(RuntimeError, match="Wing_TED_failed with Config_DEF.cfg"):
+        run_ted_deformation(ted_dir, 1)
+
+    assert len(su2_def_calls) == 1
+
+
+def test_run_mesh_deformation(tmp_path, su2_def_calls):
+
+    mesh_dir = Path(tmp_path, "MESH")
+    for name in ["Wing_TED_aileron", "Wing_TED_flap"]:
+        create_ted_dir(mesh_dir, name)
+
+    tixi = open_tixi(CPACS_IN_PATH)
+    create_branch(tixi, SU2_NB_CPU_XPATH)
+    tixi.updateTextElement(SU2_NB_CPU_XPATH, "5")
+
+    run_mesh_deformation(tixi, tmp_path)
+
+    # The processors are shared between the TED directories
+    assert len(su2_def_calls) == 6
+    assert all(nb_cpu == 2 for _, _, nb_cpu in su2_def_calls)
+
+    assert sorted(get_string_vector(tixi, SU2_DEF_MESH_XPATH)) == [
+        "Wing_TED_aileron.su2",
+        "Wing_TED_flap.su2",
+    ]
+
+
+def test_run_mesh_deformation_failure(tmp_path, su2_def_calls):
+
+    mesh_dir = Path(tmp_path, "MESH")
+    for name in ["Wing_TED_aileron", "Wing_TED_failed", "Wing_TED_flap"]:
+        create_ted_dir(mesh_dir, name)
+
+    tixi = open_tixi(CPACS_IN_PATH)
+    create_branch(tixi, SU2_NB_CPU_XPATH)
+    tixi.updateTextElement(SU2_NB_CPU_XPATH, "1")
+
+    # All TED directories are run, the failed ones are reported together
+    with pytest.raises(ValueError, match="for: Wing_TED_failed$"):
+        run_mesh_deformation(tixi, tmp_path)
+
+    assert Path(mesh_dir, "Wing_TED_aileron.su2").exists()
+    assert Path(mesh_dir, "Wing_TED_flap.su2").exists()
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test su2meshdef.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -48,6 +48,10 @@ TEMPLATE_TYPE = ["EULER", "RANS"]
 SOFTWARE_NAME = "SU2_CFD"
 REQUIRED_VERSION = "8.1.0"
 
+# Approximate size of .su2 mesh file (in bytes) handled efficiently by one MPI rank,
+# used to split the available processors between concurrent SU2 cases
+MESH_SIZE_PER_PROC = 10e6
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
@@ -636,17 +636,7 @@ def load_su2_mesh_paths(tixi: Tixi3, results_dir: Path) -> Tuple[List[Path], Lis
     # Using ceasiompy.db
     elif tixi.getTextElement(USED_SU2_MESH_XPATH + "type") == "db":
         log.info("Using ceasiompy.db data")
-        su2_mesh_list = su2_mesh_list_from_db(tixi)
-
-        # Upload files to the working directory and update paths
-        su2_mesh_paths = []
-        for (su2_mesh, aircraft_name, deformation, angle) in su2_mesh_list:
-            su2_path = results_dir / f"{aircraft_name}_{deformation}_{angle}.su2"
-
-            with open(su2_path, 'w') as su2_file:
-                su2_file.write(su2_mesh.decode('utf-8'))
-
-            su2_mesh_paths.append(Path(su2_path))
+        su2_mesh_paths = su2_mesh_list_from_db(tixi, results_dir)
 
     if not tixi.checkElement(SU2MESH_XPATH):
         create_branch(tixi, SU2MESH_XPATH)
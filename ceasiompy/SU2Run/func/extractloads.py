@@ -23,7 +23,9 @@ from six import iteritems
 from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
 
 from pathlib import Path
+from functools import lru_cache
 from ceasiompy.utils.configfiles import ConfigFile
+from ceasiompy.SU2Run.func.meshindex import get_su2_mesh_index
 from scipy.sparse import csr_matrix
 from typing import Dict, List
 
@@ -116,22 +118,13 @@ def compute_forces(
         mesh.GetPointData().SetActiveVectors(name)
 
     # Write CSV force file
-    ids = range(len(coord))
-
-    su2_mesh_path = config_dict.get("MESH_FILENAME")
-    marker_dict = get_mesh_markers_ids(su2_mesh_path)
-    mesh_maker = []
+    ids = np.arange(len(coord))
 
     # Find which marker corespond to which ids
-    for i in range(len(coord)):
-        id_to_test = ids[i]
-
-        find = False
-        for marker, ids_list in marker_dict.items():
-            if not find:
-                if id_to_test in ids_list:
-                    mesh_maker.append(marker)
-                    find = True
+    su2_mesh_path = Path(config_dict.get("MESH_FILENAME"))
+    mesh_maker = get_mesh_markers_labels(
+        str(su2_mesh_path), su2_mesh_path.stat().st_mtime, len(coord)
+    )
 
     df = pd.DataFrame(
         data={
@@ -203,13 +196,11 @@ def write_updated_mesh(mesh: vtk.vtkXMLUnstructuredGridWriter, new_vtu_file_path
     writer.SetFileName(new_vtu_file_path)
     writer.Update()
 
-# TODO: maybe create some exteral function to cope with SU2Mesh, get coord, get marker ...
-
 
 def get_mesh_markers_ids(su2_mesh_path: str) -> Dict:
     """
     Create dictionary which contains for each mesh marker (keys)
-    a list of ids belonging to this mesh marker.
+    an array of ids belonging to this mesh marker.
 
     Args:
         su2_mesh_path (str): Path to the SU2 mesh file.
@@ -219,36 +210,15 @@ def get_mesh_markers_ids(su2_mesh_path: str) -> Dict:
 
     """
 
-    marker_dict = {}
-    ids_list = []
-    start_line_nb = 1e14
-
-    with open(su2_mesh_path) as f:
-        for line_nb, line in enumerate(f.readlines()):
-
-            if "Farfield" in line:
-                start_line_nb = 1e14
-
-            if "NPERIODIC" in line:
-                start_line_nb = 1e14
+    _, marker_ids = get_su2_mesh_index(su2_mesh_path)
 
-            if "MARKER_TAG" in line and "Farfield" not in line:
-                new_marker = line.split("=")[1][:-1]  # -1 to remove "\n"
-                marker_dict[new_marker] = []
-                start_line_nb = line_nb
-                log.info("Mesh marker " + new_marker + " start at line: " + str(start_line_nb))
+    # Farfield points are not part of the aircraft surface
+    marker_dict = {
+        marker: ids for marker, ids in marker_ids.items() if "Farfield" not in marker
+    }
 
-            if line_nb > start_line_nb + 1:
-                line_ids = line.split("\n")[0].split()
-                marker_dict[new_marker].append(int(line_ids[1]))
-                marker_dict[new_marker].append(int(line_ids[2]))
-                marker_dict[new_marker].append(int(line_ids[3]))
-
-    # Remove double elements and replace ids by coordinates
     for key, ids_list in marker_dict.items():
-        new_ids_list = list(dict.fromkeys(ids_list))
-        marker_dict[key] = new_ids_list
-        log.info("Mesh marker " + key + " contains " + str(len(marker_dict[key])) + " points.")
+        log.info("Mesh marker " + key + " contains " + str(len(ids_list)) + " points.")
 
     if not marker_dict:
         log.warning('No "MARKER_TAG" has been found in the mesh!')
@@ -256,6 +226,51 @@ def get_mesh_markers_ids(su2_mesh_path: str) -> Dict:
     return marker_dict
 
 
+@lru_cache(maxsize=8)
+def get_cached_mesh_markers_labels(
+    su2_mesh_path: str, mtime: float, nb_points: int
+) -> np.ndarray:
+    """
+    Returns the name of the mesh marker of each point id, kept in memory for the cases
+    sharing the same mesh file. The returned array is shared, use 'get_mesh_markers_labels'.
+    """
+
+    marker_dict = get_mesh_markers_ids(su2_mesh_path)
+    marker_names = list(marker_dict.keys())
+
+    # Index of the marker of each point, -1 refers to the last name which is "None"
+    labels = np.full(nb_points, -1, dtype=np.int64)
+
+    # Go through the markers backwards, so the first marker found overwrites the others
+    for marker_idx in reversed(range(len(marker_names))):
+        ids = marker_dict[marker_names[marker_idx]]
+        labels[ids[(ids >= 0) & (ids < nb_points)]] = marker_idx
+
+    return np.array(marker_names + ["None"], dtype=object)[labels]
+
+
+def get_mesh_markers_labels(su2_mesh_path: str, mtime: float, nb_points: int) -> np.ndarray:
+    """
+    Returns the name of the mesh marker of each point id (from 0 to nb_points - 1).
+    If a point belongs to several markers, the first marker found in the mesh is kept,
+    points which do not belong to any marker are labelled "None".
+
+    The labels are cached, cases sharing the same mesh file only read it once. The
+    modification time of the mesh file (mtime) is part of the key to detect modified meshes.
+
+    Args:
+        su2_mesh_path (str): Path to the SU2 mesh file.
+        mtime (float): Modification time of the SU2 mesh file.
+        nb_points (int): Number of points to label.
+
+    Returns:
+        (np.ndarray): Marker name of each point, a new array at each call.
+
+    """
+
+    return get_cached_mesh_markers_labels(su2_mesh_path, mtime, nb_points).copy()
+
+
 def extract_loads(results_files_dir: Path) -> None:
     """
     Extract loads from a SU2 resuts file.
@@ -0,0 +1,262 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Streaming reader for SU2 mesh files.
+
+The mesh file is read once, line by line, to build an index with the size and byte offset
+of each section (NDIME, NELEM, NPOIN, NMARK and every MARKER_TAG). The node ids of each
+marker are then read by seeking directly to the marker sections. The index and the marker
+ids are saved next to the mesh and reused as long as the size and modification time of the
+mesh file do not change.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from functools import lru_cache
+from typing import (
+    Dict,
+    Tuple,
+)
+
+from ceasiompy import log
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Increase when the content of the index changes, to invalidate existing index files
+SU2_MESH_INDEX_VERSION = 3
+
+SU2_MESH_SECTIONS = ["NDIME", "NELEM", "NPOIN", "NMARK"]
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_su2_mesh_key(su2_mesh_path: Path) -> str:
+    """
+    Returns a hash of the size and the modification time of a SU2 mesh file.
+    """
+
+    stat = Path(su2_mesh_path).stat()
+    key = f"{stat.st_size}_{stat.st_mtime_ns}_{SU2_MESH_INDEX_VERSION}"
+
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def get_su2_mesh_index_paths(su2_mesh_path: Path) -> Tuple[Path, Path]:
+    """
+    Returns the paths of the index file (.json) and of the marker ids file (.npz)
+    stored next to a SU2 mesh file.
+    """
+
+    su2_mesh_path = Path(su2_mesh_path)
+    index_name = f".{su2_mesh_path.name}.index"
+
+    return (
+        Path(su2_mesh_path.parent, index_name + ".json"),
+        Path(su2_mesh_path.parent, index_name + ".npz"),
+    )
+
+
+def build_su2_mesh_index(su2_mesh_path: Path) -> Dict:
+    """
+    Read a SU2 mesh file line by line and build its index.
+
+    Args:
+        su2_mesh_path (Path): Path to the SU2 mesh file.
+
+    Returns:
+        index (Dict): Size and offset (in bytes) of the data of each section and marker of
+            the mesh.
+
+    """
+
+    index = {
+        "key": get_su2_mesh_key(su2_mesh_path),
+        "sections": {},
+        "markers": {},
+    }
+
+    marker = None
+    offset = 0
+
+    with open(su2_mesh_path, "rb") as f:
+        for line in f:
+            offset += len(line)
+
+            # Comments and data lines of the current section
+            if line.startswith(b"%") or b"=" not in line:
+                continue
+
+            key, value = line.decode("utf-8").split("=", 1)
+            key = key.strip()
+
+            if key in SU2_MESH_SECTIONS:
+                marker = None
+                index["sections"][key] = {"size": int(value.split()[0]), "offset": offset}
+
+            elif key == "MARKER_TAG":
+                marker = value.strip()
+                index["markers"][marker] = {"size": 0, "offset": offset}
+
+            elif key == "MARKER_ELEMS" and marker is not None:
+                index["markers"][marker] = {"size": int(value.split()[0]), "offset": offset}
+
+            else:
+                marker = None
+
+    return index
+
+
+def read_su2_mesh_marker_ids(su2_mesh_path: Path, index: Dict) -> Dict[str, np.ndarray]:
+    """
+    Read the node ids of each marker of a SU2 mesh file. Only the marker sections are read,
+    at the offsets of the index.
+
+    Args:
+        su2_mesh_path (Path): Path to the SU2 mesh file.
+        index (Dict): Index of the mesh file, from 'build_su2_mesh_index'.
+
+    Returns:
+        marker_ids (Dict[str, np.ndarray]): Unique node ids of each marker.
+
+    """
+
+    marker_ids = {}
+
+    with open(su2_mesh_path, "rb") as f:
+        for marker, section in index["markers"].items():
+            f.seek(section["offset"])
+
+            ids_list = []
+            nb_elems = 0
+            while nb_elems < section["size"]:
+                line = f.readline()
+                # End of the file or next section, the marker has less elements than declared
+                if not line or b"=" in line:
+                    break
+                if line.startswith(b"%"):
+                    continue
+                # Marker element lines are: element type, node ids
+                ids_list.extend(line.split()[1:])
+                nb_elems += 1
+
+            marker_ids[marker] = pd.unique(np.array(ids_list, dtype=np.int64))
+
+    return marker_ids
+
+
+def save_su2_mesh_index(
+    su2_mesh_path: Path,
+    index: Dict,
+    marker_ids: Dict[str, np.ndarray],
+) -> None:
+    """
+    Save the index of a SU2 mesh file next to it.
+    """
+
+    index_path, ids_path = get_su2_mesh_index_paths(su2_mesh_path)
+
+    try:
+        np.savez(ids_path, *[marker_ids[marker] for marker in index["markers"]])
+        with open(index_path, "w") as f:
+            json.dump(index, f)
+    except OSError as error:
+        log.warning(f"Could not save the index of {su2_mesh_path}: {error}")
+
+
+def load_su2_mesh_index(su2_mesh_path: Path, key: str) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Load the index saved next to a SU2 mesh file.
+    Returns (None, None) if there is no index or if it does not correspond to the key.
+    """
+
+    index_path, ids_path = get_su2_mesh_index_paths(su2_mesh_path)
+
+    if not (index_path.exists() and ids_path.exists()):
+        return None, None
+
+    try:
+        with open(index_path, "r") as f:
+            index = json.load(f)
+
+        if index.get("key") != key:
+            return None, None
+
+        with np.load(ids_path) as ids_file:
+            marker_ids = {
+                marker: ids_file[f"arr_{i}"] for i, marker in enumerate(index["markers"])
+            }
+
+    except (OSError, ValueError, KeyError) as error:
+        log.warning(f"Could not load the index of {su2_mesh_path}: {error}")
+        return None, None
+
+    return index, marker_ids
+
+
+@lru_cache(maxsize=8)
+def get_cached_su2_mesh_index(
+    su2_mesh_path: str,
+    key: str,
+) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Returns the index of a SU2 mesh file for a given key, from the index file if it is
+    up to date, otherwise by reading the mesh. The result is also kept in memory.
+    """
+
+    index, marker_ids = load_su2_mesh_index(su2_mesh_path, key)
+
+    if index is None:
+        log.info(f"Indexing SU2 mesh {su2_mesh_path}.")
+        index = build_su2_mesh_index(su2_mesh_path)
+        marker_ids = read_su2_mesh_marker_ids(su2_mesh_path, index)
+        save_su2_mesh_index(su2_mesh_path, index, marker_ids)
+
+    return index, marker_ids
+
+
+def get_su2_mesh_index(su2_mesh_path: Path) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Returns the index of a SU2 mesh file and the node ids of each of its markers.
+
+    Args:
+        su2_mesh_path (Path): Path to the SU2 mesh file.
+
+    Returns:
+        index (Dict): Size and offset (in bytes) of the data of each section and marker of
+            the mesh.
+        marker_ids (Dict[str, np.ndarray]): Unique node ids of each marker.
+
+    """
+
+    su2_mesh_path = Path(su2_mesh_path)
+    if not su2_mesh_path.is_file():
+        raise FileNotFoundError(f"The SU2 mesh file at '{su2_mesh_path}' has not been found!")
+
+    return get_cached_su2_mesh_index(str(su2_mesh_path), get_su2_mesh_key(su2_mesh_path))
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
@@ -16,13 +16,29 @@ Module to run SU2 configuration files in CEASIOMpy.
 # =================================================================================================
 
 
+import os
+import math
+
 from ceasiompy.utils.ceasiompyutils import run_software
 
-from typing import List
 from pathlib import Path
+from ceasiompy.utils.configfiles import ConfigFile
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ThreadPoolExecutor,
+    wait,
+)
 
 from ceasiompy import log
-from ceasiompy.SU2Run import SOFTWARE_NAME
+from ceasiompy.SU2Run import (
+    SOFTWARE_NAME,
+    MESH_SIZE_PER_PROC,
+)
 from ceasiompy.utils.commonnames import (
     CONFIG_CFD_NAME,
     CONFIG_DYNSTAB_NAME,
@@ -65,29 +81,45 @@ def check_force_files_exists(config_dir: Path) -> None:
         )
 
 
-def run_SU2_multi(wkdir: Path, nb_proc: int = 1) -> None:
+def get_case_nb_proc(config_file: Path, nb_proc: int) -> int:
+    """
+    Returns the number of MPI ranks to use for one SU2 case, estimated from the size of its
+    mesh file and limited by the total number of processors available (nb_proc).
     """
-    Run in the given working directory SU2 calculations.
-    The working directory must have a folder structure created by 'SU2Config' module.
 
-    Args:
-        wkdir (Path): Path to the working directory.
-        nb_proc (int): Number of processor that should be used to run the calculation in parallel.
+    mesh_path = Path(str(ConfigFile(config_file)["MESH_FILENAME"]))
+    if not mesh_path.is_absolute():
+        mesh_path = Path(config_file.parent, mesh_path)
+
+    if not mesh_path.exists():
+        log.warning(f"Mesh {mesh_path} not found, {nb_proc} cpu(s) will be used for this case.")
+        return nb_proc
+
+    case_nb_proc = math.ceil(mesh_path.stat().st_size / MESH_SIZE_PER_PROC)
 
+    return max(1, min(nb_proc, case_nb_proc))
+
+
+def get_su2_cases(wkdir: Path, nb_proc: int) -> List[Tuple[Path, Path, int]]:
+    """
+    Returns for each SU2 case of the working directory its configuration directory,
+    its configuration file and the number of processors it should run on.
     """
 
-    case_dir_list = [dir for dir in wkdir.iterdir() if "Case" in dir.name]
+    case_dir_list = sorted(dir for dir in wkdir.iterdir() if "Case" in dir.name)
 
     if not case_dir_list:
         raise FileNotFoundError(
             f"No Case directory has been found in the working directory: {wkdir}."
         )
 
+    su2_cases = []
+
     # Iterate through different cases.
     for case_dir in case_dir_list:
 
         # Iterate through [no_deformation, aileron, elevator, rudder].
-        for config_dir in case_dir.iterdir():
+        for config_dir in sorted(case_dir.iterdir()):
             config_file = [
                 c for c in config_dir.iterdir()
                 if (c.name == CONFIG_CFD_NAME or c.name == CONFIG_DYNSTAB_NAME)
@@ -95,16 +127,92 @@ def run_SU2_multi(wkdir: Path, nb_proc: int = 1) -> None:
 
             check_config_file_exists(config_file, config_dir)
 
-            run_software(
-                software_name=SOFTWARE_NAME,
-                arguments=[config_file[0]],
-                wkdir=config_dir,
-                with_mpi=True,
-                nb_cpu=nb_proc,
-                log_bool=True,
+            su2_cases.append(
+                (config_dir, config_file[0], get_case_nb_proc(config_file[0], nb_proc))
             )
 
-            check_force_files_exists(config_dir)
+    return su2_cases
+
+
+def run_SU2_case(config_dir: Path, config_file: Path, nb_proc: int) -> None:
+    """
+    Run one SU2 case and check that its force files have been written.
+    """
+
+    run_software(
+        software_name=SOFTWARE_NAME,
+        arguments=[config_file],
+        wkdir=config_dir,
+        with_mpi=True,
+        nb_cpu=nb_proc,
+        log_bool=True,
+    )
+
+    check_force_files_exists(config_dir)
+
+
+def run_SU2_multi(wkdir: Path, nb_proc: int = 1) -> None:
+    """
+    Run in the given working directory SU2 calculations.
+    The working directory must have a folder structure created by 'SU2Config' module.
+
+    The 'nb_proc' processors are shared between the cases: each case gets a number of MPI
+    ranks depending on the size of its mesh, and as many cases as fit on the processors
+    are run concurrently. The remaining cases are queued and started as soon as enough
+    processors are released.
+
+    Args:
+        wkdir (Path): Path to the working directory.
+        nb_proc (int): Number of processor that should be used to run the calculations.
+
+    """
+
+    cpu_count = os.cpu_count()
+    if cpu_count is not None:
+        nb_proc = min(nb_proc, cpu_count)
+    nb_proc = max(1, nb_proc)
+
+    # Start with the largest cases, smaller ones fill the remaining processors
+    pending = sorted(get_su2_cases(wkdir, nb_proc), key=lambda case: case[2], reverse=True)
+    nb_cases = len(pending)
+
+    running: Dict = {}
+    failed: Dict[Path, Exception] = {}
+    free_proc = nb_proc
+
+    with ThreadPoolExecutor(max_workers=nb_proc) as executor:
+        while pending or running:
+
+            for case in list(pending):
+                config_dir, config_file, case_nb_proc = case
+                if case_nb_proc <= free_proc:
+                    pending.remove(case)
+                    free_proc -= case_nb_proc
+                    log.info(f"Starting SU2 case {config_dir} on {case_nb_proc} cpu(s).")
+                    future = executor.submit(run_SU2_case, config_dir, config_file, case_nb_proc)
+                    running[future] = case
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                config_dir, _, case_nb_proc = running.pop(future)
+                free_proc += case_nb_proc
+
+                try:
+                    future.result()
+                    log.info(f"SU2 case {config_dir} completed.")
+                except Exception as error:
+                    log.error(f"SU2 case {config_dir} failed: {error}")
+                    failed[config_dir] = error
+
+            log.info(f"{nb_cases - len(pending) - len(running)}/{nb_cases} SU2 cases finished.")
+
+    if failed:
+        raise ValueError(
+            f"{len(failed)}/{nb_cases} SU2 case(s) did not end correctly: "
+            + ", ".join(str(config_dir) for config_dir in failed)
+        )
+
 
 # =================================================================================================
 #    MAIN
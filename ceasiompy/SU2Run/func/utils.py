@@ -23,6 +23,8 @@ from cpacspy.cpacsfunctions import get_value
 from pathlib import Path
 from tixi3.tixi3wrapper import Tixi3
 from ceasiompy.utils.configfiles import ConfigFile
+from ceasiompy.SU2Run.func.meshindex import get_su2_mesh_index
+from ceasiompy.Database.func.utils import db_to_file
 from ceasiompy.Database.func.storing import CeasiompyDb
 from typing import (
     Dict,
@@ -214,36 +216,31 @@ def get_mesh_markers(su2_mesh_path: Path) -> Dict:
         "wall": [],
     }
 
-    with open(su2_mesh_path) as f:
-
-        for line in f.readlines():
-            if "MARKER_TAG" not in line:
-                continue
-
-            marker = line.split("=")[1].strip()
-
-            if "farfield" in marker.lower():
-                mesh_markers["farfield"].append(marker)
-                log.info(f"'{marker}' marker has been marked as farfield.")
-            elif "symmetry" in marker.lower():
-                mesh_markers["symmetry"].append(marker)
-                log.info(f"'{marker}' marker has been marked as symmetry.")
-            elif marker.endswith(ENGINE_INTAKE_SUFFIX):
-                mesh_markers["engine_intake"].append(marker)
-                log.info(f"'{marker}' marker has been marked as engine_intake.")
-            elif marker.endswith(ENGINE_EXHAUST_SUFFIX):
-                mesh_markers["engine_exhaust"].append(marker)
-                log.info(f"'{marker}' marker has been marked as engine_exhaust.")
-            elif marker.endswith(ACTUATOR_DISK_INLET_SUFFIX):
-                mesh_markers["actuator_disk_inlet"].append(marker)
-                log.info(f"'{marker}' marker has been marked as actuator_disk_inlet.")
-            elif marker.endswith(ACTUATOR_DISK_OUTLET_SUFFIX):
-                mesh_markers["actuator_disk_outlet"].append(marker)
-                log.info(f"'{marker}' marker has been marked as actuator_disk_outlet.")
-            else:
-                # In SU2 wings and fuselages are marked as wall.
-                mesh_markers["wall"].append(marker)
-                log.info(f"'{marker}' marker has been marked as wall.")
+    index, _ = get_su2_mesh_index(su2_mesh_path)
+
+    for marker in index["markers"]:
+        if "farfield" in marker.lower():
+            mesh_markers["farfield"].append(marker)
+            log.info(f"'{marker}' marker has been marked as farfield.")
+        elif "symmetry" in marker.lower():
+            mesh_markers["symmetry"].append(marker)
+            log.info(f"'{marker}' marker has been marked as symmetry.")
+        elif marker.endswith(ENGINE_INTAKE_SUFFIX):
+            mesh_markers["engine_intake"].append(marker)
+            log.info(f"'{marker}' marker has been marked as engine_intake.")
+        elif marker.endswith(ENGINE_EXHAUST_SUFFIX):
+            mesh_markers["engine_exhaust"].append(marker)
+            log.info(f"'{marker}' marker has been marked as engine_exhaust.")
+        elif marker.endswith(ACTUATOR_DISK_INLET_SUFFIX):
+            mesh_markers["actuator_disk_inlet"].append(marker)
+            log.info(f"'{marker}' marker has been marked as actuator_disk_inlet.")
+        elif marker.endswith(ACTUATOR_DISK_OUTLET_SUFFIX):
+            mesh_markers["actuator_disk_outlet"].append(marker)
+            log.info(f"'{marker}' marker has been marked as actuator_disk_outlet.")
+        else:
+            # In SU2 wings and fuselages are marked as wall.
+            mesh_markers["wall"].append(marker)
+            log.info(f"'{marker}' marker has been marked as wall.")
 
     # Check if markers were found
     if not any(mesh_markers.values()):
@@ -269,25 +266,26 @@ def check_control_surface(input_string: str) -> str:
 
 
 def retrieve_su2_mesh(
-    su2_mesh_list: List[Tuple[bytes, str, str, float]],
+    su2_mesh_paths: List[Path],
     aircraft_name: str,
     angle: float,
     deformation_list: List[str],
-) -> List[Tuple[bytes, str, str, float]]:
+    results_dir: Path,
+) -> None:
     """
-    Connect to ceasiompy.db and retrieve the first .su2 mesh for:
+    Connect to ceasiompy.db and retrieve the last .su2 mesh for:
         - Specific aircraft name
         - Specific deformation from the deformation_list
         - Specific angle of deformation
 
-    Append the result to the su2_mesh_list.
+    The mesh is written in results_dir and its path is appended to su2_mesh_paths.
     """
     db = CeasiompyDb()
 
     for deformation in deformation_list:
         # Query to retrieve the last su2_data value
         query = """
-                    SELECT su2_file_data
+                    SELECT su2_file_hash, su2_file_data
                     FROM gmsh_data
                     WHERE aircraft = ? AND deformation = ? AND angle = ?
                     ORDER BY timestamp DESC
@@ -295,14 +293,20 @@ def retrieve_su2_mesh(
                 """
         db.cursor.execute(query, (aircraft_name, deformation, angle))
 
-        su2_mesh: bytes = db.cursor.fetchone()
+        su2_file_hash, su2_file_data = db.cursor.fetchone()
         log.info(
             f"Loading .su2 file for aircraft {aircraft_name}, "
             f"deformation {deformation} of angle {angle} [deg]."
         )
-        su2_mesh_list.append(
-            (su2_mesh[0], aircraft_name, deformation, angle)
-        )
+
+        su2_path = Path(results_dir, f"{aircraft_name}_{deformation}_{angle}.su2")
+        if su2_file_hash is not None:
+            db_to_file(db.cursor, su2_file_hash, su2_path)
+        else:
+            # Mesh stored uncompressed by an older version
+            su2_path.write_bytes(su2_file_data)
+
+        su2_mesh_paths.append(su2_path)
 
     db.close()
 
@@ -331,16 +335,18 @@ def get_surface_pitching_omega(oscillation_type: str, omega: float) -> str:
         raise ValueError("Invalid oscillation_type in get_surface_pitching_omega.")
 
 
-def su2_mesh_list_from_db(
-    tixi: Tixi3
-) -> List[Tuple[bytes, str, str, float]]:
+def su2_mesh_list_from_db(tixi: Tixi3, results_dir: Path) -> List[Path]:
+    """
+    Write the meshes selected in the CPACS from ceasiompy.db to results_dir.
+    Returns their paths.
+    """
 
     aircraft_name = get_value(tixi, USED_SU2_MESH_XPATH + "list")
-    su2_mesh_list = []
+    su2_mesh_paths = []
 
     # No control surfaces
     if not get_value(tixi, SU2_CONTROL_SURF_BOOL_XPATH):
-        retrieve_su2_mesh(su2_mesh_list, aircraft_name, 0.0, ["no_deformation"])
+        retrieve_su2_mesh(su2_mesh_paths, aircraft_name, 0.0, ["no_deformation"], results_dir)
 
     else:
         angles = str(get_value(tixi, SU2_CONTROL_SURF_ANGLE_XPATH))
@@ -348,11 +354,15 @@ def su2_mesh_list_from_db(
 
         for angle in angles_list:
             if angle != 0.0:
-                retrieve_su2_mesh(su2_mesh_list, aircraft_name, angle, CONTROL_SURFACE_LIST)
+                retrieve_su2_mesh(
+                    su2_mesh_paths, aircraft_name, angle, CONTROL_SURFACE_LIST, results_dir
+                )
             else:
-                retrieve_su2_mesh(su2_mesh_list, aircraft_name, 0.0, ["no_deformation"])
+                retrieve_su2_mesh(
+                    su2_mesh_paths, aircraft_name, 0.0, ["no_deformation"], results_dir
+                )
 
-    return su2_mesh_list
+    return su2_mesh_paths
 
 
 def get_su2_cfg_tpl(tpl_type: str) -> Path:
@@ -0,0 +1,77 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions of 'ceasiompy/SU2Run/func/extractloads.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import numpy as np
+
+from pathlib import Path
+
+from ceasiompy.SU2Run.func.extractloads import get_mesh_markers_labels
+
+SU2_MESH_SMALL = """% Small SU2 mesh
+NDIME= 3
+NELEM= 1
+10 0 1 2 3 0
+NPOIN= 5
+0.0 0.0 0.0 0
+1.0 0.0 0.0 1
+0.0 1.0 0.0 2
+0.0 0.0 1.0 3
+1.0 1.0 1.0 4
+NMARK= 3
+MARKER_TAG= Wing
+MARKER_ELEMS= 1
+5 0 1 2
+MARKER_TAG= Fuselage
+MARKER_ELEMS= 1
+5 1 2 3
+MARKER_TAG= Farfield
+MARKER_ELEMS= 1
+5 0 1 4
+"""
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def test_get_mesh_markers_labels(tmp_path):
+    """Test function 'get_mesh_markers_labels'"""
+
+    su2_mesh_path = Path(tmp_path, "mesh.su2")
+    su2_mesh_path.write_text(SU2_MESH_SMALL)
+    mtime = su2_mesh_path.stat().st_mtime
+
+    labels = get_mesh_markers_labels(str(su2_mesh_path), mtime, 5)
+
+    # First marker kept for shared points, farfield points are not labelled
+    np.testing.assert_array_equal(labels, ["Wing", "Wing", "Wing", "Fuselage", "None"])
+
+    # The cached labels are not modified by a caller
+    labels[0] = "Modified"
+    np.testing.assert_array_equal(
+        get_mesh_markers_labels(str(su2_mesh_path), mtime, 5),
+        ["Wing", "Wing", "Wing", "Fuselage", "None"],
+    )
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test test_su2extractloads.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
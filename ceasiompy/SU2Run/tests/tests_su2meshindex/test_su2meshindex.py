@@ -0,0 +1,126 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions of 'ceasiompy/SU2Run/func/meshindex.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import os
+import shutil
+import numpy as np
+
+from pathlib import Path
+
+import pytest
+from ceasiompy.SU2Run.func.meshindex import (
+    build_su2_mesh_index,
+    get_su2_mesh_index,
+    get_su2_mesh_index_paths,
+    read_su2_mesh_marker_ids,
+)
+
+MODULE_DIR = Path(__file__).parent
+SU2_MESH_1 = Path(MODULE_DIR.parent, "tests_su2utils", "test_mesh1.su2")
+
+SU2_MESH_SMALL = """% Small SU2 mesh
+NDIME= 3
+NELEM= 1
+10 0 1 2 3 0
+NPOIN= 4
+0.0 0.0 0.0 0
+1.0 0.0 0.0 1
+0.0 1.0 0.0 2
+0.0 0.0 1.0 3
+NMARK= 2
+MARKER_TAG= Wing
+MARKER_ELEMS= 2
+5 0 1 2
+5 1 2 3
+MARKER_TAG= Farfield
+MARKER_ELEMS= 1
+5 0 1 3
+"""
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def test_build_su2_mesh_index():
+    """Test function 'build_su2_mesh_index'"""
+
+    index = build_su2_mesh_index(SU2_MESH_1)
+    marker_ids = read_su2_mesh_marker_ids(SU2_MESH_1, index)
+
+    assert list(index["markers"]) == [
+        "D150_VAMP_SL1",
+        "D150_VAMP_FL1",
+        "D150_VAMP_HL1",
+        "D150_VAMP_W1",
+        "D150_ENGINE1_In",
+        "D150_ENGINE1_Ex",
+        "D150_PROPELLER1_AD_Inlet",
+        "D150_PROPELLER1_AD_Outlet",
+        "Farfield",
+    ]
+    assert index["sections"]["NDIME"]["size"] == 3
+    assert index["sections"]["NMARK"]["size"] == 7
+    assert index["markers"]["D150_VAMP_SL1"]["size"] == 5956
+    np.testing.assert_array_equal(marker_ids["D150_VAMP_SL1"][:4], [0, 1, 1382, 2])
+
+
+def test_su2_mesh_index_offsets(tmp_path):
+    """Test that the offsets of the index point to the data of the sections"""
+
+    su2_mesh_path = Path(tmp_path, "mesh.su2")
+    su2_mesh_path.write_text(SU2_MESH_SMALL)
+
+    index = build_su2_mesh_index(su2_mesh_path)
+
+    with open(su2_mesh_path, "rb") as f:
+        f.seek(index["sections"]["NPOIN"]["offset"])
+        assert f.readline() == b"0.0 0.0 0.0 0\n"
+        f.seek(index["markers"]["Farfield"]["offset"])
+        assert f.readline() == b"5 0 1 3\n"
+
+
+def test_get_su2_mesh_index(tmp_path):
+    """Test function 'get_su2_mesh_index'"""
+
+    su2_mesh_path = Path(tmp_path, "mesh.su2")
+    su2_mesh_path.write_text(SU2_MESH_SMALL)
+
+    with pytest.raises(FileNotFoundError):
+        get_su2_mesh_index(Path(tmp_path, "This_file_do_not_exist.su2"))
+
+    index, marker_ids = get_su2_mesh_index(su2_mesh_path)
+
+    assert all(path.exists() for path in get_su2_mesh_index_paths(su2_mesh_path))
+    assert index["sections"]["NPOIN"]["size"] == 4
+    np.testing.assert_array_equal(marker_ids["Wing"], [0, 1, 2, 3])
+    np.testing.assert_array_equal(marker_ids["Farfield"], [0, 1, 3])
+
+    # The saved index is invalidated when the mesh changes
+    shutil.copyfile(SU2_MESH_1, su2_mesh_path)
+    os.utime(su2_mesh_path, ns=(0, 0))
+    index, _ = get_su2_mesh_index(su2_mesh_path)
+    assert "Wing" not in index["markers"]
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test test_su2meshindex.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -0,0 +1,81 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions of 'ceasiompy/SU2Run/func/runconfigfiles.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+from pathlib import Path
+
+import pytest
+from ceasiompy.SU2Run import MESH_SIZE_PER_PROC
+from ceasiompy.SU2Run.func.runconfigfiles import get_case_nb_proc, get_su2_cases
+from ceasiompy.utils.commonnames import CONFIG_CFD_NAME
+from ceasiompy.utils.configfiles import ConfigFile
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def write_case(case_dir: Path, mesh_size: int) -> Path:
+    """Write a configuration file pointing to a dummy mesh of a given size."""
+
+    mesh_path = Path(case_dir, "mesh.su2")
+    case_dir.mkdir(parents=True)
+    mesh_path.write_bytes(b"0" * mesh_size)
+
+    cfg = ConfigFile()
+    cfg["MESH_FILENAME"] = str(mesh_path)
+    config_file = Path(case_dir, CONFIG_CFD_NAME)
+    cfg.write_file(config_file)
+
+    return config_file
+
+
+def test_get_case_nb_proc(tmp_path):
+    """Test function 'get_case_nb_proc'"""
+
+    small_cfg = write_case(Path(tmp_path, "small"), 10)
+    large_cfg = write_case(Path(tmp_path, "large"), int(2.5 * MESH_SIZE_PER_PROC))
+
+    assert get_case_nb_proc(small_cfg, 8) == 1
+    assert get_case_nb_proc(large_cfg, 8) == 3
+    assert get_case_nb_proc(large_cfg, 2) == 2
+
+
+def test_get_su2_cases(tmp_path):
+    """Test function 'get_su2_cases'"""
+
+    with pytest.raises(FileNotFoundError):
+        get_su2_cases(tmp_path, 4)
+
+    write_case(Path(tmp_path, "Case01_alt0_mach0.3", "no_deformation"), 10)
+    write_case(Path(tmp_path, "Case00_alt0_mach0.3", "no_deformation"), 10)
+
+    su2_cases = get_su2_cases(tmp_path, 4)
+
+    assert [case[0].parent.name for case in su2_cases] == [
+        "Case00_alt0_mach0.3",
+        "Case01_alt0_mach0.3",
+    ]
+    assert all(case[2] == 1 for case in su2_cases)
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test test_su2runconfigfiles.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -25,6 +25,7 @@ from ceasiompy.SU2Run.func.utils import (
     get_mesh_markers,
     get_su2_aerocoefs,
     get_wetted_area,
+    get_surface_pitching_omega,
 )
 from pytest import approx
 
@@ -112,6 +113,16 @@ def test_get_wetted_area():
     assert get_wetted_area(SU2_LOGFILE_NO_WETTED_AREA) == 0
 
 
+def test_get_surface_pitching_omega():
+    """Test function 'get_surface_pitching_omega'"""
+
+    assert get_surface_pitching_omega("alpha", 2.0) == "0.0 2.0 0.0 "
+    assert get_surface_pitching_omega("beta", 2.0) == "0.0 0.0 2.0 "
+
+    with pytest.raises(ValueError):
+        get_surface_pitching_omega("gamma", 2.0)
+
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
@@ -22,6 +22,7 @@ from ceasiompy.SkinFriction import include_gui
 
 from ceasiompy.utils.commonxpath import (
     SF_XPATH,
+    AEROPERFORMANCE_XPATH,
     GEOM_XPATH,
     PLOT_XPATH,
     RANGE_CRUISE_ALT_XPATH,
@@ -131,6 +132,14 @@ cpacs_inout.add_output(
     xpath=PLOT_XPATH + "/aeroMapToPlot",
 )
 
+cpacs_inout.add_output(
+    var_name="skin_friction_aero_maps",
+    default_value=None,
+    unit="-",
+    descr="Copies of the aeroMaps with the skin friction coefficients ('_SkinFriction')",
+    xpath=AEROPERFORMANCE_XPATH + "/aeroMap",
+)
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
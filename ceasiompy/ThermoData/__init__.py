@@ -33,6 +33,10 @@ include_gui = True
 MODULE_DIR = Path(__file__).parent
 MODULE_NAME = MODULE_DIR.name
 
+# ===== Engine deck grid =====
+ENGINE_DECK_ALT = [float(alt) for alt in range(0, 15001, 1000)]  # [m]
+ENGINE_DECK_MACH = [round(0.05 * i, 2) for i in range(2, 19)]  # [-]
+ENGINE_DECK_FN = [float(round(500 * 2 ** (i / 4))) for i in range(41)]  # [N], 500 N to 512 kN
 
 # =================================================================================================
 #    MAIN
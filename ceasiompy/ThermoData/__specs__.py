@@ -21,8 +21,12 @@ from ceasiompy import log
 from ceasiompy.ThermoData import include_gui
 
 from ceasiompy.utils.commonxpath import (
+    ENGINE_BC,
     RANGE_XPATH,
+    AEROPERFORMANCE_XPATH,
+    ENGINE_DECK_XPATH,
     ENGINE_TYPE_XPATH,
+    ENGINE_NB_PROC_XPATH,
     SU2_FIXED_CL_XPATH,
     SU2_TARGET_CL_XPATH,
 )
@@ -61,6 +65,34 @@ cpacs_inout.add_input(
     gui_group="User inputs",
 )
 
+cpacs_inout.add_input(
+    var_name="engine_deck",
+    var_type=bool,
+    default_value=False,
+    unit=None,
+    descr="Interpolate the engine conditions from a deck of solved (alt, Mach, Fn) grid "
+    "points shared by all workflows, the missing points are solved and added to the deck. "
+    "The interpolated conditions are not exact solutions of the engine model, see the "
+    "limitations in the README of ThermoData",
+    xpath=ENGINE_DECK_XPATH,
+    gui=include_gui,
+    gui_name="Use engine deck",
+    gui_group="User inputs",
+)
+
+cpacs_inout.add_input(
+    var_name="nb_proc",
+    var_type=int,
+    default_value=1,
+    unit=None,
+    descr="Number of processes to solve the engine cases, 1 to solve each case from the "
+    "previous one",
+    xpath=ENGINE_NB_PROC_XPATH,
+    gui=include_gui,
+    gui_name="Nb of processes",
+    gui_group="CPU",
+)
+
 # ==============================================================================
 #   GUI OUTPUTS
 # ==============================================================================
@@ -82,6 +114,22 @@ cpacs_inout.add_output(
     xpath=SU2_FIXED_CL_XPATH,
 )
 
+cpacs_inout.add_output(
+    var_name="default_aero_map",
+    default_value=None,
+    unit="-",
+    descr="aeroMap 'DefaultAeromap' at the cruise conditions",
+    xpath=AEROPERFORMANCE_XPATH + "/aeroMap",
+)
+
+cpacs_inout.add_output(
+    var_name="engine_bc",
+    default_value=None,
+    unit="-",
+    descr="Total temperature and pressure at the engine outlet for each aeroMap point",
+    xpath=ENGINE_BC,
+)
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
@@ -0,0 +1,339 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Run the pyCycle engine problems for several flight conditions.
+
+The pyCycle problem of an engine is set up once and solved for each flight condition,
+starting from the solution of the previous one. The cases can also be split in contiguous
+groups solved in separate processes, each with its own engine problem.
+
+Solved points of the (alt, Mach, Fn) grid are saved in an engine deck file shared by all
+workflows. Conditions inside the grid are interpolated from the deck, only the missing grid
+points are solved. Conditions outside the grid are solved directly.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+
+from ceasiompy.ThermoData.func.turbofan import TurbofanDeck
+from ceasiompy.ThermoData.func.turbojet import TurbojetDeck
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Optional,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.commonpaths import ENGINE_DECKS_PATH
+from ceasiompy.ThermoData import (
+    MODULE_DIR,
+    ENGINE_DECK_FN,
+    ENGINE_DECK_ALT,
+    ENGINE_DECK_MACH,
+)
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+ENGINE_NAMES = {0: "turbojet", 1: "turbofan"}
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_engine_deck(engine_type: int):
+    """
+    Returns the pyCycle problem of an engine, 0 for a turbojet, 1 for a turbofan.
+    """
+
+    if engine_type == 0:
+        return TurbojetDeck()
+
+    return TurbofanDeck()
+
+
+def run_engine_deck(
+    engine_type: int,
+    cases: List[Tuple[float, float, float]],
+) -> List[Tuple[Tuple, bool]]:
+    """
+    Solve the engine problem for each (alt, MN, Fn) case, in the order of the list.
+    Returns the outputs of each case and whether the solver converged.
+    """
+
+    engine_deck = get_engine_deck(engine_type)
+
+    solved = []
+    for alt, MN, Fn in cases:
+        results = engine_deck.run(alt, MN, Fn)
+        solved.append((results, engine_deck.converged))
+
+    return solved
+
+
+def solve_engine_cases(
+    engine_type: int,
+    cases: List[Tuple[float, float, float]],
+    nb_proc: int = 1,
+) -> List[Tuple[Tuple, bool]]:
+    """
+    Returns the nozzle outlet conditions of an engine for each case and whether the
+    solver converged.
+
+    Args:
+        engine_type (int): 0 for a turbojet, 1 for a turbofan.
+        cases (List[Tuple[float, float, float]]): Altitude [m], Mach number and net
+            force [N] of each case.
+        nb_proc (int): Number of processes, each solving a contiguous part of the cases.
+
+    Returns:
+        solved (List[Tuple[Tuple, bool]]): Outputs of 'turbojet_analysis' or
+            'turbofan_analysis' and convergence of each case.
+
+    """
+
+    if not cases:
+        return []
+
+    nb_proc = max(1, min(int(nb_proc), len(cases)))
+
+    if nb_proc == 1:
+        return run_engine_deck(engine_type, cases)
+
+    # Contiguous groups, so that each process keeps the warm start of close conditions
+    groups = [list(group) for group in np.array_split(np.arange(len(cases)), nb_proc)]
+    log.info(f"Running {len(cases)} engine cases on {nb_proc} processes.")
+
+    with ProcessPoolExecutor(max_workers=nb_proc) as executor:
+        futures = [
+            executor.submit(run_engine_deck, engine_type, [cases[i] for i in group])
+            for group in groups
+        ]
+        solved = [result for future in futures for result in future.result()]
+
+    return solved
+
+
+def run_engine_cases(
+    engine_type: int,
+    cases: List[Tuple[float, float, float]],
+    nb_proc: int = 1,
+) -> List[Tuple]:
+    """
+    Returns the nozzle outlet conditions of an engine for each case, see
+    'solve_engine_cases'.
+    """
+
+    return [results for results, _ in solve_engine_cases(engine_type, cases, nb_proc)]
+
+
+def get_engine_deck_path(engine_type: int) -> Path:
+    """
+    Returns the path of the engine deck file, which depends on the engine model source.
+    """
+
+    engine_name = ENGINE_NAMES.get(engine_type, "turbofan")
+    source = Path(MODULE_DIR, "func", f"{engine_name}.py").read_bytes()
+    source_hash = hashlib.sha256(source).hexdigest()[:12]
+
+    return Path(ENGINE_DECKS_PATH, f"{engine_name}_{source_hash}.csv")
+
+
+def load_engine_deck(deck_path: Path) -> Dict[Tuple[float, float, float], np.ndarray]:
+    """
+    Returns the outputs of each (alt, Mach, Fn) grid point saved in an engine deck file.
+    """
+
+    if not deck_path.exists():
+        return {}
+
+    df = pd.read_csv(deck_path)
+    outputs = df.drop(columns=["alt", "mach", "fn"]).to_numpy()
+
+    return {
+        (alt, mach, fn): outputs[i]
+        for i, (alt, mach, fn) in enumerate(df[["alt", "mach", "fn"]].itertuples(index=False))
+    }
+
+
+def save_engine_deck(deck_path: Path, deck: Dict[Tuple[float, float, float], np.ndarray]) -> None:
+    """
+    Add grid points to an engine deck file. The points saved meanwhile by other
+    workflows are kept.
+    """
+
+    deck = {**load_engine_deck(deck_path), **deck}
+
+    nb_outputs = len(next(iter(deck.values())))
+    df = pd.DataFrame(
+        [[*point, *outputs] for point, outputs in sorted(deck.items())],
+        columns=["alt", "mach", "fn"] + [f"out_{i}" for i in range(nb_outputs)],
+    )
+
+    deck_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = deck_path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, deck_path)
+
+
+def get_grid_bounds(value: float, grid: List[float]) -> Optional[List[float]]:
+    """
+    Returns the grid values around a value, None if the value is outside the grid.
+    """
+
+    if not grid[0] <= value <= grid[-1]:
+        return None
+
+    idx = int(np.searchsorted(grid, value))
+    if np.isclose(grid[idx], value):
+        return [grid[idx]]
+
+    return [grid[idx - 1], grid[idx]]
+
+
+def get_grid_corners(alt: float, MN: float, Fn: float) -> Optional[List[Tuple]]:
+    """
+    Returns the grid points needed to interpolate a condition, None if it is outside the grid.
+    """
+
+    bounds = [
+        get_grid_bounds(alt, ENGINE_DECK_ALT),
+        get_grid_bounds(MN, ENGINE_DECK_MACH),
+        get_grid_bounds(Fn, ENGINE_DECK_FN),
+    ]
+
+    if any(bound is None for bound in bounds):
+        return None
+
+    return list(product(*bounds))
+
+
+def interpolate_engine_deck(
+    alt: float,
+    MN: float,
+    Fn: float,
+    deck: Dict[Tuple[float, float, float], np.ndarray],
+) -> Tuple:
+    """
+    Multilinear interpolation of the outputs of the grid points around a condition.
+    """
+
+    bounds = [
+        get_grid_bounds(alt, ENGINE_DECK_ALT),
+        get_grid_bounds(MN, ENGINE_DECK_MACH),
+        get_grid_bounds(Fn, ENGINE_DECK_FN),
+    ]
+
+    outputs = 0.0
+    for corner in product(*[range(len(bound)) for bound in bounds]):
+        weight = 1.0
+        for value, bound, i in zip((alt, MN, Fn), bounds, corner):
+            if len(bound) == 2:
+                t = (value - bound[0]) / (bound[1] - bound[0])
+                weight *= t if i else 1.0 - t
+        outputs = outputs + weight * deck[tuple(bound[i] for bound, i in zip(bounds, corner))]
+
+    # Same format as the outputs of 'turbojet_analysis' and 'turbofan_analysis'
+    return tuple(np.array([output]) for output in outputs)
+
+
+def get_engine_outlet_conditions(
+    engine_type: int,
+    cases: List[Tuple[float, float, float]],
+    nb_proc: int = 1,
+    use_deck: bool = False,
+) -> List[Tuple]:
+    """
+    Returns the nozzle outlet conditions of an engine for each case, interpolated from the
+    engine deck when possible.
+
+    Args:
+        engine_type (int): 0 for a turbojet, 1 for a turbofan.
+        cases (List[Tuple[float, float, float]]): Altitude [m], Mach number and net
+            force [N] of each case.
+        nb_proc (int): Number of processes to solve the engine problem.
+        use_deck (bool): Use and complete the engine deck.
+
+    Returns:
+        results (List[Tuple]): Outputs of 'turbojet_analysis' or 'turbofan_analysis' for
+            each case.
+
+    """
+
+    if not use_deck:
+        return run_engine_cases(engine_type, cases, nb_proc)
+
+    deck_path = get_engine_deck_path(engine_type)
+    deck = load_engine_deck(deck_path)
+
+    # Grid points missing in the deck and conditions outside of the grid
+    missing_points = set()
+    outside_cases = []
+    for alt, MN, Fn in cases:
+        corners = get_grid_corners(alt, MN, Fn)
+        if corners is None:
+            outside_cases.append((alt, MN, Fn))
+        else:
+            missing_points.update(corner for corner in corners if corner not in deck)
+
+    # Sorted by Fn, Mach and altitude, so that each point is solved from a close one
+    missing_points = sorted(missing_points, key=lambda point: (point[2], point[1], point[0]))
+    to_solve = missing_points + outside_cases
+
+    log.info(
+        f"Engine deck {deck_path.name}: {len(missing_points)} grid point(s) to compute, "
+        f"{len(outside_cases)} condition(s) outside of the grid."
+    )
+
+    solved = dict(zip(to_solve, solve_engine_cases(engine_type, to_solve, nb_proc)))
+
+    # Only the converged points are added to the deck
+    new_points = {
+        point: np.concatenate(solved[point][0])
+        for point in missing_points
+        if solved[point][1]
+    }
+    if new_points:
+        save_engine_deck(deck_path, new_points)
+        deck.update(new_points)
+
+    results = []
+    for case in cases:
+        corners = get_grid_corners(*case)
+        if corners is None:
+            results.append(solved[case][0])
+        elif all(corner in deck for corner in corners):
+            results.append(interpolate_engine_deck(*case, deck))
+        else:
+            log.warning(f"Engine deck points around {case} did not converge, solving it.")
+            results.append(run_engine_cases(engine_type, [case])[0])
+
+    return results
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
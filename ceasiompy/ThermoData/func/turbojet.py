@@ -11,6 +11,7 @@ Function to run the PyCycle code for the turbojet engine
 
 """
 
+import numpy as np
 import openmdao.api as om
 
 import pycycle.api as pyc
@@ -21,179 +22,240 @@ from ceasiompy import log
 
 
 # =================================================================================================
-#   FUNCTIONS
+#   CLASSES
 # =================================================================================================
 
 
-def turbojet_analysis(alt, MN, Fn):
-    class Turbojet(pyc.Cycle):
-        def setup(self):
+class Turbojet(pyc.Cycle):
+    def setup(self):
+
+        USE_TABULAR = True
+
+        if USE_TABULAR:
+            self.options["thermo_method"] = "TABULAR"
+            self.options["thermo_data"] = pyc.AIR_JETA_TAB_SPEC
+            FUEL_TYPE = "FAR"
+
+        design = self.options["design"]
+
+        # Add engine elements
+        self.add_subsystem("fc", pyc.FlightConditions())
+        self.add_subsystem("inlet", pyc.Inlet())
+        self.add_subsystem(
+            "comp",
+            pyc.Compressor(map_data=pyc.AXI5, map_extrap=True),
+            promotes_inputs=["Nmech"],
+        )
+        self.add_subsystem("burner", pyc.Combustor(fuel_type=FUEL_TYPE))
+        self.add_subsystem(
+            "turb", pyc.Turbine(map_data=pyc.LPT2269), promotes_inputs=["Nmech"]
+        )
+        self.add_subsystem("nozz", pyc.Nozzle(nozzType="CD", lossCoef="Cv"))
+        self.add_subsystem("shaft", pyc.Shaft(num_ports=2), promotes_inputs=["Nmech"])
+        self.add_subsystem("perf", pyc.Performance(num_nozzles=1, num_burners=1))
+
+        # Connect flow stations
+        self.pyc_connect_flow("fc.Fl_O", "inlet.Fl_I", connect_w=False)
+        self.pyc_connect_flow("inlet.Fl_O", "comp.Fl_I")
+        self.pyc_connect_flow("comp.Fl_O", "burner.Fl_I")
+        self.pyc_connect_flow("burner.Fl_O", "turb.Fl_I")
+        self.pyc_connect_flow("turb.Fl_O", "nozz.Fl_I")
+
+        # Make other non-flow connections
+        # Connect turbomachinery elements to shaft
+        self.connect("comp.trq", "shaft.trq_0")
+        self.connect("turb.trq", "shaft.trq_1")
+
+        # Connnect nozzle exhaust to freestream static conditions
+        self.connect("fc.Fl_O:stat:P", "nozz.Ps_exhaust")
+
+        # Connect outputs to perfomance element
+        self.connect("inlet.Fl_O:tot:P", "perf.Pt2")
+        self.connect("comp.Fl_O:tot:P", "perf.Pt3")
+        self.connect("burner.Wfuel", "perf.Wfuel_0")
+        self.connect("inlet.F_ram", "perf.ram_drag")
+        self.connect("nozz.Fg", "perf.Fg_0")
+
+        # Add balances for design and off-design
+        balance = self.add_subsystem("balance", om.BalanceComp())
+        if design:
+
+            balance.add_balance("W", units="lbm/s", eq_units="lbf", rhs_name="Fn_target")
+            self.connect("balance.W", "inlet.Fl_I:stat:W")
+            self.connect("perf.Fn", "balance.lhs:W")
+
+            balance.add_balance(
+                "FAR", eq_units="degR", lower=1e-4, val=0.017, rhs_name="T4_target"
+            )
+            self.connect("balance.FAR", "burner.Fl_I:FAR")
+            self.connect("burner.Fl_O:tot:T", "balance.lhs:FAR")
 
-            USE_TABULAR = True
+            balance.add_balance(
+                "turb_PR", val=1.5, lower=1.001, upper=8, eq_units="hp", rhs_val=0.0
+            )
+            self.connect("balance.turb_PR", "turb.PR")
+            self.connect("shaft.pwr_net", "balance.lhs:turb_PR")
 
-            if USE_TABULAR:
-                self.options["thermo_method"] = "TABULAR"
-                self.options["thermo_data"] = pyc.AIR_JETA_TAB_SPEC
-                FUEL_TYPE = "FAR"
+        newton = self.nonlinear_solver = om.NewtonSolver()
+        newton.options["atol"] = 1e-6
+        newton.options["rtol"] = 1e-6
+        newton.options["iprint"] = 2
+        newton.options["maxiter"] = 15
+        newton.options["solve_subsystems"] = True
+        newton.options["max_sub_solves"] = 100
+        newton.options["reraise_child_analysiserror"] = False
+        newton.options["err_on_non_converge"] = True
 
-            design = self.options["design"]
+        self.linear_solver = om.DirectSolver()
 
-            # Add engine elements
-            self.add_subsystem("fc", pyc.FlightConditions())
-            self.add_subsystem("inlet", pyc.Inlet())
-            self.add_subsystem(
-                "comp",
-                pyc.Compressor(map_data=pyc.AXI5, map_extrap=True),
-                promotes_inputs=["Nmech"],
-            )
-            self.add_subsystem("burner", pyc.Combustor(fuel_type=FUEL_TYPE))
-            self.add_subsystem(
-                "turb", pyc.Turbine(map_data=pyc.LPT2269), promotes_inputs=["Nmech"]
-            )
-            self.add_subsystem("nozz", pyc.Nozzle(nozzType="CD", lossCoef="Cv"))
-            self.add_subsystem("shaft", pyc.Shaft(num_ports=2), promotes_inputs=["Nmech"])
-            self.add_subsystem("perf", pyc.Performance(num_nozzles=1, num_burners=1))
-
-            # Connect flow stations
-            self.pyc_connect_flow("fc.Fl_O", "inlet.Fl_I", connect_w=False)
-            self.pyc_connect_flow("inlet.Fl_O", "comp.Fl_I")
-            self.pyc_connect_flow("comp.Fl_O", "burner.Fl_I")
-            self.pyc_connect_flow("burner.Fl_O", "turb.Fl_I")
-            self.pyc_connect_flow("turb.Fl_O", "nozz.Fl_I")
-
-            # Make other non-flow connections
-            # Connect turbomachinery elements to shaft
-            self.connect("comp.trq", "shaft.trq_0")
-            self.connect("turb.trq", "shaft.trq_1")
-
-            # Connnect nozzle exhaust to freestream static conditions
-            self.connect("fc.Fl_O:stat:P", "nozz.Ps_exhaust")
-
-            # Connect outputs to perfomance element
-            self.connect("inlet.Fl_O:tot:P", "perf.Pt2")
-            self.connect("comp.Fl_O:tot:P", "perf.Pt3")
-            self.connect("burner.Wfuel", "perf.Wfuel_0")
-            self.connect("inlet.F_ram", "perf.ram_drag")
-            self.connect("nozz.Fg", "perf.Fg_0")
-
-            # Add balances for design and off-design
-            balance = self.add_subsystem("balance", om.BalanceComp())
-            if design:
-
-                balance.add_balance("W", units="lbm/s", eq_units="lbf", rhs_name="Fn_target")
-                self.connect("balance.W", "inlet.Fl_I:stat:W")
-                self.connect("perf.Fn", "balance.lhs:W")
-
-                balance.add_balance(
-                    "FAR", eq_units="degR", lower=1e-4, val=0.017, rhs_name="T4_target"
-                )
-                self.connect("balance.FAR", "burner.Fl_I:FAR")
-                self.connect("burner.Fl_O:tot:T", "balance.lhs:FAR")
-
-                balance.add_balance(
-                    "turb_PR", val=1.5, lower=1.001, upper=8, eq_units="hp", rhs_val=0.0
-                )
-                self.connect("balance.turb_PR", "turb.PR")
-                self.connect("shaft.pwr_net", "balance.lhs:turb_PR")
-
-            newton = self.nonlinear_solver = om.NewtonSolver()
-            newton.options["atol"] = 1e-6
-            newton.options["rtol"] = 1e-6
-            newton.options["iprint"] = 2
-            newton.options["maxiter"] = 15
-            newton.options["solve_subsystems"] = True
-            newton.options["max_sub_solves"] = 100
-            newton.options["reraise_child_analysiserror"] = False
-
-            self.linear_solver = om.DirectSolver()
-
-            super().setup()
-
-    class MPTurbojet(pyc.MPCycle):
-        def setup(self):
-            self.pyc_add_pnt("DESIGN", Turbojet())
-
-            self.set_input_defaults("DESIGN.Nmech", 8070.0, units="rpm")
-            self.set_input_defaults("DESIGN.inlet.MN", 0.60)
-            self.set_input_defaults("DESIGN.comp.MN", 0.020)  # .2
-            self.set_input_defaults("DESIGN.burner.MN", 0.020)  # .2
-            self.set_input_defaults("DESIGN.turb.MN", 0.4)
-
-            self.pyc_add_cycle_param("burner.dPqP", 0.03)
-            self.pyc_add_cycle_param("nozz.Cv", 0.99)
-
-            super().setup()
-
-    # defining the optimization problem
-
-    prob = om.Problem()
-
-    prob.model = MPTurbojet()
-    prob.setup(check=False)
-
-    # define input values
-    prob.set_val("DESIGN.fc.alt", alt * 3.2808399, units="ft")
-    prob.set_val("DESIGN.fc.MN", MN)
-    prob.set_val(
-        "DESIGN.balance.Fn_target", Fn * 0.2248089431, units="lbf"
-    )  # 1 N = 0.2248089431 lbf
-    prob.set_val("DESIGN.balance.T4_target", 2370.0, units="degR")
-    prob.set_val("DESIGN.comp.PR", 13.5)
-    prob.set_val("DESIGN.comp.eff", 0.83)
-    prob.set_val("DESIGN.turb.eff", 0.86)
-
-    if Fn > 2700:
-        prob["DESIGN.balance.FAR"] = 0.0175506829934
-        prob["DESIGN.balance.W"] = 75.453135137
-        prob["DESIGN.balance.turb_PR"] = 4.46138725662
-        prob["DESIGN.fc.balance.Pt"] = 14.6955113159
-        prob["DESIGN.fc.balance.Tt"] = 518.665288153
-
-    elif 2700 <= Fn < 850:
-        prob["DESIGN.balance.FAR"] = 0.0175506829934
-        prob["DESIGN.balance.W"] = 50.453135137
-        prob["DESIGN.balance.turb_PR"] = 4.46138725662
-        prob["DESIGN.fc.balance.Pt"] = 14.6955113159
-        prob["DESIGN.fc.balance.Tt"] = 518.665288153
-
-    else:
-        prob["DESIGN.balance.FAR"] = 0.0175506829934
-        prob["DESIGN.balance.W"] = 10.453135137
-        prob["DESIGN.balance.turb_PR"] = 4.46138725662
-        prob["DESIGN.fc.balance.Pt"] = 14.6955113159
-        prob["DESIGN.fc.balance.Tt"] = 518.665288153
-
-    prob.set_solver_print(level=-1)
-    # prob.set_solver_print(level=2, depth=1)
-
-    prob.run_model()
-
-    print()
-
-    # command to visualize all the output of the system
-    # a = prob.model.list_outputs(val=True, units=True)
-
-    T_tot_out = convert_temperature(
-        (prob.get_val("DESIGN.nozz.throat_total.flow.Fl_O:tot:T")), "Rankine", "Kelvin"
-    )
-    V_stat_out = (prob.get_val("DESIGN.nozz.mux.Fl_O:stat:V")) * 0.3048
-    MN_out = prob.get_val("DESIGN.nozz.mux.Fl_O:stat:MN")
-    T_stat_out = convert_temperature(
-        prob.get_val("DESIGN.nozz.mux.Fl_O:stat:T"), "Rankine", "Kelvin"
-    )  # celsius
-    massflow_stat_out = prob.get_val("DESIGN.nozz.mux.Fl_O:stat:W") * 0.45359237  # kg/s
-    P_tot_out = prob.get_val("DESIGN.nozz.throat_total.flow.Fl_O:tot:P") * 6894.7573  # Pa
-    P_stat_out = prob.get_val("DESIGN.nozz.mux.Fl_O:stat:P") * 6894.7573  # Pa
-
-    return (
-        T_tot_out,
-        V_stat_out,
-        MN_out,
-        P_tot_out,
-        massflow_stat_out,
-        T_stat_out,
-        P_stat_out,
-    )
+        super().setup()
+
+
+class MPTurbojet(pyc.MPCycle):
+    def setup(self):
+        self.pyc_add_pnt("DESIGN", Turbojet())
+
+        self.set_input_defaults("DESIGN.Nmech", 8070.0, units="rpm")
+        self.set_input_defaults("DESIGN.inlet.MN", 0.60)
+        self.set_input_defaults("DESIGN.comp.MN", 0.020)  # .2
+        self.set_input_defaults("DESIGN.burner.MN", 0.020)  # .2
+        self.set_input_defaults("DESIGN.turb.MN", 0.4)
+
+        self.pyc_add_cycle_param("burner.dPqP", 0.03)
+        self.pyc_add_cycle_param("nozz.Cv", 0.99)
+
+        super().setup()
+
+
+class TurbojetDeck:
+    """Turbojet pyCycle problem, set up once and run for several flight conditions.
+
+    Each run starts from the converged state of the previous run, which is usually close
+    to the solution for the next (alt, Mach) point of an aeromap. 'converged' tells if the
+    last run converged.
+    """
+
+    def __init__(self) -> None:
+
+        self.prob = om.Problem()
+        self.prob.model = MPTurbojet()
+        self.prob.setup(check=False)
+
+        # define constant input values
+        self.prob.set_val("DESIGN.balance.T4_target", 2370.0, units="degR")
+        self.prob.set_val("DESIGN.comp.PR", 13.5)
+        self.prob.set_val("DESIGN.comp.eff", 0.83)
+        self.prob.set_val("DESIGN.turb.eff", 0.86)
+
+        self.prob.set_solver_print(level=-1)
+        # self.prob.set_solver_print(level=2, depth=1)
+
+        self.converged = False
+
+    def set_initial_guess(self, Fn):
+
+        prob = self.prob
+
+        if Fn > 2700:
+            prob["DESIGN.balance.FAR"] = 0.0175506829934
+            prob["DESIGN.balance.W"] = 75.453135137
+            prob["DESIGN.balance.turb_PR"] = 4.46138725662
+            prob["DESIGN.fc.balance.Pt"] = 14.6955113159
+            prob["DESIGN.fc.balance.Tt"] = 518.665288153
+
+        elif 2700 <= Fn < 850:
+            prob["DESIGN.balance.FAR"] = 0.0175506829934
+            prob["DESIGN.balance.W"] = 50.453135137
+            prob["DESIGN.balance.turb_PR"] = 4.46138725662
+            prob["DESIGN.fc.balance.Pt"] = 14.6955113159
+            prob["DESIGN.fc.balance.Tt"] = 518.665288153
+
+        else:
+            prob["DESIGN.balance.FAR"] = 0.0175506829934
+            prob["DESIGN.balance.W"] = 10.453135137
+            prob["DESIGN.balance.turb_PR"] = 4.46138725662
+            prob["DESIGN.fc.balance.Pt"] = 14.6955113159
+            prob["DESIGN.fc.balance.Tt"] = 518.665288153
+
+    def solve(self, alt, MN, Fn):
+
+        prob = self.prob
+
+        # define input values
+        prob.set_val("DESIGN.fc.alt", alt * 3.2808399, units="ft")
+        prob.set_val("DESIGN.fc.MN", MN)
+        prob.set_val(
+            "DESIGN.balance.Fn_target", Fn * 0.2248089431, units="lbf"
+        )  # 1 N = 0.2248089431 lbf
+
+        prob.run_model()
+
+        return self.get_results()
+
+    def get_results(self):
+
+        prob = self.prob
+
+        # command to visualize all the output of the system
+        # a = prob.model.list_outputs(val=True, units=True)
+
+        T_tot_out = convert_temperature(
+            (prob.get_val("DESIGN.nozz.throat_total.flow.Fl_O:tot:T")), "Rankine", "Kelvin"
+        )
+        V_stat_out = (prob.get_val("DESIGN.nozz.mux.Fl_O:stat:V")) * 0.3048
+        MN_out = prob.get_val("DESIGN.nozz.mux.Fl_O:stat:MN")
+        T_stat_out = convert_temperature(
+            prob.get_val("DESIGN.nozz.mux.Fl_O:stat:T"), "Rankine", "Kelvin"
+        )  # celsius
+        massflow_stat_out = prob.get_val("DESIGN.nozz.mux.Fl_O:stat:W") * 0.45359237  # kg/s
+        P_tot_out = prob.get_val("DESIGN.nozz.throat_total.flow.Fl_O:tot:P") * 6894.7573  # Pa
+        P_stat_out = prob.get_val("DESIGN.nozz.mux.Fl_O:stat:P") * 6894.7573  # Pa
+
+        return (
+            T_tot_out,
+            V_stat_out,
+            MN_out,
+            P_tot_out,
+            massflow_stat_out,
+            T_stat_out,
+            P_stat_out,
+        )
+
+    def run(self, alt, MN, Fn):
+        """Returns the nozzle outlet conditions at altitude alt [m], Mach MN and net force
+        Fn [N]. The solve is restarted from the default initial guess if it does not
+        converge from the previous converged state."""
+
+        if self.converged:
+            try:
+                results = self.solve(alt, MN, Fn)
+                if np.all(np.isfinite(np.concatenate(results))):
+                    return results
+            except om.AnalysisError:
+                pass
+            log.warning("Turbojet solve from the previous point did not converge, restarting.")
+
+        self.set_initial_guess(Fn)
+        try:
+            results = self.solve(alt, MN, Fn)
+            self.converged = bool(np.all(np.isfinite(np.concatenate(results))))
+        except om.AnalysisError:
+            results = self.get_results()
+            self.converged = False
+
+        if not self.converged:
+            log.warning(f"Turbojet solve did not converge at alt={alt} m, MN={MN}, Fn={Fn} N.")
+
+        return results
+
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def turbojet_analysis(alt, MN, Fn):
+    return TurbojetDeck().run(alt, MN, Fn)
 
 
 def write_turbojet_file(
@@ -16,10 +16,18 @@ Test functions of 'ceasiompy/ThermoData/func/turbojet_func.py'
 # =================================================================================================
 
 import numpy as np
+import openmdao.api as om
 
 from pathlib import Path
 
+from ceasiompy.ThermoData.func.enginedeck import (
+    run_engine_cases,
+    get_grid_bounds,
+    get_grid_corners,
+    interpolate_engine_deck,
+)
 from ceasiompy.ThermoData.func.turbojet import (
+    TurbojetDeck,
     turbojet_analysis,
     write_turbojet_file,
 )
@@ -55,6 +63,63 @@ def test_turbojet_func():
     np.testing.assert_almost_equal(new_sol, correct_sol, 3)
 
 
+def test_turbojet_deck():
+    """Test class 'TurbojetDeck' and function 'run_engine_cases'"""
+
+    # Solved from the previous point
+    engine_deck = TurbojetDeck()
+    engine_deck.run(2000, 0.4, 2000)
+    new_sol = engine_deck.run(1000, 0.3, 2000)
+    np.testing.assert_almost_equal(new_sol, turbojet_analysis(1000, 0.3, 2000), 3)
+
+    cases = [(1000, 0.3, 2000), (2000, 0.4, 2000), (3000, 0.5, 2000)]
+    results = run_engine_cases(0, cases, nb_proc=1)
+    results_multi = run_engine_cases(0, cases, nb_proc=2)
+    np.testing.assert_almost_equal(results, results_multi, 3)
+
+
+def test_turbojet_deck_restart(monkeypatch):
+    """Test that a warm start which does not converge is solved again from the initial guess"""
+
+    engine_deck = TurbojetDeck()
+    engine_deck.run(1000, 0.3, 2000)
+    assert engine_deck.converged
+
+    solve = engine_deck.solve
+    calls = []
+
+    def solve_not_converged_once(alt, MN, Fn):
+        calls.append((alt, MN, Fn))
+        if len(calls) == 1:
+            raise om.AnalysisError("Solver did not converge")
+        return solve(alt, MN, Fn)
+
+    monkeypatch.setattr(engine_deck, "solve", solve_not_converged_once)
+    new_sol = engine_deck.run(2000, 0.4, 2000)
+
+    assert len(calls) == 2
+    assert engine_deck.converged
+    np.testing.assert_almost_equal(new_sol, turbojet_analysis(2000, 0.4, 2000), 3)
+
+
+def test_engine_deck_interpolation():
+    """Test functions 'get_grid_corners' and 'interpolate_engine_deck'"""
+
+    assert get_grid_bounds(1500.0, [1000.0, 2000.0, 3000.0]) == [1000.0, 2000.0]
+    assert get_grid_bounds(2000.0, [1000.0, 2000.0, 3000.0]) == [2000.0]
+    assert get_grid_bounds(3500.0, [1000.0, 2000.0, 3000.0]) is None
+    assert get_grid_corners(1000.0, 0.3, 1e7) is None
+
+    corners = get_grid_corners(1500.0, 0.33, 2000.0)
+    assert len(corners) == 4
+
+    # Exact for a function linear along each axis
+    deck = {corner: np.array([corner[0] * corner[1], corner[2]]) for corner in corners}
+    np.testing.assert_almost_equal(
+        np.concatenate(interpolate_engine_deck(1500.0, 0.33, 2000.0, deck)), [495.0, 2000.0]
+    )
+
+
 def test_write_turbojet_file(tmp_path):
     """Test function 'write_turbojet_file'"""
     T_tot_out = 300
@@ -20,14 +20,10 @@ from pathlib import Path
 
 from ceasiompy.utils.ceasiompyutils import call_main
 
-from ceasiompy.ThermoData.func.turbofan import (
-    write_hbtf_file,
-    turbofan_analysis,
-)
-from ceasiompy.ThermoData.func.turbojet import (
-    turbojet_analysis,
-    write_turbojet_file,
-)
+from ceasiompy.ThermoData.func.turbofan import write_hbtf_file
+from ceasiompy.ThermoData.func.turbojet import write_turbojet_file
+from ceasiompy.ThermoData.func.enginedeck import get_engine_outlet_conditions
+from ceasiompy.utils.ceasiompyutils import bool_
 from cpacspy.cpacsfunctions import (
     create_branch,
     add_float_vector,
@@ -42,7 +38,9 @@ from ceasiompy.utils.commonnames import ENGINE_BOUNDARY_CONDITIONS
 from ceasiompy.utils.commonxpath import (
     ENGINE_BC,
     RANGE_XPATH,
+    ENGINE_DECK_XPATH,
     ENGINE_TYPE_XPATH,
+    ENGINE_NB_PROC_XPATH,
     SU2_AEROMAP_UID_XPATH,
     RANGE_CRUISE_ALT_XPATH,
     RANGE_CRUISE_MACH_XPATH,
@@ -90,21 +88,32 @@ def main(cpacs: CPACS, wkdir: Path) -> None:
         T_tot_out_array = []
         P_tot_out_array = []
 
+        engine_type = get_value_or_default(tixi, ENGINE_TYPE_XPATH, 0)
+        nb_proc = get_value_or_default(tixi, ENGINE_NB_PROC_XPATH, 1)
+        use_deck = bool_(get_value_or_default(tixi, ENGINE_DECK_XPATH, False))
+        create_branch(tixi, ENGINE_BC)
+
+        # Cases which have not been computed yet
+        case_dir_list = []
+        cases = []
         for case_nb, alt in enumerate(alt_list):
-            alt = alt_list[case_nb]
             MN = mach_list[case_nb]
             case_dir_name = f"Case{str(case_nb).zfill(2)}_alt{alt}_mach{round(MN, 2)}"
             case_dir_path = Path(wkdir, case_dir_name)
 
             if not case_dir_path.exists():
-                case_dir_path.mkdir()
+                case_dir_list.append(case_dir_path)
+                cases.append((alt, MN, Fn))
 
-                EngineBC = Path(case_dir_path, ENGINE_BOUNDARY_CONDITIONS)
+        # Interpolated from the engine deck or solved with an engine problem set up once
+        results = get_engine_outlet_conditions(engine_type, cases, nb_proc, use_deck)
 
-                f = open(EngineBC, "w")
+        for case_dir_path, case_results in zip(case_dir_list, results):
+            case_dir_path.mkdir()
 
-                engine_type = get_value_or_default(tixi, ENGINE_TYPE_XPATH, 0)
-                create_branch(tixi, ENGINE_BC)
+            EngineBC = Path(case_dir_path, ENGINE_BOUNDARY_CONDITIONS)
+
+            with open(EngineBC, "w") as f:
 
                 if engine_type == 0:
                     (
@@ -115,12 +124,12 @@ def main(cpacs: CPACS, wkdir: Path) -> None:
                         massflow_stat_out,
                         T_stat_out,
                         P_stat_out,
-                    ) = turbojet_analysis(alt, MN, Fn)
+                    ) = case_results
 
                     T_tot_out_array.append(T_tot_out)
                     P_tot_out_array.append(P_tot_out)
 
-                    f = write_turbojet_file(
+                    write_turbojet_file(
                         file=f,
                         T_tot_out=T_tot_out,
                         V_stat_out=V_stat_out,
@@ -146,12 +155,12 @@ def main(cpacs: CPACS, wkdir: Path) -> None:
                         P_tot_out_core,
                         massflow_stat_out_core,
                         T_stat_out_core,
-                    ) = turbofan_analysis(alt, MN, Fn)
+                    ) = case_results
 
                     T_tot_out_array.append(T_tot_out_core)
                     P_tot_out_array.append(P_tot_out_core)
 
-                    f = write_hbtf_file(
+                    write_hbtf_file(
                         file=f,
                         T_tot_out_byp=T_tot_out_byp,
                         V_stat_out_byp=V_stat_out_byp,
@@ -166,11 +175,12 @@ def main(cpacs: CPACS, wkdir: Path) -> None:
                         massflow_stat_out_core=massflow_stat_out_core,
                         T_stat_out_core=T_stat_out_core,
                     )
+
         add_float_vector(tixi, ENGINE_BC + "/temperatureOutlet", T_tot_out_array)
         add_float_vector(tixi, ENGINE_BC + "/pressureOutlet", P_tot_out_array)
 
     folder_name = "reports"
-    shutil.rmtree(folder_name)
+    shutil.rmtree(folder_name, ignore_errors=True)
 
 
 # =================================================================================================
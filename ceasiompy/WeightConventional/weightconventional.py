@@ -71,8 +71,7 @@ def main(cpacs: CPACS) -> None:
 
     # Aircraft geometry
     ag = geometry.AircraftGeometry()
-    ag.fuse_geom_eval(cpacs)
-    ag.wing_geom_eval(cpacs)
+    ag.geom_eval(cpacs)
     ag.produce_output_txt()
 
     inside_dim = InsideDimensions(ag)
@@ -17,11 +17,14 @@ This file will connect the wing/fuse/output modules.
 
 import math
 import numpy as np
+from functools import partial
 from pathlib import Path
 from ceasiompy.utils.WB.ConvGeometry.Fuselage.fusegeom import (
     fuselage_check_segment_connection,
     rel_dist,
 )
+from ceasiompy.utils.WB.fusesections import get_geometry_key, get_section_profile
+from ceasiompy.utils.WB.geometrycache import get_cached_geometry
 from ceasiompy.utils.ceasiompyutils import get_results_directory
 from ceasiompy.utils.commonxpath import FUSELAGES_XPATH, WINGS_XPATH
 
@@ -109,6 +112,20 @@ class AircraftGeometry:
         self.is_horiz = []  # (boolean_array) Define if a wing is horizontal [-]
         self.wing_area = 0  # (float) Wing area [m^2]
 
+    def geom_eval(self, cpacs):
+        """Get the full fuselage and wing geometry from a CPACS file, or from the snapshot
+        saved in the geometry cache by a previous module if the geometry has not changed."""
+
+        get_cached_geometry(
+            cpacs.tixi, "AircraftGeometry", {"ag": self}, partial(self.tigl_geom_eval, cpacs)
+        )
+
+    def tigl_geom_eval(self, cpacs):
+        """Evaluate the full fuselage and wing geometry with TiGL."""
+
+        self.fuse_geom_eval(cpacs)
+        self.wing_geom_eval(cpacs)
+
     def fuse_geom_eval(self, cpacs):
         """Get the full fuselage geometry from a CPACS file."""
 
@@ -117,6 +134,7 @@ class AircraftGeometry:
         # Opening tixi and tigl
         tixi = cpacs.tixi
         tigl = cpacs.tigl
+        geometry_key = get_geometry_key(tixi)
 
         #  Counting fuselage number ---------------------------------------------------
         fus_nb = tixi.getNamedChildrenCount(FUSELAGES_XPATH, "fuselage")
@@ -169,45 +187,19 @@ class AircraftGeometry:
         self.fuse_length.append(self.fuse_sec_rel_dist[-1, i - 1])
         for j in range(1, self.fuse_seg_nb[i - 1] + 1):
             k = int(self.fuse_seg_index[j][i - 1])
-            self.fuse_sec_circ[j][i - 1] = tigl.fuselageGetCircumference(i, k, 1.0)
-            (fpx, fpy, fpz) = tigl.fuselageGetPoint(i, k, 1.0, 0.0)
-            (fpx2, fpy2, fpz2) = tigl.fuselageGetPoint(i, k, 1.0, 0.5)
+            section = get_section_profile(tigl, geometry_key, i, k, 1.0)
+            self.fuse_sec_circ[j][i - 1] = section.get_circumference()
             self.fuse_seg_vol[j - 1][i - 1] = abs(tigl.fuselageGetSegmentVolume(i, k))
-            fuse_center_section_point[j][i - 1][0] = (fpx + fpx2) / 2
-            fuse_center_section_point[j][i - 1][1] = (fpy + fpy2) / 2
-            fuse_center_section_point[j][i - 1][2] = (fpz + fpz2) / 2
-            hw1 = 0
-            hw2 = 0
-            for zeta in np.arange(0.0, 1.0, 0.001):
-                (fpx, fpy, fpz) = tigl.fuselageGetPoint(i, k, 1.0, zeta)
-                if abs(fpz - fuse_center_section_point[j][i - 1][2]) < 0.01:
-                    if fpy > fuse_center_section_point[j][i - 1][1] and hw1 == 0:
-                        hw1 = abs(fpy - fuse_center_section_point[j][i - 1][1])
-                    elif fpy < fuse_center_section_point[j][i - 1][1] and hw2 == 0:
-                        hw2 = abs(fpy - fuse_center_section_point[j][i - 1][1])
-                        break
-            self.fuse_sec_width[j][i - 1] = hw1 + hw2
+            fuse_center_section_point[j][i - 1][:] = section.center
+            self.fuse_sec_width[j][i - 1] = section.width
             fslpx, _, _ = tigl.fuselageGetPoint(1, k, 0.0, 0.0)
             fslpx2, _, _ = tigl.fuselageGetPoint(1, k, 1.0, 0.0)
             self.fuse_seg_length[j - 1][i - 1] = abs(fslpx2 - fslpx)
         k = int(self.fuse_seg_index[1][i - 1])
-        self.fuse_sec_circ[0][i - 1] = tigl.fuselageGetCircumference(i, k, 0.0)
-        fpx, fpy, fpz = tigl.fuselageGetPoint(i, k, 0.0, 0.0)
-        fpx2, fpy2, fpz2 = tigl.fuselageGetPoint(i, k, 0.0, 0.5)
-        fuse_center_section_point[0][i - 1][0] = (fpx + fpx2) / 2
-        fuse_center_section_point[0][i - 1][1] = (fpy + fpy2) / 2
-        fuse_center_section_point[0][i - 1][2] = (fpz + fpz2) / 2
-        hw1 = 0
-        hw2 = 0
-        for zeta in np.arange(0.0, 1.0, 0.001):
-            (fpx, fpy, fpz) = tigl.fuselageGetPoint(i, k, 0.0, zeta)
-            if abs(fpz - fuse_center_section_point[0][i - 1][2]) < 0.01:
-                if fpy > fuse_center_section_point[0][i - 1][1] and hw1 == 0:
-                    hw1 = abs(fpy - fuse_center_section_point[0][i - 1][1])
-                elif fpy < fuse_center_section_point[0][i - 1][1] and hw2 == 0:
-                    hw2 = abs(fpy - fuse_center_section_point[0][i - 1][1])
-                    break
-        self.fuse_sec_width[0][i - 1] = hw1 + hw2
+        section = get_section_profile(tigl, geometry_key, i, k, 0.0)
+        self.fuse_sec_circ[0][i - 1] = section.get_circumference()
+        fuse_center_section_point[0][i - 1][:] = section.center
+        self.fuse_sec_width[0][i - 1] = section.width
         self.fuse_mean_width.append(np.mean(self.fuse_sec_width[:, i - 1]))
 
         #  Evaluating the point at the center of each segment, symmetry is considered
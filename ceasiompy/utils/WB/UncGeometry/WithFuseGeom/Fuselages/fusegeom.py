@@ -22,6 +22,7 @@ import numpy as np
 from cpacspy.cpacsfunctions import open_tigl, open_tixi
 
 from ceasiompy import log
+from ceasiompy.utils.WB.fusesections import get_geometry_key, get_section_profile
 
 # ==============================================================================
 #   FUNCTIONS
@@ -175,6 +176,7 @@ def fuse_geom_eval(fus_nb, h_min, fuse_thick, F_FUEL, afg, cpacs_in):
     # Opening tixi and tigl
     tixi = open_tixi(cpacs_in)
     tigl = open_tigl(tixi)
+    geometry_key = get_geometry_key(tixi)
 
     # INITIALIZATION 1 ----------------------------------------------------------
     afg.fus_nb = fus_nb
@@ -231,79 +233,27 @@ def fuse_geom_eval(fus_nb, h_min, fuse_thick, F_FUEL, afg, cpacs_in):
         afg.fuse_length.append(round(afg.fuse_sec_rel_dist[-1, i - 1], 3))
         for j in range(1, afg.fuse_seg_nb[i - 1] + 1):
             k = int(afg.fuse_seg_index[j][i - 1])
-            afg.fuse_sec_per[j][i - 1] = tigl.fuselageGetCircumference(i, k, 1.0)
-            (fpx, fpy, fpz) = tigl.fuselageGetPoint(i, k, 1.0, 0.0)
-            (fpx2, fpy2, fpz2) = tigl.fuselageGetPoint(i, k, 1.0, 0.5)
+            section = get_section_profile(tigl, geometry_key, i, k, 1.0)
+            afg.fuse_sec_per[j][i - 1] = section.get_circumference()
             afg.fuse_seg_vol[j - 1][i - 1] = tigl.fuselageGetSegmentVolume(i, k)
-            afg.fuse_center_section_point[j][i - 1][0] = (fpx + fpx2) / 2
-            afg.fuse_center_section_point[j][i - 1][1] = (fpy + fpy2) / 2
-            afg.fuse_center_section_point[j][i - 1][2] = (fpz + fpz2) / 2
-            hw1 = 0.0
-            hw2 = 0.0
-            for zeta in np.arange(0.0, 1.0, 0.001):
-                (fpx, fpy, fpz) = tigl.fuselageGetPoint(i, k, 1.0, zeta)
-                if abs(fpz - afg.fuse_center_section_point[j][i - 1][2]) < 0.01:
-                    if fpy > afg.fuse_center_section_point[j][i - 1][1] and hw1 == 0.0:
-                        hw1 = abs(fpy - afg.fuse_center_section_point[j][i - 1][1])
-                        x1[j, i - 1] = fpx
-                        y1[j, i - 1] = fpy
-                        z1[j, i - 1] = fpz
-                    elif fpy < afg.fuse_center_section_point[j][i - 1][1] and hw2 == 0.0:
-                        hw2 = abs(fpy - afg.fuse_center_section_point[j][i - 1][1])
-                        x2[j, i - 1] = fpx
-                        y2[j, i - 1] = fpy
-                        z2[j, i - 1] = fpz
-                        break
-            afg.fuse_sec_width[j][i - 1] = hw1 + hw2
-            hh1 = 0.0
-            hh2 = 0.0
-            for zeta in np.arange(0.0, 1.0, 0.001):
-                (fpx, fpy, fpz) = tigl.fuselageGetPoint(i, k, 1.0, zeta)
-                if abs(fpy - afg.fuse_center_section_point[j][i - 1][1]) < 0.01:
-                    if fpz > afg.fuse_center_section_point[j][i - 1][2] and hh1 == 0.0:
-                        hh1 = abs(fpz - afg.fuse_center_section_point[j][i - 1][2])
-                    elif fpz < afg.fuse_center_section_point[j][i - 1][2] and hh2 == 0.0:
-                        hh2 = abs(fpz - afg.fuse_center_section_point[j][i - 1][2])
-                        break
-            afg.fuse_sec_height[j][i - 1] = hh1 + hh2
+            afg.fuse_center_section_point[j][i - 1][:] = section.center
+            afg.fuse_sec_width[j][i - 1] = section.width
+            afg.fuse_sec_height[j][i - 1] = section.height
+            point1, point2 = section.get_width_points()
+            (x1[j, i - 1], y1[j, i - 1], z1[j, i - 1]) = point1
+            (x2[j, i - 1], y2[j, i - 1], z2[j, i - 1]) = point2
             fslpx = tigl.fuselageGetPoint(1, k, 0.0, 0.0)[0]
             fslpx2 = tigl.fuselageGetPoint(1, k, 1.0, 0.0)[0]
             afg.fuse_seg_length[j - 1][i - 1] = abs(fslpx2 - fslpx)
         k = int(afg.fuse_seg_index[1][i - 1])
-        afg.fuse_sec_per[0][i - 1] = tigl.fuselageGetCircumference(i, k, 0.0)
-        fpx, fpy, fpz = tigl.fuselageGetPoint(i, k, 0.0, 0.0)
-        fpx2, fpy2, fpz2 = tigl.fuselageGetPoint(i, k, 0.0, 0.5)
-        afg.fuse_center_section_point[0][i - 1][0] = (fpx + fpx2) / 2
-        afg.fuse_center_section_point[0][i - 1][1] = (fpy + fpy2) / 2
-        afg.fuse_center_section_point[0][i - 1][2] = (fpz + fpz2) / 2
-        hw1 = 0
-        hw2 = 0
-        for zeta in np.arange(0.0, 1.0, 0.001):
-            fpx, fpy, fpz = tigl.fuselageGetPoint(i, k, 0.0, zeta)
-            if abs(fpz - afg.fuse_center_section_point[0][i - 1][2]) < 0.01:
-                if fpy > afg.fuse_center_section_point[0][i - 1][1] and hw1 == 0:
-                    hw1 = abs(fpy - afg.fuse_center_section_point[0][i - 1][1])
-                    x1[0, i - 1] = fpx
-                    y1[0, i - 1] = fpy
-                    z1[0, i - 1] = fpz
-                elif fpy < afg.fuse_center_section_point[0][i - 1][1] and hw2 == 0:
-                    hw2 = abs(fpy - afg.fuse_center_section_point[0][i - 1][1])
-                    x2[0, i - 1] = fpx
-                    y2[0, i - 1] = fpy
-                    z2[0, i - 1] = fpz
-                    break
-        afg.fuse_sec_width[0][i - 1] = hw1 + hw2
-        hh1 = 0.0
-        hh2 = 0.0
-        for zeta in np.arange(0.0, 1.0, 0.001):
-            fpx, fpy, fpz = tigl.fuselageGetPoint(i, k, 1.0, zeta)
-            if abs(fpy - afg.fuse_center_section_point[0][i - 1][1]) < 0.01:
-                if fpz > afg.fuse_center_section_point[0][i - 1][2] and hh1 == 0.0:
-                    hh1 = abs(fpz - afg.fuse_center_section_point[0][i - 1][2])
-                elif fpz < afg.fuse_center_section_point[0][i - 1][2] and hh2 == 0.0:
-                    hh2 = abs(fpz - afg.fuse_center_section_point[0][i - 1][2])
-                    break
-        afg.fuse_sec_height[0][i - 1] = hh1 + hh2
+        section = get_section_profile(tigl, geometry_key, i, k, 0.0)
+        afg.fuse_sec_per[0][i - 1] = section.get_circumference()
+        afg.fuse_center_section_point[0][i - 1][:] = section.center
+        afg.fuse_sec_width[0][i - 1] = section.width
+        afg.fuse_sec_height[0][i - 1] = section.height
+        point1, point2 = section.get_width_points()
+        (x1[0, i - 1], y1[0, i - 1], z1[0, i - 1]) = point1
+        (x2[0, i - 1], y2[0, i - 1], z2[0, i - 1]) = point2
         afg.fuse_mean_width.append(round(np.mean(afg.fuse_sec_width[:, i - 1]), 3))
 
     # Evaluating the point at the center of each segment.
@@ -17,6 +17,9 @@ geometry analysis for unconventional aircraft.
 #   IMPORTS
 # =============================================================================
 
+from functools import partial
+from types import SimpleNamespace
+
 # Classes
 from ceasiompy.utils.InputClasses.Unconventional.aircraftgeometryclass import AircraftWingGeometry
 from ceasiompy.utils.InputClasses.Unconventional.aircraftgeometryclass import AircraftFuseGeometry
@@ -33,6 +36,8 @@ from .Output.outputgeom import produce_geom_output_txt
 
 from cpacspy.cpacsfunctions import open_tixi
 
+from ceasiompy.utils.WB.geometrycache import get_cached_geometry
+
 from ceasiompy import log
 
 
@@ -92,12 +97,27 @@ def no_fuse_geom_analysis(cpacs_in, FLOOR_NB, wing_nb, h_min, FUEL_ON_CABIN, NAM
 
     """
     awg = AircraftWingGeometry()
-    awg = geom_eval(wing_nb, awg, cpacs_in)
-    (awg, wing_nodes) = wing_check_thickness(
-        h_min, awg, cpacs_in, TP, FUEL_ON_CABIN)
+    nodes = SimpleNamespace(wing_nodes=None)
+
+    get_cached_geometry(
+        open_tixi(cpacs_in),
+        "NoFuseGeometry",
+        {"awg": awg, "nodes": nodes},
+        partial(no_fuse_geom_eval, awg, nodes, cpacs_in, wing_nb, h_min, FUEL_ON_CABIN, TP),
+        params=(wing_nb, h_min, FUEL_ON_CABIN, TP),
+    )
     produce_wing_output_txt(awg, NAME)
 
-    return (awg, wing_nodes)
+    return (awg, nodes.wing_nodes)
+
+
+def no_fuse_geom_eval(awg, nodes, cpacs_in, wing_nb, h_min, FUEL_ON_CABIN, TP):
+    """The function evaluates with TiGL the geometry of an aircraft without fuselage,
+    see 'no_fuse_geom_analysis'. The wing nodes are stored in 'nodes.wing_nodes'.
+    """
+
+    geom_eval(wing_nb, awg, cpacs_in)
+    (_, nodes.wing_nodes) = wing_check_thickness(h_min, awg, cpacs_in, TP, FUEL_ON_CABIN)
 
 
 def with_fuse_geom_analysis(cpacs_in, fus_nb, wing_nb, h_min, adui, TP, F_FUEL, NAME):
@@ -124,13 +144,27 @@ def with_fuse_geom_analysis(cpacs_in, fus_nb, wing_nb, h_min, adui, TP, F_FUEL,
     awg = AircraftWingGeometry()
     afg = AircraftFuseGeometry(fus_nb)
 
-    awg = wing_geom_eval(wing_nb, TP, awg, cpacs_in)
-    afg = fuse_geom_eval(fus_nb, h_min, adui.VRT_THICK, F_FUEL, afg, cpacs_in)
+    get_cached_geometry(
+        open_tixi(cpacs_in),
+        "WithFuseGeometry",
+        {"afg": afg, "awg": awg},
+        partial(with_fuse_geom_eval, afg, awg, cpacs_in, fus_nb, wing_nb, h_min, adui, TP, F_FUEL),
+        params=(fus_nb, wing_nb, h_min, adui.VRT_THICK, TP, F_FUEL),
+    )
     produce_geom_output_txt(afg, awg, NAME)
 
     return (afg, awg)
 
 
+def with_fuse_geom_eval(afg, awg, cpacs_in, fus_nb, wing_nb, h_min, adui, TP, F_FUEL):
+    """The function evaluates with TiGL the geometry of an aircraft with fuselage,
+    see 'with_fuse_geom_analysis'.
+    """
+
+    wing_geom_eval(wing_nb, TP, awg, cpacs_in)
+    fuse_geom_eval(fus_nb, h_min, adui.VRT_THICK, F_FUEL, afg, cpacs_in)
+
+
 # =============================================================================
 #    MAIN
 # =============================================================================
@@ -0,0 +1,273 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Sampling of the fuselage section profiles with TiGL.
+
+The width (height) of a section is measured between the first points of its profile which
+are within SECTION_TOL of the horizontal (vertical) plane through the section center, the
+profile being evaluated every ZETA_FINE_STEP. The profile is first evaluated on a coarse
+zeta grid, the fine points are only evaluated around the coarse intervals where the profile
+crosses the plane. Sampled profiles are cached by geometry key, fuselage, segment and eta,
+so that the modules run in the same process do not evaluate them again.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import hashlib
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Optional,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.commonxpath import FUSELAGES_XPATH
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Step of the zeta coordinate used to find the width and height of a section
+ZETA_FINE_STEP = 0.001
+ZETA_FINE_NB = 1000
+
+# Number of fine steps in a coarse step
+ZETA_COARSE_RATIO = 20
+
+# Maximum distance between a profile point and the plane through the section center [m]
+SECTION_TOL = 0.01
+
+# CPACS branches which define the fuselage sections
+FUSELAGE_GEOMETRY_XPATHS = [FUSELAGES_XPATH, "/cpacs/vehicles/profiles/fuselageProfiles"]
+
+# Y and Z axis of the profile points
+Y_AXIS = 1
+Z_AXIS = 2
+
+# Sampled section profiles, keyed by (geometry key, fuselage index, segment index, eta)
+SECTION_PROFILES: Dict[Tuple, "SectionProfile"] = {}
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class SectionProfile:
+    """
+    Profile of a fuselage section, defined by its segment index and eta (0.0 for the start
+    section of the segment, 1.0 for its end section).
+
+    Attributes:
+        center (np.ndarray): Middle of the points at zeta = 0.0 and zeta = 0.5 (x,y,z) [m].
+        points (Dict[int, np.ndarray]): Evaluated profile points, keyed by fine zeta index.
+
+    """
+
+    def __init__(self, tigl, fus_idx: int, seg_idx: int, eta: float) -> None:
+
+        self.tigl = tigl
+        self.fus_idx = fus_idx
+        self.seg_idx = seg_idx
+        self.eta = eta
+
+        self.points = {}
+        self.extents = {}
+        self.circumference = None
+
+        start, middle = self.get_points([0, ZETA_FINE_NB // 2])
+        self.center = (start + middle) / 2
+
+    def get_points(self, indexes: List[int]) -> np.ndarray:
+        """
+        Returns the profile points at the fine zeta indexes, evaluating the missing ones.
+        """
+
+        for idx in indexes:
+            if idx not in self.points:
+                self.points[idx] = np.array(
+                    self.tigl.fuselageGetPoint(
+                        self.fus_idx, self.seg_idx, self.eta, idx * ZETA_FINE_STEP
+                    )
+                )
+
+        return np.array([self.points[idx] for idx in indexes]).reshape(-1, 3)
+
+    def get_crossing_indexes(self, cut_axis: int) -> List[int]:
+        """
+        Returns the fine zeta indexes around the coarse intervals where the profile crosses
+        or gets close to the plane through the section center normal to 'cut_axis'.
+        """
+
+        coarse_idx = list(range(0, ZETA_FINE_NB, ZETA_COARSE_RATIO))
+        dist = self.get_points(coarse_idx)[:, cut_axis] - self.center[cut_axis]
+
+        near = np.abs(dist) < SECTION_TOL
+        crossing = np.zeros(len(coarse_idx), dtype=bool)
+        crossing[:-1] = (np.sign(dist[:-1]) != np.sign(dist[1:])) | near[:-1] | near[1:]
+
+        indexes = set()
+        for k in np.flatnonzero(crossing):
+            start = max(0, (k - 1) * ZETA_COARSE_RATIO)
+            stop = min(ZETA_FINE_NB, (k + 2) * ZETA_COARSE_RATIO + 1)
+            indexes.update(range(start, stop))
+
+        return sorted(indexes)
+
+    def get_extent(self, cut_axis: int, measure_axis: int) -> Tuple:
+        """
+        Returns the distances along 'measure_axis' between the section center and the first
+        profile points on each side which are in the plane normal to 'cut_axis', and the fine
+        zeta indexes of these points (see 'find_first_points').
+        """
+
+        key = (cut_axis, measure_axis)
+        if key in self.extents:
+            return self.extents[key]
+
+        extent = find_first_points(
+            self.get_crossing_indexes(cut_axis), self, cut_axis, measure_axis
+        )
+
+        if None in extent[2:]:
+            # Point not found around the crossings, the complete profile is evaluated
+            extent = find_first_points(
+                list(range(ZETA_FINE_NB)), self, cut_axis, measure_axis
+            )
+
+        self.extents[key] = extent
+
+        return extent
+
+    def get_width_points(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the points which define the width of the section (zeros if not found).
+        """
+
+        points = []
+        idx_pos, idx_neg = self.get_extent(Z_AXIS, Y_AXIS)[2:]
+        for idx in (idx_pos, idx_neg):
+            points.append(np.zeros(3) if idx is None else self.points[idx])
+
+        return points[0], points[1]
+
+    @property
+    def width(self) -> float:
+        dist_pos, dist_neg = self.get_extent(Z_AXIS, Y_AXIS)[:2]
+        return dist_pos + dist_neg
+
+    @property
+    def height(self) -> float:
+        dist_pos, dist_neg = self.get_extent(Y_AXIS, Z_AXIS)[:2]
+        return dist_pos + dist_neg
+
+    def get_circumference(self) -> float:
+        if self.circumference is None:
+            self.circumference = self.tigl.fuselageGetCircumference(
+                self.fus_idx, self.seg_idx, self.eta
+            )
+        return self.circumference
+
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def find_first_points(
+    indexes: List[int], profile: SectionProfile, cut_axis: int, measure_axis: int
+) -> Tuple[float, float, Optional[int], Optional[int]]:
+    """
+    Find the first profile points on each side of the section center which are in the plane
+    normal to 'cut_axis', among the points at the fine zeta indexes (sorted). As the profile
+    is followed from zeta = 0.0, the search stops at the first point on the negative side, a
+    point on the positive side found after it is not considered.
+
+    Returns:
+        dist_pos (float): Distance to the point on the positive side, 0.0 if not found [m].
+        dist_neg (float): Distance to the point on the negative side, 0.0 if not found [m].
+        idx_pos (int): Fine zeta index of the point on the positive side, None if not found.
+        idx_neg (int): Fine zeta index of the point on the negative side, None if not found.
+
+    """
+
+    if not indexes:
+        return 0.0, 0.0, None, None
+
+    points = profile.get_points(indexes)
+    center = profile.center
+
+    in_plane = np.abs(points[:, cut_axis] - center[cut_axis]) < SECTION_TOL
+    dist = points[:, measure_axis] - center[measure_axis]
+
+    neg = np.flatnonzero(in_plane & (dist < 0))
+    last = neg[0] if len(neg) else len(indexes)
+    pos = np.flatnonzero(in_plane[:last] & (dist[:last] > 0))
+
+    dist_pos, idx_pos = (abs(dist[pos[0]]), indexes[pos[0]]) if len(pos) else (0.0, None)
+    dist_neg, idx_neg = (abs(dist[neg[0]]), indexes[neg[0]]) if len(neg) else (0.0, None)
+
+    return float(dist_pos), float(dist_neg), idx_pos, idx_neg
+
+
+def get_geometry_key(tixi) -> str:
+    """
+    Returns a hash of the CPACS branches which define the fuselage sections.
+    """
+
+    root = ET.fromstring(tixi.exportDocumentAsString())
+
+    sha = hashlib.sha256()
+    for xpath in FUSELAGE_GEOMETRY_XPATHS:
+        for element in root.findall("." + xpath[len("/cpacs"):]):
+            sha.update(ET.tostring(element))
+
+    return sha.hexdigest()
+
+
+def get_section_profile(
+    tigl, geometry_key: str, fus_idx: int, seg_idx: int, eta: float
+) -> SectionProfile:
+    """
+    Returns the profile of a fuselage section from the cache, creates it if needed.
+
+    Args:
+        tigl (Tigl3 class): TiGL handle of the CPACS.
+        geometry_key (str): Key of the geometry, see 'get_geometry_key'.
+        fus_idx (int): Index of the fuselage.
+        seg_idx (int): Index of the segment.
+        eta (float): 0.0 for the start section of the segment, 1.0 for its end section.
+
+    Returns:
+        (SectionProfile): Profile of the section.
+
+    """
+
+    key = (geometry_key, fus_idx, seg_idx, float(eta))
+    if key not in SECTION_PROFILES:
+        SECTION_PROFILES[key] = SectionProfile(tigl, fus_idx, seg_idx, eta)
+    else:
+        # The TiGL handle of a closed CPACS cannot be used anymore
+        SECTION_PROFILES[key].tigl = tigl
+
+    return SECTION_PROFILES[key]
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
@@ -0,0 +1,285 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Snapshots of the aircraft geometry classes evaluated with TiGL in 'utils/WB'.
+
+The attributes of the geometry classes are saved in a .npz file of the CEASIOMpy
+geometry cache directory, named after a hash of the geometry branches of the CPACS and of
+the analysis parameters. Weight and Balance modules load the snapshot instead of evaluating
+the geometry again, whatever the current directory. Any modification of the geometry gives
+a new hash. The least recently used snapshots are removed when the size of the cache
+exceeds GEOMETRY_CACHE_MAX_SIZE.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import os
+import json
+import hashlib
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Tuple,
+    Optional,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.commonpaths import GEOMETRY_CACHE_PATH
+from ceasiompy.utils.commonxpath import (
+    REF_XPATH,
+    WINGS_XPATH,
+    PYLONS_XPATH,
+    ENGINES_XPATH,
+    FUSELAGES_XPATH,
+)
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# CPACS branches which define the aircraft geometry
+GEOMETRY_XPATHS = [
+    REF_XPATH,
+    WINGS_XPATH,
+    PYLONS_XPATH,
+    ENGINES_XPATH,
+    FUSELAGES_XPATH,
+    "/cpacs/vehicles/profiles",
+]
+
+# Name of the entry which contains the attributes which are not arrays
+ATTRS_KEY = "__attrs__"
+
+# Maximum size of the snapshots in the cache directory [bytes]
+GEOMETRY_CACHE_MAX_SIZE = 200 * 1024**2
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_geometry_hash(tixi) -> str:
+    """
+    Returns a hash of the CPACS branches which define the aircraft geometry.
+    """
+
+    root = ET.fromstring(tixi.exportDocumentAsString())
+
+    sha = hashlib.sha256()
+    for xpath in GEOMETRY_XPATHS:
+        sha.update(xpath.encode())
+        for element in root.findall("." + xpath[len("/cpacs"):]):
+            sha.update(ET.tostring(element))
+
+    return sha.hexdigest()
+
+
+def get_snapshot_path(tixi, name: str, params: Tuple = ()) -> Path:
+    """
+    Returns the path of the snapshot of a geometry analysis.
+
+    Args:
+        tixi (Tixi3 class): Tixi handle of the CPACS.
+        name (str): Name of the geometry analysis.
+        params (Tuple): Parameters of the analysis other than the CPACS geometry.
+
+    Returns:
+        (Path): Path of the .npz file, in the geometry cache directory.
+
+    """
+
+    sha = hashlib.sha256(get_geometry_hash(tixi).encode())
+    sha.update(repr(to_json(list(params))).encode())
+
+    return Path(GEOMETRY_CACHE_PATH, f"{name}_{sha.hexdigest()[:16]}.npz")
+
+
+def to_json(value: Any) -> Any:
+    """
+    Convert the NumPy scalars and arrays of a value to types which can be written in JSON.
+    """
+
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist(), "dtype": str(value.dtype)}
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    raise TypeError(f"Value of type {type(value)} cannot be saved in a geometry snapshot.")
+
+
+def from_json(value: Any) -> Any:
+    """
+    Inverse of 'to_json', tuples are returned as lists.
+    """
+
+    if isinstance(value, dict):
+        return np.array(value["__ndarray__"], dtype=value["dtype"])
+
+    if isinstance(value, list):
+        return [from_json(item) for item in value]
+
+    return value
+
+
+def save_geometry_snapshot(snapshot_path: Path, objects: Dict[str, Any]) -> bool:
+    """
+    Save the attributes of geometry classes in a snapshot.
+
+    Args:
+        snapshot_path (Path): Path of the .npz file.
+        objects (Dict[str, Any]): Geometry classes, by name.
+
+    Returns:
+        (bool): False if an attribute cannot be saved.
+
+    """
+
+    arrays = {}
+    attrs = {}
+
+    try:
+        for obj_name, obj in objects.items():
+            attrs[obj_name] = {}
+            for attr_name, value in vars(obj).items():
+                if isinstance(value, np.ndarray) and value.dtype != object:
+                    arrays[f"{obj_name}.{attr_name}"] = value
+                else:
+                    attrs[obj_name][attr_name] = to_json(value)
+        arrays[ATTRS_KEY] = np.array(json.dumps(attrs))
+    except TypeError as err:
+        log.warning(f"Geometry snapshot not saved: {err}")
+        return False
+
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = snapshot_path.with_suffix(".tmp.npz")
+    np.savez_compressed(tmp_path, **arrays)
+    tmp_path.replace(snapshot_path)
+
+    prune_geometry_cache(snapshot_path.parent)
+
+    return True
+
+
+def load_geometry_snapshot(snapshot_path: Path, objects: Dict[str, Any]) -> bool:
+    """
+    Set the attributes of geometry classes from a snapshot.
+
+    Args:
+        snapshot_path (Path): Path of the .npz file.
+        objects (Dict[str, Any]): Geometry classes to update, by name.
+
+    Returns:
+        (bool): True if the snapshot exists and contains all the classes.
+
+    """
+
+    if not snapshot_path.exists():
+        return False
+
+    with np.load(snapshot_path) as data:
+        attrs = json.loads(str(data[ATTRS_KEY]))
+        if not set(objects).issubset(attrs):
+            return False
+
+        for obj_name, obj in objects.items():
+            for attr_name, value in attrs[obj_name].items():
+                setattr(obj, attr_name, from_json(value))
+
+        for key in data.files:
+            if key != ATTRS_KEY:
+                obj_name, attr_name = key.split(".", 1)
+                if obj_name in objects:
+                    setattr(objects[obj_name], attr_name, data[key])
+
+    # Most recently used snapshot, removed last from the cache
+    os.utime(snapshot_path)
+
+    log.info(f"Aircraft geometry loaded from {snapshot_path.name} (cache).")
+
+    return True
+
+
+def prune_geometry_cache(cache_dir: Path, max_size: int = GEOMETRY_CACHE_MAX_SIZE) -> None:
+    """
+    Remove the least recently used snapshots of a cache directory until their total size
+    is below max_size. Use max_size=0 to clear the cache.
+    """
+
+    snapshots = []
+    for path in Path(cache_dir).glob("*.npz"):
+        # Snapshot being written
+        if path.name.endswith(".tmp.npz"):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snapshots.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in snapshots)
+
+    for _, size, path in sorted(snapshots, key=lambda snapshot: snapshot[0]):
+        if total_size <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total_size -= size
+
+
+def get_cached_geometry(
+    tixi, name: str, objects: Dict[str, Any], eval_func, params: Tuple = ()
+) -> Optional[Path]:
+    """
+    Load geometry classes from their snapshot, or evaluate them and save the snapshot.
+
+    Args:
+        tixi (Tixi3 class): Tixi handle of the CPACS.
+        name (str): Name of the geometry analysis.
+        objects (Dict[str, Any]): Geometry classes, by name.
+        eval_func (callable): Function without arguments which evaluates the geometry
+            classes (e.g. a functools.partial).
+        params (Tuple): Parameters of the analysis other than the CPACS geometry.
+
+    Returns:
+        snapshot_path (Path): Path of the snapshot, None if it could not be saved.
+
+    """
+
+    snapshot_path = get_snapshot_path(tixi, name, params)
+
+    if load_geometry_snapshot(snapshot_path, objects):
+        return snapshot_path
+
+    eval_func()
+
+    if save_geometry_snapshot(snapshot_path, objects):
+        return snapshot_path
+
+    return None
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
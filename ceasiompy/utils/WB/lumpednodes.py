@@ -0,0 +1,198 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Nodes of the lumped masses method used to evaluate the moments of inertia of the fuselages
+and wings in the Balance modules.
+
+The nodes of each segment are stored in (N, 3) arrays. As they only depend on the geometry
+and on the discretisation, they are cached by geometry hash and evaluated once for all the
+mass configurations of a Balance analysis.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import numpy as np
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from ceasiompy import log
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Nodes of the segments of the fuselages or wings, by (geometry hash, module, part,
+# discretisation)
+LUMPED_NODES: Dict[Tuple, List[np.ndarray]] = {}
+
+# Angle between two successive inner nodes of a fuselage section (golden angle) [rad]
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+# Sign of the x, y and z coordinates of the symmetric nodes, by CPACS symmetry
+# (1: x-y plane, 2: x-z plane, 3: y-z plane)
+SYMMETRY_FACTORS = {
+    1: np.array([1.0, 1.0, -1.0]),
+    2: np.array([1.0, -1.0, 1.0]),
+    3: np.array([-1.0, 1.0, 1.0]),
+}
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_fuselage_segment_nodes(
+    tigl, fus_idx: int, seg_idx: int, subd_l: int, subd_c: int, subd_r: int, center
+) -> np.ndarray:
+    """
+    Returns the nodes of a fuselage segment: for each of the subd_l + 1 sections, subd_c + 1
+    points of the section profile followed by inner points on a sunflower spiral around the
+    section center, with a radius taken from the last profile point.
+
+    Args:
+        tigl (Tigl3 class): TiGL handle of the CPACS.
+        fus_idx (int): Index of the fuselage.
+        seg_idx (int): Index of the segment.
+        subd_l (int): Number of subdivisions along the longitudinal axis.
+        subd_c (int): Number of subdivisions along the perimeter.
+        subd_r (int): Number of subdivisions along the radial axis.
+        center (np.ndarray): Center of the start section of the segment (x,y,z) [m].
+
+    Returns:
+        nodes (np.ndarray): (N, 3) coordinates of the nodes [m].
+
+    """
+
+    etas = np.arange(int(subd_l) + 1) * (1.0 / subd_l)
+    zetas = np.arange(int(subd_c) + 1) * (1.0 / subd_c)
+
+    profile = np.empty((len(etas), len(zetas), 3))
+    for j, eta in enumerate(etas):
+        for k, zeta in enumerate(zetas):
+            profile[j, k] = tigl.fuselageGetPoint(fus_idx, seg_idx, eta, zeta)
+
+    D0 = np.sqrt(np.arange(subd_r * subd_c) / float(subd_r * subd_c))
+    D = D0 - (D0[-1] - 0.98)
+    D = D[D >= 0]
+
+    (_, yc, zc) = center
+    last = profile[:, -1]
+    deltar = np.sqrt((last[:, 1] - yc) ** 2 + (last[:, 2] - zc) ** 2)[:, None] * D
+    theta = GOLDEN_ANGLE * np.arange(len(D))
+
+    inner = np.empty((len(etas), len(D), 3))
+    inner[:, :, 0] = last[:, 0][:, None]
+    inner[:, :, 1] = yc + deltar * np.cos(theta)
+    inner[:, :, 2] = zc + deltar * np.sin(theta)
+
+    return np.concatenate((profile, inner), axis=1).reshape(-1, 3)
+
+
+def get_wing_segment_nodes(
+    tigl, wing_idx: int, seg_idx: int, etas: np.ndarray, k_list: List[int], zeta: float
+) -> np.ndarray:
+    """
+    Returns the nodes of a wing segment: for each spanwise station, the leading and trailing
+    edge points, then the lower and upper points at the chordwise positions obtained by
+    adding k * zeta for each k of 'k_list', starting from the leading edge.
+
+    Args:
+        tigl (Tigl3 class): TiGL handle of the CPACS.
+        wing_idx (int): Index of the wing.
+        seg_idx (int): Index of the segment.
+        etas (np.ndarray): Spanwise positions of the stations.
+        k_list (List[int]): Chordwise subdivisions.
+        zeta (float): Chordwise step.
+
+    Returns:
+        nodes (np.ndarray): (N, 3) coordinates of the nodes [m].
+
+    """
+
+    nodes = np.empty((len(etas), 2 + 2 * len(k_list), 3))
+
+    for j, eta in enumerate(etas):
+        nodes[j, 0] = tigl.wingGetLowerPoint(wing_idx, seg_idx, eta, 0.0)
+        nodes[j, 1] = tigl.wingGetLowerPoint(wing_idx, seg_idx, eta, 1.0)
+
+        # Chordwise positions from the leading edge
+        if nodes[j, 0, 0] < nodes[j, 1, 0]:
+            ze, sign = 0.0, 1.0
+        else:
+            ze, sign = 1.0, -1.0
+
+        for n, k in enumerate(k_list):
+            ze += sign * float(k) * zeta
+            nodes[j, 2 + 2 * n] = tigl.wingGetLowerPoint(wing_idx, seg_idx, eta, ze)
+            nodes[j, 3 + 2 * n] = tigl.wingGetUpperPoint(wing_idx, seg_idx, eta, ze)
+
+    return nodes.reshape(-1, 3)
+
+
+def get_lumped_inertia(nodes: np.ndarray, mass: float, center_of_gravity) -> np.ndarray:
+    """
+    Returns the moments of inertia of a mass equally distributed on nodes.
+
+    Args:
+        nodes (np.ndarray): (N, 3) coordinates of the nodes [m].
+        mass (float): Total mass of the nodes [kg].
+        center_of_gravity (np.ndarray): Coordinates of the center of gravity (x,y,z) [m].
+
+    Returns:
+        (np.ndarray): Ixx, Iyy, Izz, Ixy, Iyz, Ixz [kgm^2].
+
+    """
+
+    if not len(nodes):
+        return np.zeros(6)
+
+    M = mass / len(nodes)
+    cx, cy, cz = (nodes - np.asarray(center_of_gravity, dtype=float)).T
+
+    return np.array(
+        [
+            np.sum(M * (cy**2 + cz**2)),
+            np.sum(M * (cx**2 + cz**2)),
+            np.sum(M * (cx**2 + cy**2)),
+            np.sum(M * cx * cy),
+            np.sum(M * cy * cz),
+            np.sum(M * cx * cz),
+        ]
+    )
+
+
+def get_cached_nodes(key: Tuple, eval_func) -> List[np.ndarray]:
+    """
+    Returns the nodes of the segments of a part from the cache, evaluates them if needed.
+
+    Args:
+        key (Tuple): Geometry hash, module, part name and discretisation.
+        eval_func (callable): Function without arguments which returns the nodes.
+
+    """
+
+    if key not in LUMPED_NODES:
+        LUMPED_NODES[key] = eval_func()
+        log.info(f"{sum(len(nodes) for nodes in LUMPED_NODES[key])} lumped masses nodes.")
+
+    return LUMPED_NODES[key]
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
@@ -284,12 +284,15 @@ def initialize_cpacs(module_name: str) -> Tuple[CPACS, Path]:
     return cpacs, cpacs_out
 
 
-def run_module(module, wkdir=Path.cwd(), iteration=0, test=False):
+def run_module(module, wkdir=Path.cwd(), iteration=0, test=False, cpacs=None, save=True):
     """Run a 'ModuleToRun' object in a specific wkdir.
 
     Args:
         module (ModuleToRun): 'ModuleToRun' object (define in workflowclasses.py)
         wkdir (Path, optional): Path of the working directory. Defaults to Path.cwd().
+        cpacs (CPACS, optional): CPACS kept in memory from the previous module, it is
+            modified in place. Defaults to None, the CPACS is read from 'cpacs_in'.
+        save (bool, optional): Write the CPACS in 'cpacs_out'. Defaults to True.
     """
 
     module_name = module.name
@@ -318,7 +321,8 @@ def run_module(module, wkdir=Path.cwd(), iteration=0, test=False):
 
         # Run the module
         with change_working_dir(wkdir):
-            cpacs = CPACS(cpacs_in)
+            if cpacs is None:
+                cpacs = CPACS(cpacs_in)
             if test:
                 log.info("Updating CPACS from __specs__")
                 update_cpacs_from_specs(cpacs, module_name)
@@ -326,7 +330,8 @@ def run_module(module, wkdir=Path.cwd(), iteration=0, test=False):
                 my_module.main(cpacs)
             else:
                 my_module.main(cpacs, module.results_dir)
-            cpacs.save_cpacs(cpacs_out, overwrite=True)
+            if save:
+                cpacs.save_cpacs(cpacs_out, overwrite=True)
 
             log.info("---------- End of " + module_name + " ---------- \n")
 
@@ -399,10 +404,10 @@ def run_software(
     nb_cpu: int = 1,
     stdin: Optional[TextIO] = None,
     log_bool: bool = True,
-) -> None:
+) -> int:
     """Run a software with the given arguments in a specific wkdir. If the software is compatible
     with MPI, 'with_mpi' can be set to True and the number of processors can be specified. A
-    logfile will be created in the wkdir.
+    logfile will be created in the wkdir. Returns the return code of the software.
 
     Args:
         software_name (str): Name of the software to run.
@@ -447,22 +452,25 @@ def run_software(
     log.info("Command line that will be run is:")
     log.info(" ".join(map(str, command_line)))
 
-    with change_working_dir(wkdir):
-        if log_bool:
-            logfile = Path(wkdir, f"logfile_{software_name}.log")
-            with open(logfile, "w") as logfile:
-                if stdin is None:
-                    subprocess.run(command_line, stdout=logfile, cwd=wkdir)
-                else:
-                    subprocess.run(command_line, stdin=stdin, stdout=logfile, cwd=wkdir)
-        else:
+    # The process is started with 'cwd=wkdir' rather than changing the working directory of
+    # the Python process, so that several softwares can be run concurrently from threads.
+    if log_bool:
+        logfile = Path(wkdir, f"logfile_{software_name}.log")
+        with open(logfile, "w") as logfile:
             if stdin is None:
-                subprocess.run(command_line, cwd=wkdir)
+                process = subprocess.run(command_line, stdout=logfile, cwd=wkdir)
             else:
-                subprocess.run(command_line, stdin=stdin, cwd=wkdir)
+                process = subprocess.run(command_line, stdin=stdin, stdout=logfile, cwd=wkdir)
+    else:
+        if stdin is None:
+            process = subprocess.run(command_line, cwd=wkdir)
+        else:
+            process = subprocess.run(command_line, stdin=stdin, cwd=wkdir)
 
     log.info(f">>> {software_name} End")
 
+    return process.returncode
+
 
 def get_reasonable_nb_cpu() -> int:
     """
@@ -54,6 +54,18 @@ LOGFILE = Path(CEASIOMPY_PATH, "ceasiompy.log")
 # /CEASIOMpy/.ceasiompy/.runworkflow_history
 RUNWORKFLOW_HISTORY_PATH = Path(CEASIOMPY_PATH, ".ceasiompy", ".runworkflow_history")
 
+# /CEASIOMpy/.ceasiompy/engine_decks
+ENGINE_DECKS_PATH = Path(CEASIOMPY_PATH, ".ceasiompy", "engine_decks")
+
+# /CEASIOMpy/.ceasiompy/aic_matrices
+AIC_MATRICES_PATH = Path(CEASIOMPY_PATH, ".ceasiompy", "aic_matrices")
+
+# /CEASIOMpy/.ceasiompy/brep_files
+BREP_CACHE_PATH = Path(CEASIOMPY_PATH, ".ceasiompy", "brep_files")
+
+# /CEASIOMpy/.ceasiompy/geometry_snapshots
+GEOMETRY_CACHE_PATH = Path(CEASIOMPY_PATH, ".ceasiompy", "geometry_snapshots")
+
 # /CEASIOMpy/src/streamlit
 STREAMLIT_PATH = Path(CEASIOMPY_PATH, "src", "streamlit")
 
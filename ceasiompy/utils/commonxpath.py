@@ -136,6 +136,7 @@ GMSH_MESH_SIZE_PROPELLERS_XPATH = GMSH_XPATH + "/mesh_size/propellers"
 GMSH_REFINE_FACTOR_XPATH = GMSH_XPATH + "/refine_factor"
 GMSH_REFINE_TRUNCATED_XPATH = GMSH_XPATH + "/refine_truncated"
 GMSH_AUTO_REFINE_XPATH = GMSH_XPATH + "/auto_refine"
+GMSH_INCREMENTAL_REFINE_XPATH = GMSH_XPATH + "/incremental_refine"
 GMSH_INTAKE_PERCENT_XPATH = GMSH_XPATH + "/intake_percent"
 GMSH_EXHAUST_PERCENT_XPATH = GMSH_XPATH + "/exhaust_percent"
 GMSH_MESH_FORMAT_XPATH = GMSH_XPATH + "/type_output_penta"
@@ -147,6 +148,9 @@ GMSH_GROWTH_RATIO_XPATH = GMSH_XPATH + "/growth_ratio"
 GMSH_SURFACE_MESH_SIZE_XPATH = GMSH_XPATH + "min_max_mesh_factor"
 GMSH_FEATURE_ANGLE_XPATH = GMSH_XPATH + "/feature_angle"
 GMSH_CTRLSURF_ANGLE_XPATH = GMSH_XPATH + "/DeflectionAngle"
+GMSH_NB_WORKERS_XPATH = GMSH_XPATH + "/performance/nbWorkers"
+GMSH_NB_THREADS_XPATH = GMSH_XPATH + "/performance/nbThreads"
+GMSH_PERFORMANCE_PROFILE_XPATH = GMSH_XPATH + "/performance/profile"
 
 # SU2
 SU2_XPATH = CEASIOMPY_XPATH + "/aerodynamics/su2"
@@ -240,6 +244,8 @@ CHECK_STABILITY_XPATH = STABILITY_XPATH + "/stabilityToCheck"
 
 # PYCYCLE
 ENGINE_TYPE_XPATH = CEASIOMPY_XPATH + "/ThermoData"
+ENGINE_NB_PROC_XPATH = CEASIOMPY_XPATH + "/ThermoDataNbProc"
+ENGINE_DECK_XPATH = CEASIOMPY_XPATH + "/ThermoDataEngineDeck"
 ENGINE_BC = CEASIOMPY_XPATH + "/BC"
 ENGINE_BC_TEMPERATUREOUTLET_XPATH = ENGINE_BC + "/TemperatureOutlet"
 ENGINE_BC_PRESSUREOUTLET_XPATH = ENGINE_BC + "/PressureOutlet"
@@ -40,7 +40,7 @@ from ceasiompy.utils.generalclasses import (
 )
 
 from ceasiompy import log
-from ceasiompy.Database.func import ALLOWED_TABLES
+from ceasiompy.Database.func import ALLOWED_TABLES, FILE_CHUNKS_TABLE
 from ceasiompy.utils.commonpaths import CEASIOMPY_DB_PATH
 from ceasiompy.utils.commonxpath import WINGS_XPATH
 
@@ -74,7 +74,7 @@ def get_aircrafts_list() -> List:
                 table_name = table[0]
 
                 # Validate table name
-                if table_name not in ALLOWED_TABLES + ["sqlite_sequence"]:
+                if table_name not in ALLOWED_TABLES + [FILE_CHUNKS_TABLE, "sqlite_sequence"]:
                     raise ValueError(f"Invalid table name: {table_name}")
 
                 # Check if the table has an "aircraft" column
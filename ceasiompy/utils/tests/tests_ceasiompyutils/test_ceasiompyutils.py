@@ -117,7 +117,7 @@ def test_get_install_path():
 def test_run_software():
     """Test the function 'run_software'."""
 
-    run_software("python", ["-c", "print('Hello World!')"], TMP_DIR)
+    assert run_software("python", ["-c", "print('Hello World!')"], TMP_DIR) == 0
 
     assert LOGFILE.exists()
 
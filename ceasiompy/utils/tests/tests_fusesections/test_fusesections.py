@@ -0,0 +1,89 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'utils/WB/fusesections.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import math
+
+import numpy as np
+
+from ceasiompy.utils.WB.fusesections import get_section_profile
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class EllipseTigl:
+    """Elliptic fuselage sections, zeta = 0.0 on the top of the section"""
+
+    def __init__(self):
+        self.nb_calls = 0
+
+    def fuselageGetPoint(self, fus_idx, seg_idx, eta, zeta):
+        self.nb_calls += 1
+        angle = 2 * math.pi * zeta
+        return (10.0 * eta, 2.0 * math.sin(angle), 0.5 + 1.5 * math.cos(angle))
+
+    def fuselageGetCircumference(self, fus_idx, seg_idx, eta):
+        return 11.0
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_section_profile():
+    """Test function 'get_section_profile' against the complete profile sampling"""
+
+    tigl = EllipseTigl()
+    section = get_section_profile(tigl, "test_section_profile", 1, 1, 1.0)
+
+    np.testing.assert_almost_equal(section.center, [10.0, 0.0, 0.5])
+
+    # Width and height found by evaluating every point of the profile
+    hw1 = hw2 = hh1 = hh2 = 0.0
+    for zeta in np.arange(0.0, 1.0, 0.001):
+        x, y, z = EllipseTigl().fuselageGetPoint(1, 1, 1.0, zeta)
+        if abs(z - 0.5) < 0.01:
+            if y > 0.0 and hw1 == 0.0:
+                hw1 = y
+            elif y < 0.0 and hw2 == 0.0:
+                hw2 = -y
+        if abs(y) < 0.01:
+            if z > 0.5 and hh1 == 0.0:
+                hh1 = z - 0.5
+            elif z < 0.5 and hh2 == 0.0:
+                hh2 = 0.5 - z
+
+    assert section.width == hw1 + hw2
+    assert section.height == hh1 + hh2
+    assert section.get_circumference() == 11.0
+    assert tigl.nb_calls < 500
+
+    # Profile taken from the cache
+    nb_calls = tigl.nb_calls
+    assert get_section_profile(tigl, "test_section_profile", 1, 1, 1.0).width == hw1 + hw2
+    assert tigl.nb_calls == nb_calls
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test fusesections.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -0,0 +1,126 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'utils/WB/geometrycache.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import os
+import numpy as np
+
+from types import SimpleNamespace
+
+import ceasiompy.utils.WB.geometrycache as geometrycache
+
+from ceasiompy.utils.WB.geometrycache import (
+    get_snapshot_path,
+    get_cached_geometry,
+    prune_geometry_cache,
+)
+
+CPACS_TEXT = """<?xml version="1.0" encoding="UTF-8"?>
+<cpacs>
+    <vehicles><aircraft><model uID="Test">
+        <fuselages><fuselage uID="Fuse"><name>{fuse_name}</name></fuselage></fuselages>
+        <analyses><massBreakdown>{mass}</massBreakdown></analyses>
+    </model></aircraft></vehicles>
+</cpacs>
+"""
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class TextTixi:
+    def __init__(self, fuse_name="Fuse", mass=1.0):
+        self.text = CPACS_TEXT.format(fuse_name=fuse_name, mass=mass)
+
+    def exportDocumentAsString(self):
+        return self.text
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_get_snapshot_path(tmp_path, monkeypatch):
+    """Test that only the geometry and the parameters change the snapshot path"""
+
+    monkeypatch.setattr(geometrycache, "GEOMETRY_CACHE_PATH", tmp_path)
+
+    path = get_snapshot_path(TextTixi(), "Test")
+    assert path.parent == tmp_path
+    assert get_snapshot_path(TextTixi(mass=2.0), "Test") == path
+    assert get_snapshot_path(TextTixi(fuse_name="Fuse2"), "Test") != path
+    assert get_snapshot_path(TextTixi(), "Test", params=(1.5,)) != path
+
+
+def test_get_cached_geometry(tmp_path, monkeypatch):
+    """Test function 'get_cached_geometry'"""
+
+    monkeypatch.setattr(geometrycache, "GEOMETRY_CACHE_PATH", tmp_path)
+
+    def eval_geometry(geom):
+        geom.nb_calls += 1
+        geom.fuse_nb = np.int64(2)
+        geom.fuse_length = [np.float64(30.5), 12.0]
+        geom.fuse_sec_width = np.arange(6.0).reshape(3, 2)
+        geom.wing_mac = [np.zeros(2)]
+        geom.is_horiz = [True, False]
+
+    geom = SimpleNamespace(nb_calls=0)
+    path = get_cached_geometry(TextTixi(), "Test", {"geom": geom}, lambda: eval_geometry(geom))
+    assert path.exists()
+    assert geom.nb_calls == 1
+
+    loaded = SimpleNamespace()
+    get_cached_geometry(TextTixi(), "Test", {"geom": loaded}, lambda: eval_geometry(loaded))
+    # Loaded from the snapshot, the geometry is not evaluated again
+    assert loaded.nb_calls == 1
+    assert loaded.fuse_nb == 2
+    assert loaded.fuse_length == [30.5, 12.0]
+    assert loaded.is_horiz == [True, False]
+    np.testing.assert_array_equal(loaded.fuse_sec_width, geom.fuse_sec_width)
+    np.testing.assert_array_equal(loaded.wing_mac[0], np.zeros(2))
+
+
+def test_prune_geometry_cache(tmp_path):
+    """Test function 'prune_geometry_cache'"""
+
+    for i, name in enumerate(["old", "used", "new"]):
+        path = tmp_path / f"{name}.npz"
+        path.write_bytes(b"0" * 100)
+        os.utime(path, (i, i))
+
+    # Loading a snapshot makes it the most recently used
+    os.utime(tmp_path / "used.npz", (10, 10))
+    (tmp_path / "writing.tmp.npz").write_bytes(b"0" * 100)
+
+    prune_geometry_cache(tmp_path, max_size=250)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "new.npz", "used.npz", "writing.tmp.npz"
+    ]
+
+    prune_geometry_cache(tmp_path, max_size=0)
+    assert [path.name for path in tmp_path.iterdir()] == ["writing.tmp.npz"]
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test geometrycache.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -0,0 +1,90 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'utils/WB/lumpednodes.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import math
+
+import numpy as np
+
+from ceasiompy.utils.WB.lumpednodes import (
+    get_cached_nodes,
+    get_lumped_inertia,
+    get_wing_segment_nodes,
+    get_fuselage_segment_nodes,
+)
+
+# =================================================================================================
+#   CLASSES
+# =================================================================================================
+
+
+class AnalyticTigl:
+    """Circular fuselage of radius 1 m and flat wing of chord 2 m"""
+
+    def fuselageGetPoint(self, fus_idx, seg_idx, eta, zeta):
+        angle = 2 * math.pi * zeta
+        return (10.0 * eta, math.sin(angle), math.cos(angle))
+
+    def wingGetLowerPoint(self, wing_idx, seg_idx, eta, zeta):
+        return (2.0 * zeta, 5.0 * eta, 0.0)
+
+    def wingGetUpperPoint(self, wing_idx, seg_idx, eta, zeta):
+        return (2.0 * zeta, 5.0 * eta, 0.1)
+
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_get_lumped_inertia():
+    """Test function 'get_lumped_inertia'"""
+
+    nodes = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, -2.0, 0.0]])
+    inertia = get_lumped_inertia(nodes, 4.0, [0.0, 0.0, 0.0])
+    np.testing.assert_almost_equal(inertia, [8.0, 2.0, 10.0, 0.0, 0.0, 0.0])
+
+    np.testing.assert_almost_equal(get_lumped_inertia(np.empty((0, 3)), 4.0, [0, 0, 0]), 0.0)
+
+
+def test_segment_nodes():
+    """Test functions 'get_fuselage_segment_nodes' and 'get_wing_segment_nodes'"""
+
+    tigl = AnalyticTigl()
+
+    nodes = get_fuselage_segment_nodes(tigl, 1, 1, 4, 8, 2, [0.0, 0.0, 0.0])
+    assert nodes.shape[1] == 3
+    profile = [tigl.fuselageGetPoint(1, 1, 0.0, k / 8) for k in range(9)]
+    np.testing.assert_almost_equal(nodes[:9], profile)
+    assert np.all(np.hypot(nodes[:, 1], nodes[:, 2]) <= 1.0 + 1e-9)
+    assert set(np.round(nodes[:, 0], 9)) == {0.0, 2.5, 5.0, 7.5, 10.0}
+
+    nodes = get_wing_segment_nodes(tigl, 1, 1, np.array([0.0, 0.5]), [1, 2], 1.0 / 6)
+    assert nodes.shape == (12, 3)
+    np.testing.assert_almost_equal(nodes[2:6, 0], [1.0 / 3, 1.0 / 3, 1.0, 1.0])
+
+    # Nodes taken from the cache
+    key = ("test_segment_nodes", 0.1)
+    assert get_cached_nodes(key, lambda: [nodes]) is get_cached_nodes(key, lambda: [])
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test lumpednodes.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -0,0 +1,161 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'utils/workflowcache.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from ceasiompy.utils.workflowcache import (
+    get_cpacs_inputs_text,
+    get_module_cache_key,
+    get_module_source_hash,
+    is_module_cacheable,
+    load_module_from_cache,
+    store_module_in_cache,
+)
+
+CPACS_IN = """<?xml version="1.0" encoding="UTF-8"?>
+<cpacs>
+    <vehicles><aircraft><model uID="Test"><name>Test</name></model></aircraft></vehicles>
+    <toolspecific><CEASIOMpy>
+        <mesh>{wkflow_dir}/Results/CPACS2GMSH/mesh.su2</mesh>
+        <other>{other}</other>
+    </CEASIOMpy></toolspecific>
+</cpacs>
+"""
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_is_module_cacheable():
+
+    assert is_module_cacheable("SkinFriction")
+    assert not is_module_cacheable("Database")
+
+
+def test_get_module_source_hash(tmp_path):
+
+    Path(tmp_path, "module.py").write_text("a = 1\n")
+    hash_1 = get_module_source_hash(tmp_path)
+
+    Path(tmp_path, "module.py").write_text("a = 2\n")
+    assert get_module_source_hash(tmp_path) != hash_1
+
+
+def test_get_cpacs_inputs_text(tmp_path):
+
+    xpaths = ["/cpacs/vehicles", "/cpacs/toolspecific/CEASIOMpy/mesh"]
+
+    wkflow_1 = Path(tmp_path, "Workflow_001")
+    cpacs_1 = Path(tmp_path, "cpacs_1.xml")
+    cpacs_1.write_text(CPACS_IN.format(wkflow_dir=wkflow_1, other=1))
+
+    wkflow_2 = Path(tmp_path, "Workflow_002")
+    cpacs_2 = Path(tmp_path, "cpacs_2.xml")
+    cpacs_2.write_text(CPACS_IN.format(wkflow_dir=wkflow_2, other=2))
+
+    text_1 = get_cpacs_inputs_text(cpacs_1, xpaths, wkflow_1)
+
+    # Only the given xpaths are used, independently of the workflow directory
+    assert text_1 == get_cpacs_inputs_text(cpacs_2, xpaths, wkflow_2)
+    assert "<other>" not in text_1
+
+    # Complete CPACS
+    assert get_cpacs_inputs_text(cpacs_1, None, wkflow_1) != get_cpacs_inputs_text(
+        cpacs_2, None, wkflow_2
+    )
+
+    # Content of the files given in the CPACS
+    mesh_path = Path(wkflow_1, "Results", "CPACS2GMSH", "mesh.su2")
+    mesh_path.parent.mkdir(parents=True)
+    mesh_path.write_text("NDIME= 3")
+    text_mesh = get_cpacs_inputs_text(cpacs_1, xpaths, wkflow_1)
+    assert text_mesh != text_1
+
+    mesh_path.write_text("NDIME= 2")
+    assert get_cpacs_inputs_text(cpacs_1, xpaths, wkflow_1) != text_mesh
+
+
+def test_get_module_cache_key(tmp_path):
+
+    def get_module(other: int) -> SimpleNamespace:
+        wkflow_dir = Path(tmp_path, f"Workflow_00{other}")
+        cpacs_in = Path(tmp_path, f"cpacs_{other}.xml")
+        cpacs_in.write_text(CPACS_IN.format(wkflow_dir=wkflow_dir, other=other))
+        return SimpleNamespace(
+            name="Test", module_dir=tmp_path, cpacs_in=cpacs_in, wkflow_dir=wkflow_dir
+        )
+
+    Path(tmp_path, "module.py").write_text("a = 1\n")
+    key_1 = get_module_cache_key(get_module(1))
+
+    # Module without __specs__, the complete CPACS is used
+    assert key_1 == get_module_cache_key(get_module(1))
+    assert key_1 != get_module_cache_key(get_module(2))
+
+    Path(tmp_path, "module.py").write_text("a = 2\n")
+    assert key_1 != get_module_cache_key(get_module(1))
+
+
+def test_store_and_load_module_from_cache(tmp_path):
+
+    def get_module(wkflow_dir: Path, other: int) -> SimpleNamespace:
+        results_dir = Path(wkflow_dir, "Results", "Test")
+        results_dir.mkdir(parents=True)
+        cpacs_in = Path(wkflow_dir, "ToolInput.xml")
+        cpacs_in.write_text(CPACS_IN.format(wkflow_dir=wkflow_dir, other=other))
+        return SimpleNamespace(
+            name="Test",
+            wkflow_dir=wkflow_dir,
+            cpacs_in=cpacs_in,
+            cpacs_out=Path(wkflow_dir, "ToolOutput.xml"),
+            results_dir=results_dir,
+        )
+
+    module_1 = get_module(Path(tmp_path, "Workflow_001"), 1)
+    module_1.cpacs_out.write_text(
+        CPACS_IN.format(wkflow_dir=module_1.wkflow_dir, other=1).replace(
+            "</CEASIOMpy>", "<result>10</result></CEASIOMpy>"
+        )
+    )
+    Path(module_1.results_dir, "result.txt").write_text("result")
+
+    # Value of another module modified since the cached module was run
+    module_2 = get_module(Path(tmp_path, "Workflow_002"), 2)
+
+    assert not load_module_from_cache(module_2, "key", tmp_path)
+
+    store_module_in_cache(module_1, "key", tmp_path)
+    assert load_module_from_cache(module_2, "key", tmp_path)
+
+    assert Path(module_2.results_dir, "result.txt").read_text() == "result"
+
+    cpacs_out_text = module_2.cpacs_out.read_text()
+    assert str(module_2.wkflow_dir) in cpacs_out_text
+    assert str(module_1.wkflow_dir) not in cpacs_out_text
+    assert "<result>10</result>" in cpacs_out_text
+    assert "<other>2</other>" in cpacs_out_text
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test workflowcache.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -18,6 +18,10 @@ Test functions for 'utils/workflowclasses.py'
 import pytest
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
+
+import ceasiompy.utils.workflowclasses as workflowclasses
+
 from ceasiompy.utils.workflowclasses import ModuleToRun, OptimSubWorkflow, Workflow
 from ceasiompy.utils.ceasiompyutils import run_module
 
@@ -135,6 +139,10 @@ class TestWorkflow:
         assert self.workflow.module_optim == self.MODULE_OPTIM
         assert self.workflow.optim_method == "Optimisation"
 
+        # Default values of the options missing in the config file
+        assert not self.workflow.in_memory
+        assert self.workflow.checkpoint_every == 0
+
     def test_write_config_file(self):
         pass
 
@@ -186,6 +194,40 @@ class TestWorkflow:
         )
 
 
+def test_run_stage_undeclared_outputs(tmp_path, monkeypatch):
+
+    workflow = Workflow()
+    workflow.current_wkflow_dir = tmp_path
+    cpacs_in = Path(tmp_path, "ToolInput.xml")
+
+    modules = [
+        SimpleNamespace(name=name, cpacs_in=None, cpacs_out=Path(tmp_path, f"{name}.xml"))
+        for name in ["PyAVL", "SkinFriction", "SaveAeroCoefficients"]
+    ]
+
+    runs = []
+
+    def run_stage_modules(stage_modules, use_cache, test=False):
+        runs.append([(module.name, module.cpacs_in) for module in stage_modules])
+
+    monkeypatch.setattr(workflow, "run_stage_modules", run_stage_modules)
+    monkeypatch.setattr(
+        workflowclasses,
+        "get_undeclared_xpaths",
+        lambda name, *args: ["/cpacs/toolspecific"] if name == "SkinFriction" else [],
+    )
+
+    cpacs_out = workflow.run_stage(modules, cpacs_in, 1, use_cache=False)
+
+    # The output of the first module is kept, the next ones are run again one after the other
+    assert runs == [
+        [(module.name, cpacs_in) for module in modules],
+        [("SkinFriction", modules[0].cpacs_out)],
+        [("SaveAeroCoefficients", modules[1].cpacs_out)],
+    ]
+    assert cpacs_out == modules[2].cpacs_out
+
+
 # =================================================================================================
 #    MAIN
 # =================================================================================================
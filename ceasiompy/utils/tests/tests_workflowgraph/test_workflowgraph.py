@@ -0,0 +1,203 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Test functions for 'utils/workflowgraph.py'
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import xml.etree.ElementTree as ET
+
+import ceasiompy.utils.workflowgraph as workflowgraph
+
+from ceasiompy.utils.workflowgraph import (
+    get_stages,
+    is_xpath_in,
+    xpaths_overlap,
+    get_module_xpaths,
+    merge_cpacs_outputs,
+    get_modified_xpaths,
+    get_undeclared_xpaths,
+)
+from ceasiompy.utils.commonxpath import AEROPERFORMANCE_XPATH
+
+CPACS_IN = """<?xml version="1.0" encoding="UTF-8"?>
+<cpacs>
+    <vehicles><aircraft><model uID="Test"><name>Test</name></model></aircraft></vehicles>
+    <toolspecific><CEASIOMpy>
+        <a>1</a>
+        <b>2</b>
+        <c>3</c>
+    </CEASIOMpy></toolspecific>
+</cpacs>
+"""
+
+# =================================================================================================
+#   TESTS
+# =================================================================================================
+
+
+def test_xpaths_overlap():
+
+    assert xpaths_overlap(["/cpacs/toolspecific/CEASIOMpy"], ["/cpacs/toolspecific/CEASIOMpy/a"])
+    assert xpaths_overlap(["/cpacs/vehicles/aircraft/model[1]/name"], ["/cpacs/vehicles"])
+    assert not xpaths_overlap(["/cpacs/toolspecific/CEASIOMpy/a"], ["/cpacs/toolspecific/b"])
+    assert not xpaths_overlap(["/cpacs/a/b"], ["/cpacs/a/bb"])
+    assert xpaths_overlap(None, [])
+
+
+def test_get_module_xpaths():
+
+    # Modules with side effects outside of the CPACS run alone
+    assert get_module_xpaths("Database") == (None, None)
+
+    # Aeromaps written by SkinFriction
+    _, outputs = get_module_xpaths("SkinFriction")
+    assert AEROPERFORMANCE_XPATH + "/aeroMap" in outputs
+
+
+def test_is_xpath_in():
+
+    assert is_xpath_in("/cpacs/toolspecific[1]/CEASIOMpy[1]/a[1]", ["/cpacs/toolspecific"])
+    assert not is_xpath_in("/cpacs/toolspecific", ["/cpacs/toolspecific/CEASIOMpy"])
+    assert not is_xpath_in("/cpacs/a/bb", ["/cpacs/a/b"])
+
+
+def test_get_modified_xpaths():
+
+    base = ET.fromstring(CPACS_IN)
+    output = ET.fromstring(
+        CPACS_IN.replace("<a>1</a>", "<a>10</a>")
+        .replace("<b>2</b>", "<e><f>5</f></e>")
+        .replace("<c>3</c>", "<c>3</c><d>4</d>")
+    )
+
+    assert get_modified_xpaths(base, output) == [
+        ("/cpacs/toolspecific[1]/CEASIOMpy[1]/a[1]", False),
+        ("/cpacs/toolspecific[1]/CEASIOMpy[1]/e[1]/f[1]", True),
+        ("/cpacs/toolspecific[1]/CEASIOMpy[1]/d[1]", True),
+        ("/cpacs/toolspecific[1]/CEASIOMpy[1]/b[1]", False),
+    ]
+    assert get_modified_xpaths(base, base) == []
+
+
+def test_get_undeclared_xpaths(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(
+        workflowgraph,
+        "get_specs_xpaths",
+        lambda _: (["/cpacs/toolspecific/CEASIOMpy/d"], ["/cpacs/toolspecific/CEASIOMpy/a"]),
+    )
+
+    cpacs_in = tmp_path / "in.xml"
+    cpacs_in.write_text(CPACS_IN)
+
+    # Declared output and default value of an input
+    cpacs_out = tmp_path / "out.xml"
+    cpacs_out.write_text(CPACS_IN.replace("<a>1</a>", "<a>10</a><d>4</d>"))
+    assert get_undeclared_xpaths("Test", cpacs_in, cpacs_out) == []
+
+    cpacs_out.write_text(CPACS_IN.replace("<b>2</b>", "<b>20</b>"))
+    assert get_undeclared_xpaths("Test", cpacs_in, cpacs_out) == [
+        "/cpacs/toolspecific[1]/CEASIOMpy[1]/b[1]"
+    ]
+
+    # Modules without declared outputs are considered as writing everything
+    monkeypatch.setattr(workflowgraph, "get_specs_xpaths", lambda _: (None, None))
+    assert get_undeclared_xpaths("Test", cpacs_in, cpacs_out) == []
+
+
+def test_get_stages():
+
+    modules_xpaths = [
+        (["/cpacs/in"], ["/cpacs/a"]),
+        (["/cpacs/in"], ["/cpacs/b"]),
+        (["/cpacs/a"], ["/cpacs/c"]),
+        (["/cpacs/in"], ["/cpacs/d"]),
+        (None, None),
+        (["/cpacs/in"], ["/cpacs/e"]),
+    ]
+
+    assert get_stages(modules_xpaths) == [[0, 1, 3], [2], [4], [5]]
+    assert get_stages([]) == []
+
+    # Two modules writing the same xpath keep their order
+    assert get_stages([([], ["/cpacs/a"]), ([], ["/cpacs/a"])]) == [[0], [1]]
+
+    # A module writing an xpath read by a previous module must run after it
+    assert get_stages([(["/cpacs/a"], ["/cpacs/b"]), ([], ["/cpacs/a"])]) == [[0], [1]]
+
+
+def test_merge_cpacs_outputs(tmp_path):
+
+    cpacs_in = tmp_path / "in.xml"
+    cpacs_in.write_text(CPACS_IN)
+
+    cpacs_out_1 = tmp_path / "out_1.xml"
+    cpacs_out_1.write_text(CPACS_IN.replace("<a>1</a>", "<a>10</a>").replace("<c>3</c>", ""))
+
+    cpacs_out_2 = tmp_path / "out_2.xml"
+    cpacs_out_2.write_text(CPACS_IN.replace("<b>2</b>", "<b>20</b><d>4</d>"))
+
+    merged_path = tmp_path / "merged.xml"
+    merge_cpacs_outputs(cpacs_in, [cpacs_out_1, cpacs_out_2], merged_path)
+
+    ceasiompy = ET.parse(merged_path).getroot().find("./toolspecific/CEASIOMpy")
+    assert ceasiompy.find("a").text == "10"
+    assert ceasiompy.find("b").text == "20"
+    assert ceasiompy.find("c") is None
+    assert ceasiompy.find("d").text == "4"
+    assert ET.parse(merged_path).getroot().find("./vehicles/aircraft/model/name").text == "Test"
+
+
+def test_merge_cpacs_outputs_conflicts(tmp_path, monkeypatch):
+
+    conflicts = []
+    monkeypatch.setattr(workflowgraph, "log_conflict", conflicts.append)
+
+    cpacs_in = tmp_path / "in.xml"
+    cpacs_in.write_text(CPACS_IN)
+
+    cpacs_out_1 = tmp_path / "out_1.xml"
+    cpacs_out_1.write_text(
+        CPACS_IN.replace("<a>1</a>", "<a>10</a>").replace("<c>3</c>", "<d>4</d>")
+    )
+
+    cpacs_out_2 = tmp_path / "out_2.xml"
+    cpacs_out_2.write_text(
+        CPACS_IN.replace("<a>1</a>", "<a>20</a>").replace("<c>3</c>", "<d>5</d>")
+    )
+
+    # Same modifications in two outputs
+    merged_path = tmp_path / "merged.xml"
+    merge_cpacs_outputs(cpacs_in, [cpacs_out_1, cpacs_out_1], merged_path)
+    assert conflicts == []
+
+    # The last modification is kept
+    merge_cpacs_outputs(cpacs_in, [cpacs_out_1, cpacs_out_2], merged_path)
+    assert conflicts == [
+        "/cpacs/toolspecific[1]/CEASIOMpy[1]/a[1]",
+        "/cpacs/toolspecific[1]/CEASIOMpy[1]/d[1]",
+    ]
+
+    ceasiompy = ET.parse(merged_path).getroot().find("./toolspecific/CEASIOMpy")
+    assert ceasiompy.find("a").text == "20"
+    assert ceasiompy.find("d").text == "5"
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    print("Test workflowgraph.py")
+    print("To run test use the following command:")
+    print(">> pytest -v")
@@ -0,0 +1,288 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed for CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Cache of module results shared between the workflows of a working directory.
+
+A module is identified by a key which is the hash of:
+    * the source files of the module,
+    * the part of its input CPACS it reads (the xpaths of the inputs defined in its
+      __specs__, the /cpacs/vehicles branch, from which the geometry is read, and the files
+      written by the previous modules, e.g. meshes, with the content of these files).
+
+The key does not depend on the previous modules of the workflow, a change of the settings of
+another module does not invalidate the results of the following modules.
+
+When the same key is found in the cache, the results directory from the workflow where the
+module was run is copied and the modifications made by the module in its CPACS are applied
+to the current input CPACS, the values written by the other modules are kept.
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import json
+import shutil
+import hashlib
+import xml.etree.ElementTree as ET
+
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.commonxpath import CEASIOMPY_XPATH
+from ceasiompy.utils.moduleinterfaces import get_specs_for_module
+from ceasiompy.utils.workflowgraph import SIDE_EFFECTS_MODULES, merge_element, parse_cpacs
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# Name of the cache directory, in the working directory of the workflows
+CACHE_DIR_NAME = ".workflow_cache"
+
+# Placeholder of the workflow directory in cached files and hashed CPACS data
+WKFLOW_DIR_TAG = "{WKFLOW_DIR}"
+
+# CPACS branches always read by modules (geometry and files written by previous modules)
+CACHE_COMMON_XPATHS = ["/cpacs/vehicles", CEASIOMPY_XPATH + "/filesPath"]
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def is_module_cacheable(module_name: str) -> bool:
+    """
+    Check if the results of a module can be reused from the cache.
+    """
+    return module_name not in SIDE_EFFECTS_MODULES
+
+
+def get_module_source_hash(module_dir: Path) -> str:
+    """
+    Returns a hash of all the python files of a module, used as the version of the module.
+    """
+
+    sha = hashlib.sha256()
+
+    for py_file in sorted(module_dir.rglob("*.py")):
+        if "tests" in py_file.relative_to(module_dir).parts:
+            continue
+        sha.update(str(py_file.relative_to(module_dir)).encode())
+        sha.update(py_file.read_bytes())
+
+    return sha.hexdigest()
+
+
+def get_module_input_xpaths(module_name: str) -> Optional[List[str]]:
+    """
+    Returns the xpaths read by a module: the inputs of its __specs__ and the common xpaths.
+    Returns None if the __specs__ of the module cannot be loaded.
+    """
+
+    try:
+        specs = get_specs_for_module(module_name)
+    except AttributeError:
+        # Some __specs__ depend on the GUI session state
+        specs = None
+
+    if specs is None:
+        return None
+
+    xpaths = list(CACHE_COMMON_XPATHS)
+    for entry in specs.cpacs_inout.inputs:
+        if entry.xpath:
+            # 'DynamicChoice' inputs store their choice at xpath + "type"
+            xpaths += [entry.xpath, entry.xpath + "type"]
+
+    return xpaths
+
+
+def get_linked_files_text(element: ET.Element) -> List[str]:
+    """
+    Returns the hash of the files (e.g. meshes) whose paths are given in the text of an
+    element or of its children, several paths can be separated by ';'.
+    """
+
+    text_list = []
+
+    for child in element.iter():
+        if not isinstance(child.tag, str) or not child.text:
+            continue
+        for path_str in child.text.strip().split(";"):
+            path = Path(path_str.strip())
+            if path.is_absolute() and path.is_file():
+                sha = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        sha.update(block)
+                text_list.append(sha.hexdigest())
+
+    return text_list
+
+
+def get_cpacs_inputs_text(
+    cpacs_path: Path,
+    xpaths: Optional[List[str]],
+    wkflow_dir: Path,
+) -> str:
+    """
+    Returns the serialized CPACS elements found at the given xpaths (the complete CPACS if
+    xpaths is None) and the hash of the files they refer to. Paths to the workflow directory
+    are replaced by a placeholder so that the same inputs in two different workflows give
+    the same text.
+    """
+
+    tree = ET.parse(cpacs_path)
+    root = tree.getroot()
+
+    if xpaths is None:
+        xpaths = ["/cpacs"]
+
+    text_list = []
+    for xpath in xpaths:
+        elements = None
+        relative_xpath = "." + xpath[len("/cpacs"):] if xpath.startswith("/cpacs") else None
+
+        if relative_xpath is not None:
+            try:
+                elements = root.findall(relative_xpath.rstrip("/"))
+            except SyntaxError:
+                elements = None
+
+        # Xpath not supported by ElementTree, the whole CPACS is used
+        if elements is None:
+            log.warning(f"Cannot evaluate xpath {xpath}, the complete CPACS is hashed.")
+            text_list = [ET.tostring(root, encoding="unicode")] + get_linked_files_text(root)
+            break
+
+        text_list.append(xpath)
+        for element in elements:
+            text_list.append(ET.tostring(element, encoding="unicode"))
+            text_list += get_linked_files_text(element)
+
+    return "\n".join(text_list).replace(str(wkflow_dir), WKFLOW_DIR_TAG)
+
+
+def get_module_cache_key(module) -> str:
+    """
+    Returns the cache key of a 'ModuleToRun' object.
+
+    Args:
+        module (ModuleToRun): Module to run (define in workflowclasses.py).
+
+    """
+
+    sha = hashlib.sha256()
+    sha.update(module.name.encode())
+    sha.update(get_module_source_hash(module.module_dir).encode())
+
+    inputs_text = get_cpacs_inputs_text(
+        module.cpacs_in, get_module_input_xpaths(module.name), module.wkflow_dir
+    )
+    sha.update(inputs_text.encode())
+
+    return sha.hexdigest()
+
+
+def get_cache_entry_path(working_dir: Path, module_name: str, key: str) -> Path:
+    return Path(working_dir, CACHE_DIR_NAME, f"{module_name}_{key}.json")
+
+
+def store_module_in_cache(module, key: str, working_dir: Path) -> None:
+    """
+    Save in the cache where the input and output CPACS and the results of a module are stored.
+    """
+
+    entry_path = get_cache_entry_path(working_dir, module.name, key)
+    entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+    entry = {
+        "module": module.name,
+        "wkflow_dir": str(module.wkflow_dir),
+        "cpacs_in": str(module.cpacs_in),
+        "cpacs_out": str(module.cpacs_out),
+        "results_dir": None if module.results_dir is None else str(module.results_dir),
+    }
+
+    with open(entry_path, "w") as f:
+        json.dump(entry, f, indent=4)
+
+
+def load_module_from_cache(module, key: str, working_dir: Path) -> bool:
+    """
+    Copy the results of a module from the cache if they exist and apply the modifications
+    made by the cached module in its CPACS to the current input CPACS of the module.
+
+    Args:
+        module (ModuleToRun): Module to run (define in workflowclasses.py).
+        key (str): Cache key of the module.
+        working_dir (Path): Working directory of the workflows.
+
+    Returns:
+        (bool): True if the results have been found in the cache.
+
+    """
+
+    entry_path = get_cache_entry_path(working_dir, module.name, key)
+    if not entry_path.exists():
+        return False
+
+    with open(entry_path, "r") as f:
+        entry = json.load(f)
+
+    cached_wkflow_dir = Path(entry["wkflow_dir"])
+    cached_cpacs_in = Path(entry["cpacs_in"])
+    cached_cpacs_out = Path(entry["cpacs_out"])
+    cached_results_dir: Optional[Path] = (
+        None if entry["results_dir"] is None else Path(entry["results_dir"])
+    )
+
+    if not cached_cpacs_in.exists() or not cached_cpacs_out.exists() or (
+        cached_results_dir is not None and not cached_results_dir.exists()
+    ):
+        log.warning(f"Cached results of {module.name} in {cached_wkflow_dir} do not exist.")
+        entry_path.unlink()
+        return False
+
+    if cached_results_dir is not None and module.results_dir is not None:
+        shutil.copytree(cached_results_dir, module.results_dir, dirs_exist_ok=True)
+
+    # Paths in the CPACS must point to the results of the current workflow
+    cached_in, cached_out = (
+        ET.fromstring(
+            cpacs.read_text(encoding="utf-8")
+            .replace(str(cached_wkflow_dir), str(module.wkflow_dir))
+            .encode("utf-8"),
+            parser=ET.XMLParser(target=ET.TreeBuilder(insert_comments=True)),
+        )
+        for cpacs in (cached_cpacs_in, cached_cpacs_out)
+    )
+
+    # Only the modifications of the module are applied, the values of the CPACS written by
+    # the previous modules of the current workflow are kept
+    tree = parse_cpacs(module.cpacs_in)
+    merge_element(cached_in, tree.getroot(), cached_out)
+    tree.write(module.cpacs_out, encoding="UTF-8", xml_declaration=True)
+
+    log.info(f"Results of {module.name} have been reused from {cached_wkflow_dir} (cache).")
+
+    return True
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
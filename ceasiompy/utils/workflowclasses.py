@@ -19,6 +19,7 @@ TODO:
 
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import importlib
@@ -28,15 +29,43 @@ from ceasiompy.utils.ceasiompylogger import add_to_runworkflow_history
 from ceasiompy.utils.ceasiompyutils import change_working_dir, run_module, get_results_directory
 from ceasiompy.utils.configfiles import ConfigFile
 from ceasiompy.utils.moduleinterfaces import get_module_list
+from ceasiompy.utils.workflowcache import (
+    is_module_cacheable,
+    get_module_cache_key,
+    store_module_in_cache,
+    load_module_from_cache,
+)
+from ceasiompy.utils.workflowgraph import (
+    get_module_stages,
+    merge_cpacs_outputs,
+    get_undeclared_xpaths,
+)
 
 from ceasiompy import log
 from ceasiompy.utils.moduleinterfaces import MODNAME_INIT
 
 from ceasiompy.utils.commonpaths import CPACS_FILES_PATH, LOGFILE, MODULES_DIR_PATH
+from cpacspy.cpacspy import CPACS
 
 #
 OPTIM_METHOD = ["Optimisation", "DOE"]
 
+# Modules which read their input CPACS file or run an external solver. In the in-memory
+# mode, their input CPACS is always written before they run and their output is read again.
+FILE_INPUT_MODULES = [
+    "AeroFrame",
+    "AeroFrame_new",
+    "BalanceConventional",
+    "CPACS2GMSH",
+    "CPACS2SUMO",
+    "CPACSCreator",
+    "CPACSUpdater",
+    "PyAVL",
+    "SU2MeshDef",
+    "SU2Run",
+    "SUMOAutoMesh",
+]
+
 # =================================================================================================
 #   CLASSES
 # =================================================================================================
@@ -179,6 +208,17 @@ class Workflow:
         self.optim_method = None
         self.module_optim = []
 
+        # Reuse results of modules from previous workflows with the same inputs
+        self.use_cache = False
+
+        # Run concurrently the modules which do not depend on each other
+        self.parallel_modules = False
+
+        # Pass the CPACS in memory between modules, written every N modules (0: only
+        # when a module needs the file and at the end of the workflow)
+        self.in_memory = False
+        self.checkpoint_every = 0
+
     def from_config_file(self, cfg_file: Path) -> None:
         """Get parameters from a config file
 
@@ -203,6 +243,26 @@ class Workflow:
         except KeyError:
             self.optim_method = "None"
 
+        try:
+            self.use_cache = cfg["USE_CACHE"] == "YES"
+        except KeyError:
+            self.use_cache = False
+
+        try:
+            self.parallel_modules = cfg["PARALLEL_MODULES"] == "YES"
+        except KeyError:
+            self.parallel_modules = False
+
+        try:
+            self.in_memory = cfg["IN_MEMORY"] == "YES"
+        except KeyError:
+            self.in_memory = False
+
+        try:
+            self.checkpoint_every = int(cfg["CHECKPOINT_EVERY"])
+        except KeyError:
+            self.checkpoint_every = 0
+
     def write_config_file(self) -> None:
         """Write the workflow configuration file in the working directory."""
 
@@ -222,6 +282,11 @@ class Workflow:
             cfg["comment_module_optim"] = "MODULE_OPTIM = (  )"
             cfg["comment_optim_method"] = "OPTIM_METHOD = NONE"
 
+        cfg["USE_CACHE"] = "YES" if self.use_cache else "NO"
+        cfg["PARALLEL_MODULES"] = "YES" if self.parallel_modules else "NO"
+        cfg["IN_MEMORY"] = "YES" if self.in_memory else "NO"
+        cfg["CHECKPOINT_EVERY"] = self.checkpoint_every
+
         cfg_file = Path(self.working_dir, "ceasiompy.cfg")
         cfg.write_file(cfg_file, overwrite=True)
 
@@ -327,23 +392,186 @@ class Workflow:
             )
             self.subworkflow.set_subworkflow()
 
+    def run_stage_modules(self, stage_modules, use_cache, test=False) -> None:
+        """Run concurrently modules from their input CPACS, or reuse their results from the
+        cache.
+
+        Args:
+            stage_modules (list): 'ModuleToRun' objects to run.
+            use_cache (bool): Reuse the results of the modules from the cache.
+            test (bool): Run modules in test mode.
+
+        """
+
+        modules_to_run = []
+
+        for module in stage_modules:
+            key = None
+            if use_cache and is_module_cacheable(module.name):
+                key = get_module_cache_key(module)
+                if load_module_from_cache(module, key, self.working_dir):
+                    continue
+
+            modules_to_run.append((module, key))
+
+        if len(modules_to_run) == 1:
+            module, _ = modules_to_run[0]
+            run_module(module, self.current_wkflow_dir, self.modules_list.index(module.name), test)
+
+        elif modules_to_run:
+            log.info(f"Running {', '.join(module.name for module, _ in modules_to_run)}.")
+            with ProcessPoolExecutor(max_workers=len(modules_to_run)) as executor:
+                futures = [
+                    executor.submit(
+                        run_module,
+                        module,
+                        self.current_wkflow_dir,
+                        self.modules_list.index(module.name),
+                        test,
+                    )
+                    for module, _ in modules_to_run
+                ]
+                for future in futures:
+                    future.result()
+
+        for module, key in modules_to_run:
+            if key is not None:
+                store_module_in_cache(module, key, self.working_dir)
+
+    def run_stage(self, stage_modules, cpacs_in: Path, stage_nb: int, use_cache, test=False):
+        """Run concurrently independent modules from the same CPACS and merge their outputs.
+
+        If a module modified the CPACS outside of the outputs declared in its __specs__, the
+        outputs cannot be merged safely. The output of the first module, which was run from
+        the input of the stage, is kept and the next modules are run again one after the other.
+
+        Args:
+            stage_modules (list): 'ModuleToRun' objects of the stage.
+            cpacs_in (Path): Input CPACS of all the modules of the stage.
+            stage_nb (int): Number of the stage in the workflow.
+            use_cache (bool): Reuse the results of the modules from the cache.
+            test (bool): Run modules in test mode.
+
+        Returns:
+            cpacs_out (Path): Output CPACS of the stage.
+
+        """
+
+        for module in stage_modules:
+            module.cpacs_in = cpacs_in
+
+        self.run_stage_modules(stage_modules, use_cache, test)
+
+        if len(stage_modules) == 1:
+            return stage_modules[0].cpacs_out
+
+        undeclared = False
+        for module in stage_modules:
+            xpaths = get_undeclared_xpaths(module.name, cpacs_in, module.cpacs_out)
+            if xpaths:
+                log.warning(
+                    f"{module.name} modified {', '.join(xpaths)} which are not declared in the "
+                    "outputs of its __specs__."
+                )
+                undeclared = True
+
+        if undeclared:
+            log.warning(
+                f"Stage {stage_nb} is run again sequentially from the output of "
+                f"{stage_modules[0].name}."
+            )
+            cpacs_in = stage_modules[0].cpacs_out
+            for module in stage_modules[1:]:
+                module.cpacs_in = cpacs_in
+                self.run_stage_modules([module], use_cache, test)
+                cpacs_in = module.cpacs_out
+            return cpacs_in
+
+        cpacs_out = Path(self.current_wkflow_dir, f"Stage{str(stage_nb).rjust(2, '0')}.xml")
+        merge_cpacs_outputs(cpacs_in, [module.cpacs_out for module in stage_modules], cpacs_out)
+
+        return cpacs_out
+
     def run_workflow(self, test=False) -> None:
         """Run the complete Worflow"""
 
         add_to_runworkflow_history(self.current_wkflow_dir)
 
-        for module in self.modules:
-            if module.is_optim_module:
-                self.subworkflow.run_subworkflow()
-            else:
-                run_module(
-                    module,
-                    self.current_wkflow_dir,
-                    self.modules_list.index(
-                        module.name
-                    ), test)
-
-        shutil.copy(module.cpacs_out, Path(
+        use_cache = self.use_cache and not test
+
+        if self.parallel_modules and not any(m.is_optim_module for m in self.modules):
+            if self.in_memory:
+                log.warning(
+                    "The CPACS is not passed in memory when independent modules are run in "
+                    "parallel, it is written after each module."
+                )
+            cpacs_out = self.modules[0].cpacs_in
+            stages = get_module_stages([module.name for module in self.modules])
+            for stage_nb, stage in enumerate(stages, start=1):
+                cpacs_out = self.run_stage(
+                    [self.modules[m] for m in stage], cpacs_out, stage_nb, use_cache, test
+                )
+
+        else:
+            # CPACS kept in memory between modules and number of modules since it was written
+            cpacs = None
+            nb_unsaved = 0
+
+            for module in self.modules:
+                cacheable = use_cache and is_module_cacheable(module.name)
+
+                # Checkpoint, the module needs its input CPACS file
+                if cpacs is not None and (
+                    module.is_optim_module or cacheable or module.name in FILE_INPUT_MODULES
+                ):
+                    if nb_unsaved:
+                        cpacs.save_cpacs(module.cpacs_in, overwrite=True)
+                    cpacs = None
+                    nb_unsaved = 0
+
+                if module.is_optim_module:
+                    self.subworkflow.run_subworkflow()
+                    continue
+
+                key = None
+                if cacheable:
+                    key = get_module_cache_key(module)
+                    if load_module_from_cache(module, key, self.working_dir):
+                        continue
+
+                if self.in_memory and module.name not in FILE_INPUT_MODULES:
+                    if cpacs is None:
+                        cpacs = CPACS(module.cpacs_in)
+                    nb_unsaved += 1
+                    save = self.checkpoint_every > 0 and nb_unsaved >= self.checkpoint_every
+                    run_module(
+                        module,
+                        self.current_wkflow_dir,
+                        self.modules_list.index(module.name),
+                        test,
+                        cpacs=cpacs,
+                        save=save or key is not None,
+                    )
+                    if save or key is not None:
+                        nb_unsaved = 0
+                else:
+                    run_module(
+                        module,
+                        self.current_wkflow_dir,
+                        self.modules_list.index(
+                            module.name
+                        ), test)
+
+                if key is not None:
+                    store_module_in_cache(module, key, self.working_dir)
+
+            cpacs_out = module.cpacs_out
+
+            # End of the workflow checkpoint
+            if cpacs is not None and nb_unsaved:
+                cpacs.save_cpacs(cpacs_out, overwrite=True)
+
+        shutil.copy(cpacs_out, Path(
             self.current_wkflow_dir, "ToolOutput.xml"))
 
         # Copy logfile in the Workflow directory
@@ -0,0 +1,432 @@
+"""
+CEASIOMpy: Conceptual Aircraft Design Software
+
+Developed by CFS ENGINEERING, 1015 Lausanne, Switzerland
+
+Dependency graph of the modules of a workflow.
+
+The xpaths read and written by each module are taken from the inputs and outputs of its
+__specs__. Two modules conflict if one writes an xpath read or written by the other. A
+module is placed in the stage following the last module it conflicts with, so the modules
+of a stage are independent: they can run concurrently from the same CPACS, and their output
+CPACS are merged in the order of the workflow.
+
+Modules without __specs__ or without declared outputs are considered as reading and writing
+everything and always run alone in their stage. The modifications made by the modules of a
+stage are checked before merging their outputs: if one of them modified the CPACS outside of
+its declared outputs, the stage is run again sequentially (see 'Workflow.run_stage').
+
+
+| Creation: 2026-10-18
+
+"""
+
+# =================================================================================================
+#   IMPORTS
+# =================================================================================================
+
+import re
+import copy
+import xml.etree.ElementTree as ET
+
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Optional,
+)
+
+from ceasiompy import log
+from ceasiompy.utils.moduleinterfaces import get_specs_for_module
+from ceasiompy.utils.commonxpath import (
+    REF_XPATH,
+    WINGS_XPATH,
+    PYLONS_XPATH,
+    ENGINES_XPATH,
+    FUSELAGES_XPATH,
+    AEROPERFORMANCE_XPATH,
+)
+
+# =================================================================================================
+#   CONSTANTS
+# =================================================================================================
+
+# CPACS branches read by all modules without being declared in their __specs__
+IMPLICIT_INPUT_XPATHS = [
+    REF_XPATH,
+    WINGS_XPATH,
+    PYLONS_XPATH,
+    ENGINES_XPATH,
+    FUSELAGES_XPATH,
+    AEROPERFORMANCE_XPATH,
+    "/cpacs/vehicles/profiles",
+    "/cpacs/vehicles/engines",
+    "/cpacs/vehicles/materials",
+]
+
+# Modules with side effects outside of the CPACS (files of the working directory, database,
+# subworkflows) or with interactive steps, which cannot be checked when merging the outputs.
+# They always run alone and their results are not cached.
+SIDE_EFFECTS_MODULES = [
+    "CPACSCreator",
+    "CPACSUpdater",
+    "Database",
+    "Optimisation",
+    "SMTrain",
+    "SMUse",
+]
+
+# CPACS branches updated by any module when the CPACS is saved, not checked
+UNCHECKED_XPATHS = ["/cpacs/header"]
+
+# =================================================================================================
+#   FUNCTIONS
+# =================================================================================================
+
+
+def get_specs_xpaths(module_name: str) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+    """
+    Returns the xpaths of the inputs and outputs declared in the __specs__ of a module,
+    (None, None) if they are unknown.
+    """
+
+    if module_name in SIDE_EFFECTS_MODULES:
+        return None, None
+
+    try:
+        specs = get_specs_for_module(module_name)
+    except AttributeError:
+        # Some __specs__ depend on the GUI session state
+        specs = None
+
+    if specs is None or not specs.cpacs_inout.outputs:
+        return None, None
+
+    inputs = []
+    for entry in specs.cpacs_inout.inputs:
+        if entry.xpath:
+            # 'DynamicChoice' inputs store their choice at xpath + "type"
+            inputs += [entry.xpath, entry.xpath + "type"]
+
+    outputs = [entry.xpath for entry in specs.cpacs_inout.outputs if entry.xpath]
+
+    return inputs, outputs
+
+
+def get_module_xpaths(module_name: str) -> Tuple[Optional[List[str]], Optional[List[str]]]:
+    """
+    Returns the xpaths read and written by a module, (None, None) if they are unknown.
+    """
+
+    inputs, outputs = get_specs_xpaths(module_name)
+
+    if inputs is None:
+        return None, None
+
+    return IMPLICIT_INPUT_XPATHS + inputs, outputs
+
+
+def split_xpath(xpath: str) -> List[str]:
+    """
+    Split a xpath in its elements names, without predicates.
+    """
+    return [re.sub(r"\[.*?\]", "", element) for element in xpath.split("/") if element]
+
+
+def is_xpath_in(xpath: str, parent_xpaths: List[str]) -> bool:
+    """
+    Check if a xpath is equal or is a child of one xpath of a list.
+    """
+
+    elements = split_xpath(xpath)
+
+    for parent_elements in map(split_xpath, parent_xpaths):
+        if elements[: len(parent_elements)] == parent_elements:
+            return True
+
+    return False
+
+
+def xpaths_overlap(xpaths_1: Optional[List[str]], xpaths_2: Optional[List[str]]) -> bool:
+    """
+    Check if one xpath of a list is equal or is a parent of one xpath of the other list.
+    Unknown xpaths (None) overlap with everything.
+    """
+
+    if xpaths_1 is None or xpaths_2 is None:
+        return True
+
+    for xpath_1 in map(split_xpath, xpaths_1):
+        for xpath_2 in map(split_xpath, xpaths_2):
+            length = min(len(xpath_1), len(xpath_2))
+            if xpath_1[:length] == xpath_2[:length]:
+                return True
+
+    return False
+
+
+def get_stages(modules_xpaths: List[Tuple[Optional[List[str]], Optional[List[str]]]]) -> List:
+    """
+    Group modules in stages of independent modules.
+
+    Args:
+        modules_xpaths (List): (inputs, outputs) xpaths of each module of the workflow.
+
+    Returns:
+        stages (List[List[int]]): Indexes of the modules of each stage.
+
+    """
+
+    stage_idx = []
+
+    for j, (inputs_j, outputs_j) in enumerate(modules_xpaths):
+        stage = 0
+        for i, (inputs_i, outputs_i) in enumerate(modules_xpaths[:j]):
+            if (
+                inputs_i is None
+                or inputs_j is None
+                or xpaths_overlap(outputs_i, inputs_j + outputs_j)
+                or xpaths_overlap(inputs_i, outputs_j)
+            ):
+                stage = max(stage, stage_idx[i] + 1)
+        stage_idx.append(stage)
+
+    stages = [[] for _ in range(max(stage_idx, default=-1) + 1)]
+    for m, stage in enumerate(stage_idx):
+        stages[stage].append(m)
+
+    return stages
+
+
+def get_module_stages(modules_list: List[str]) -> List[List[int]]:
+    """
+    Group the modules of a workflow in stages of independent modules.
+    """
+
+    stages = get_stages([get_module_xpaths(module_name) for module_name in modules_list])
+
+    for stage_nb, stage in enumerate(stages):
+        log.info(f"Stage {stage_nb + 1}: {', '.join(modules_list[m] for m in stage)}")
+
+    return stages
+
+
+def get_children_dict(element: ET.Element) -> Dict[Tuple, ET.Element]:
+    """
+    Returns the children of an element identified by their tag, uID and position among the
+    children with the same tag and uID.
+    """
+
+    children = {}
+    counts = {}
+
+    for child in element:
+        if not isinstance(child.tag, str):
+            # Comments
+            continue
+        name = (child.tag, child.get("uID"))
+        children[name + (counts.get(name, 0),)] = child
+        counts[name] = counts.get(name, 0) + 1
+
+    return children
+
+
+def is_text_modified(text_1: Optional[str], text_2: Optional[str]) -> bool:
+    return (text_1 or "").strip() != (text_2 or "").strip()
+
+
+def elements_equal(element_1: ET.Element, element_2: ET.Element) -> bool:
+    """
+    Check if two elements have the same tag, attributes, text and children.
+    """
+
+    if (
+        element_1.tag != element_2.tag
+        or element_1.attrib != element_2.attrib
+        or is_text_modified(element_1.text, element_2.text)
+        or len(element_1) != len(element_2)
+    ):
+        return False
+
+    return all(elements_equal(child_1, child_2) for child_1, child_2 in zip(element_1, element_2))
+
+
+def get_child_xpath(xpath: str, key: Tuple) -> str:
+    tag, uid, idx = key
+    predicate = f"[@uID='{uid}']" if uid is not None else ""
+    return f"{xpath}/{tag}{predicate}[{idx + 1}]"
+
+
+def get_leaf_xpaths(element: ET.Element, xpath: str) -> List[str]:
+    """
+    Returns the xpaths of the elements without children of an element and of its children.
+    """
+
+    children = get_children_dict(element)
+    if not children:
+        return [xpath]
+
+    return [
+        leaf_xpath
+        for key, child in children.items()
+        for leaf_xpath in get_leaf_xpaths(child, get_child_xpath(xpath, key))
+    ]
+
+
+def get_modified_xpaths(
+    base: ET.Element, output: ET.Element, xpath: Optional[str] = None
+) -> List[Tuple[str, bool]]:
+    """
+    Returns the xpaths of the elements modified between 'base' and 'output' and if they
+    were added. For an added or removed element, the xpaths of all its elements without
+    children are returned.
+    """
+
+    if xpath is None:
+        xpath = "/" + base.tag
+
+    modified = []
+
+    if is_text_modified(output.text, base.text) or output.attrib != base.attrib:
+        modified.append((xpath, False))
+
+    base_children = get_children_dict(base)
+    output_children = get_children_dict(output)
+
+    for key, output_child in output_children.items():
+        child_xpath = get_child_xpath(xpath, key)
+        if key in base_children:
+            modified += get_modified_xpaths(base_children[key], output_child, child_xpath)
+        else:
+            modified += [(leaf, True) for leaf in get_leaf_xpaths(output_child, child_xpath)]
+
+    for key, base_child in base_children.items():
+        if key not in output_children:
+            child_xpath = get_child_xpath(xpath, key)
+            modified += [(leaf, False) for leaf in get_leaf_xpaths(base_child, child_xpath)]
+
+    return modified
+
+
+def get_undeclared_xpaths(module_name: str, cpacs_in: Path, cpacs_out: Path) -> List[str]:
+    """
+    Returns the xpaths of the elements modified by a module outside of the outputs declared
+    in its __specs__. Elements added at the xpaths of its declared inputs (default values)
+    are not considered as undeclared modifications.
+
+    Args:
+        module_name (str): Name of the module.
+        cpacs_in (Path): Input CPACS of the module.
+        cpacs_out (Path): Output CPACS of the module.
+
+    """
+
+    inputs, outputs = get_specs_xpaths(module_name)
+    if outputs is None:
+        # The module is considered as writing everything
+        return []
+
+    modified = get_modified_xpaths(
+        parse_cpacs(cpacs_in).getroot(), parse_cpacs(cpacs_out).getroot()
+    )
+
+    return [
+        xpath
+        for xpath, added in modified
+        if not is_xpath_in(xpath, outputs + UNCHECKED_XPATHS)
+        and not (added and is_xpath_in(xpath, inputs))
+    ]
+
+
+def log_conflict(xpath: str) -> None:
+    log.warning(
+        f"{xpath} is modified by several modules of the same stage, "
+        "the modification of the last module of the workflow is kept."
+    )
+
+
+def merge_element(
+    base: ET.Element, merged: ET.Element, output: ET.Element, xpath: Optional[str] = None
+) -> None:
+    """
+    Apply to 'merged' the modifications between 'base' and 'output'. A warning is logged
+    for elements already modified differently in 'merged' by a previous module.
+    """
+
+    if xpath is None:
+        xpath = "/" + base.tag
+
+    if is_text_modified(output.text, base.text):
+        if is_text_modified(merged.text, base.text) and is_text_modified(
+            merged.text, output.text
+        ):
+            log_conflict(xpath)
+        merged.text = output.text
+
+    if output.attrib != base.attrib:
+        if merged.attrib != base.attrib and merged.attrib != output.attrib:
+            log_conflict(xpath)
+        merged.attrib.clear()
+        merged.attrib.update(output.attrib)
+
+    base_children = get_children_dict(base)
+    merged_children = get_children_dict(merged)
+    output_children = get_children_dict(output)
+
+    for key, output_child in output_children.items():
+        if key in base_children:
+            if key in merged_children:
+                merge_element(
+                    base_children[key],
+                    merged_children[key],
+                    output_child,
+                    get_child_xpath(xpath, key),
+                )
+        elif key in merged_children:
+            # Element added by two modules, the last one is kept
+            if not elements_equal(merged_children[key], output_child):
+                log_conflict(get_child_xpath(xpath, key))
+            idx = list(merged).index(merged_children[key])
+            merged.remove(merged_children[key])
+            merged.insert(idx, copy.deepcopy(output_child))
+        else:
+            merged.append(copy.deepcopy(output_child))
+
+    for key in base_children:
+        if key not in output_children and key in merged_children:
+            merged.remove(merged_children[key])
+
+
+def parse_cpacs(cpacs_path: Path) -> ET.ElementTree:
+    parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+    return ET.parse(cpacs_path, parser=parser)
+
+
+def merge_cpacs_outputs(cpacs_in: Path, cpacs_out_list: List[Path], merged_path: Path) -> None:
+    """
+    Merge the output CPACS of modules which were run from the same input CPACS. The
+    modifications of each module are applied in the order of the list.
+
+    Args:
+        cpacs_in (Path): Input CPACS of the modules.
+        cpacs_out_list (List[Path]): Output CPACS of the modules.
+        merged_path (Path): Path of the merged CPACS.
+
+    """
+
+    base = parse_cpacs(cpacs_in).getroot()
+    merged_tree = parse_cpacs(cpacs_in)
+
+    for cpacs_out in cpacs_out_list:
+        merge_element(base, merged_tree.getroot(), parse_cpacs(cpacs_out).getroot())
+
+    merged_tree.write(merged_path, encoding="UTF-8", xml_declaration=True)
+
+
+# =================================================================================================
+#    MAIN
+# =================================================================================================
+
+if __name__ == "__main__":
+    log.info("Nothing to execute!")
@@ -18,6 +18,7 @@ Streamlit page to run a CEASIOMpy workflow
 # ==============================================================================
 
 import os
+import re
 import psutil
 import signal
 import streamlit as st
@@ -29,6 +30,7 @@ from streamlitutils import (
 )
 
 from pathlib import Path
+from collections import deque
 
 from ceasiompy.utils.commonpaths import LOGFILE
 
@@ -46,6 +48,18 @@ HOW_TO_TEXT = (
     "2. When it is done, go to the *Results* page\n"
 )
 
+# Number of recent log lines kept in memory and shown in the log viewer
+LOG_BUFFER_LINES = 2000
+
+# Maximum size read from the logfile at each refresh, more than LOG_BUFFER_LINES lines [bytes]
+LOG_READ_BYTES = 1024**2
+
+# Module sections of the logfile (see 'run_module' in ceasiompyutils.py)
+MODULE_START_PATTERN = re.compile(r"-{5,} Start of (\S+) -{5,}")
+MODULE_END_PATTERN = re.compile(r"-{5,} End of (\S+) -{5,}")
+
+ALL_MODULES = "All modules"
+
 # ==============================================================================
 #   FUNCTIONS
 # ==============================================================================
@@ -70,6 +84,36 @@ def workflow_buttons() -> None:
     Run workflow button.
     """
 
+    st.session_state.workflow.use_cache = st.checkbox(
+        "Reuse results of previous workflows",
+        value=st.session_state.workflow.use_cache,
+        help="Modules with the same inputs as in a previous workflow are not run again, "
+        "their results are copied from the previous workflow.",
+    )
+
+    st.session_state.workflow.parallel_modules = st.checkbox(
+        "Run independent modules in parallel",
+        value=st.session_state.workflow.parallel_modules,
+        help="Modules which do not read or write the same CPACS data are run at the same "
+        "time and their results are merged in the next module input.",
+    )
+
+    st.session_state.workflow.in_memory = st.checkbox(
+        "Pass the CPACS in memory between modules",
+        value=st.session_state.workflow.in_memory,
+        disabled=st.session_state.workflow.parallel_modules,
+        help="The CPACS is only written before modules which read the file or run an "
+        "external solver, at the end of the workflow and at the checkpoints below. "
+        "Not available when independent modules are run in parallel.",
+    )
+
+    if st.session_state.workflow.in_memory:
+        st.session_state.workflow.checkpoint_every = st.number_input(
+            "Write the CPACS every N modules (0: never)",
+            min_value=0,
+            value=st.session_state.workflow.checkpoint_every,
+        )
+
     # Create two buttons side by side
     col1, col2 = st.columns([1, 1])
 
@@ -93,20 +137,119 @@ def workflow_buttons() -> None:
             terminate_previous_workflows()
 
 
+def read_new_log_lines(logfile: Path, offset: int, max_bytes: int = LOG_READ_BYTES):
+    """Read the complete lines written in the logfile after a byte offset.
+
+    Only the last 'max_bytes' bytes are read, the older lines would not be kept in the log
+    buffer anyway. This is the case on the first load of a session with a large logfile.
+
+    Args:
+        logfile (Path): Path to the logfile.
+        offset (int): Byte offset of the end of the last line read.
+        max_bytes (int): Maximum number of bytes read.
+
+    Returns:
+        lines (list): New complete lines, a line which is still being written is not read
+            unless it is longer than 'max_bytes'.
+        offset (int): Byte offset of the end of the last line read, 0 if the logfile has
+            been truncated (new logfile).
+
+    """
+
+    if not logfile.exists():
+        return [], 0
+
+    size = logfile.stat().st_size
+    if size < offset:
+        offset = 0
+
+    start = max(offset, size - max_bytes)
+
+    with open(logfile, "rb") as f:
+        if start > offset:
+            # Skip the end of the line cut by the start of the read
+            f.seek(start - 1)
+            data = f.read(size - start + 1)
+            skip = data.find(b"\n") + 1
+            if skip == 0:
+                return [], offset
+            data = data[skip:]
+            start += skip - 1
+        else:
+            f.seek(start)
+            data = f.read(size - start)
+
+    end = data.rfind(b"\n") + 1
+
+    # Line longer than max_bytes, read as it is to not read it again at each refresh
+    if end == 0 and len(data) >= max_bytes:
+        end = len(data)
+
+    lines = data[:end].decode("utf-8", errors="replace").splitlines()
+
+    return lines, start + end
+
+
+def update_log_buffer() -> None:
+    """
+    Add the new lines of the logfile to the log buffer of the session, with the
+    CEASIOMpy module which was running when they were written.
+    """
+
+    if "log_offset" not in st.session_state:
+        st.session_state.log_offset = 0
+
+    lines, offset = read_new_log_lines(LOGFILE, st.session_state.log_offset)
+
+    if offset < st.session_state.log_offset or "log_buffer" not in st.session_state:
+        st.session_state.log_buffer = deque(maxlen=LOG_BUFFER_LINES)
+        st.session_state.log_modules = []
+        st.session_state.log_current_module = None
+
+    st.session_state.log_offset = offset
+
+    for line in lines:
+        start = MODULE_START_PATTERN.search(line)
+        if start:
+            st.session_state.log_current_module = start.group(1)
+            if start.group(1) not in st.session_state.log_modules:
+                st.session_state.log_modules.append(start.group(1))
+
+        st.session_state.log_buffer.append((st.session_state.log_current_module, line))
+
+        if MODULE_END_PATTERN.search(line):
+            st.session_state.log_current_module = None
+
+
 def show_logs() -> None:
     """
-    Log interface.
+    Log interface, only the lines added to the logfile since the last refresh are read.
     """
 
     st.markdown("")
     st.markdown("##### Logfile")
 
-    with open(LOGFILE, "r") as f:
-        lines = f.readlines()
+    update_log_buffer()
 
-    lines_str = "\n".join(reversed(lines))
+    module = st.selectbox(
+        "Show the logs of",
+        [ALL_MODULES] + st.session_state.log_modules,
+        key="log_module",
+    )
 
-    st.text_area("(more recent on top)", lines_str, height=400, disabled=True)
+    lines = [
+        line
+        for line_module, line in reversed(st.session_state.log_buffer)
+        if module == ALL_MODULES or line_module == module
+    ]
+    lines_str = "\n".join(lines)
+
+    st.text_area(
+        f"(more recent on top, last {LOG_BUFFER_LINES} lines)",
+        lines_str,
+        height=400,
+        disabled=True,
+    )
 
 
 # =================================================================================================